@@ -0,0 +1,119 @@
+"""Category classifiers for SUIS area codes and category anchor names.
+
+Degree and minor pages name each course category with an area code such as
+``BSCS_CEL`` or ``UC_FENS``: in ``<a name>`` anchors and in the ``P_AREA``
+parameter of ``p_list_courses`` links.  Each scraper maps these codes to
+``core``/``required``/``area``/``free``/``university`` with slightly different
+precedence, so every call site keeps its own rule table below.  To support a
+new SUIS suffix, add it to the relevant tables.
+
+An :class:`AreaClassifier` compiles its ordered rules into one regular
+expression.  The first rule that matches wins, and results are memoized
+per code.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Sequence, Tuple
+
+# (category, how the code is matched, tokens).  ``how`` is one of "suffix",
+# "contains", "exact" or "prefix".
+Rule = Tuple[str, str, Sequence[str]]
+
+# Catalog anchors classified by crawl_program that take their category from
+# the section title instead.
+BY_TITLE = "by_title"
+
+_KIND_PATTERNS = {
+    "suffix": r".*(?:{})\Z",
+    "contains": r".*(?:{})",
+    "exact": r"(?:{})\Z",
+    "prefix": r"(?:{})",
+}
+
+
+class AreaClassifier:
+    """Map a code to the category of the first matching rule (else ``default``)."""
+
+    def __init__(self, rules: Sequence[Rule], default: Optional[str] = None):
+        self.rules = tuple((category, how, tuple(tokens)) for category, how, tokens in rules)
+        self.default = default
+        alternatives = []
+        for index, (_category, how, tokens) in enumerate(self.rules):
+            body = _KIND_PATTERNS[how].format("|".join(re.escape(token) for token in tokens))
+            alternatives.append(f"(?P<r{index}>(?={body}))")
+        # Alternatives are tried in order at position 0, so rule order is
+        # precedence even when several rules match.
+        self._pattern = re.compile("|".join(alternatives), re.DOTALL)
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def __call__(self, code: str) -> Optional[str]:
+        try:
+            return self._memo[code]
+        except KeyError:
+            pass
+        match = self._pattern.match(code)
+        category = self.rules[int(match.lastgroup[1:])][0] if match else self.default
+        self._memo[code] = category
+        return category
+
+
+_CORE_CODES = ("_CEL", "_COR", "_CE1", "_C1", "_CE2", "_C2")
+
+# crawl_program: category anchors on degree pages.  Names that only pass the
+# category filter (``main...`` or a mid-name suffix) are classified by title.
+CATALOG_ANCHOR = AreaClassifier(
+    (
+        ("core", "suffix", ("_CEL", "_CE2", "_C2")),
+        ("core", "contains", ("_COR", "_CE1", "_C1")),
+        ("required", "suffix", ("_REQ", "_MEL", "_PHL")),
+        ("area", "suffix", ("_AEL", "_ARE")),
+        ("free", "suffix", ("_FEL", "_FRE")),
+        ("university", "exact", ("UC_FENS", "UC_FASS")),
+        (BY_TITLE, "prefix", ("main",)),
+        (BY_TITLE, "contains", ("_C2", "_CE2", "_PHL", "_MEL")),
+    )
+)
+
+# crawl_program: P_AREA of the list links found next to a category anchor.
+CATALOG_ANCHOR_LINK = AreaClassifier(
+    (
+        ("core", "contains", _CORE_CODES),
+        ("required", "contains", ("_REQ", "_MEL", "_PHL")),
+        ("area", "contains", ("_AEL", "_ARE")),
+        ("free", "contains", ("_FEL", "_FRE")),
+        ("university", "contains", ("UC_",)),
+    ),
+    default="unknown",
+)
+
+# crawl_program: P_AREA of every list link on the page (the fallback scan),
+# where ``UC_`` takes precedence over ``_PHL``/``_MEL``.
+CATALOG_PAGE_LINK = AreaClassifier(
+    (
+        ("core", "contains", _CORE_CODES),
+        ("required", "contains", ("_REQ",)),
+        ("area", "contains", ("_AEL", "_ARE")),
+        ("free", "contains", ("_FEL", "_FRE")),
+        ("university", "contains", ("UC_",)),
+        ("required", "contains", ("_PHL", "_MEL")),
+    ),
+    default="unknown",
+)
+
+# fetch_minors: anchor names and list-link area codes on minor pages.
+MINOR_AREA = AreaClassifier(
+    (
+        ("required", "suffix", ("_REQ",)),
+        ("required", "contains", ("_PHL", "_MEL")),
+        # Some minors use a generic "_ELEC" section name for electives.  In
+        # the summary table this typically corresponds to "Core" (or
+        # equivalent) elective requirements.
+        ("core", "suffix", ("_ELEC", "_CEL")),
+        ("core", "contains", ("_COR", "_CE1", "_C1", "_CE2", "_C2")),
+        ("area", "suffix", ("_ARE", "_AEL")),
+        ("free", "suffix", ("_FRE", "_FEL")),
+        ("university", "exact", ("UC_FENS", "UC_FASS")),
+    )
+)
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the SUIS page parsers over the committed HTML fixtures.
+
+Each case runs one parser over saved pages from ``Degree Detail Pages (for
+inspect)/``, ``minor_htmls/`` and ``updated_htmls/``, so no network access is
+needed. The report gives ops/sec (one op is one parser call on one page) and
+the peak traced allocation of a single pass.
+
+Results are compared with ``benchmarks/parser_baseline.json``. Absolute speed
+depends on the machine, so every run also times a fixed pure-Python
+calibration loop, and expected throughput is scaled by the ratio of the two
+calibration rates. A case regresses when its scaled ops/sec falls, or its
+peak memory grows, by more than ``--tolerance``. Timings on a shared machine
+are noisy, so a case that comes out too slow is timed again (``--retries``)
+and only counts as slower if every attempt is. ``--report-only`` prints
+regressions without failing, which is how CI runs it.
+
+    python benchmark_parsers.py                    # report and compare
+    python benchmark_parsers.py --case coursepage  # one case only
+    python benchmark_parsers.py --update-baseline  # after an intended change
+    python benchmark_parsers.py --report-only      # never exit non-zero
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from bs4 import BeautifulSoup
+
+import build_course_section_history as section_history
+import fetch_courses
+import fetch_minors
+import fetch_requirements
+import fetch_schedule
+import scrape_coursepages
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "parser_baseline.json")
+DEGREE_PAGES_DIR = os.path.join(ROOT, "Degree Detail Pages (for inspect)")
+MINOR_PAGES_DIR = os.path.join(ROOT, "minor_htmls")
+UPDATED_PAGES_DIR = os.path.join(ROOT, "updated_htmls")
+SCHEDULER_PAGES_DIR = os.path.join(UPDATED_PAGES_DIR, "scheduler")
+COURSEPAGE_URL = scrape_coursepages.build_coursepage_url("CS", "201")
+BENCH_TERM = "202401"
+
+
+class Case(NamedTuple):
+    name: str
+    description: str
+    pages: List[str]
+    run: Callable[[str, str], Any]
+
+
+def _read(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return fh.read()
+
+
+def _degree_pages() -> List[str]:
+    return sorted(glob.glob(os.path.join(DEGREE_PAGES_DIR, "SU_DEGREE.p_degree_detail_*.html")))
+
+
+def _minor_pages() -> List[str]:
+    return sorted(glob.glob(os.path.join(MINOR_PAGES_DIR, "SU_DEGREE.p_degree_detail_*.html")))
+
+
+def _program_of(path: str) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem.rsplit("_", 1)[-1]
+
+
+def _crawl_program(html: str, path: str) -> Any:
+    # Linked course lists are benchmarked separately by "list_page"; here
+    # only the degree page itself is parsed.
+    original = fetch_courses._crawl_lists
+    fetch_courses._crawl_lists = lambda jobs, _term: [[] for _ in jobs]
+    try:
+        return fetch_courses.crawl_program(_program_of(path), BENCH_TERM, soup=BeautifulSoup(html, "lxml"))
+    finally:
+        fetch_courses._crawl_lists = original
+
+
+def _list_page(html: str, _path: str) -> Any:
+    return fetch_courses.parse_list_html(html, "core")
+
+
+def _coursepage(html: str, _path: str) -> Any:
+    return scrape_coursepages.parse_coursepage_html(html, source_url=COURSEPAGE_URL)
+
+
+def _schedule_listing(html: str, _path: str) -> Any:
+    return fetch_schedule._parse_sections_from_listing(html)
+
+
+def _minor_requirements(html: str, _path: str) -> Any:
+    return fetch_minors.parse_minor_requirements(html)
+
+
+def _minor_courses(html: str, path: str) -> Any:
+    return fetch_minors.parse_minor_courses(html, program=_program_of(path), offline_dir=MINOR_PAGES_DIR)
+
+
+def _requirements(html: str, path: str) -> Any:
+    return fetch_requirements.parse_requirements(BeautifulSoup(html, "lxml"), _program_of(path))
+
+
+def _seat_counts(html: str, _path: str) -> Any:
+    return section_history.parse_seat_counts(html)
+
+
+def build_cases() -> List[Case]:
+    return [
+        Case("crawl_program", "fetch_courses.crawl_program on degree pages", _degree_pages(), _crawl_program),
+        Case(
+            "list_page",
+            "fetch_courses.parse_list_html on p_list_courses pages",
+            sorted(glob.glob(os.path.join(UPDATED_PAGES_DIR, "SU_DEGREE_*.html"))
+                   + glob.glob(os.path.join(MINOR_PAGES_DIR, "*coursepage.html"))),
+            _list_page,
+        ),
+        Case("coursepage", "scrape_coursepages.parse_coursepage_html", [os.path.join(UPDATED_PAGES_DIR, "sabanci_www_coursepage.html")], _coursepage),
+        Case(
+            "schedule_listing",
+            "fetch_schedule._parse_sections_from_listing",
+            [os.path.join(SCHEDULER_PAGES_DIR, "Class Schedule Listing.html")],
+            _schedule_listing,
+        ),
+        Case("minor_requirements", "fetch_minors.parse_minor_requirements", _minor_pages(), _minor_requirements),
+        Case("minor_courses", "fetch_minors.parse_minor_courses (offline linked pages)", _minor_pages(), _minor_courses),
+        Case("requirements", "fetch_requirements.parse_requirements on degree pages", _degree_pages(), _requirements),
+        Case(
+            "seat_counts",
+            "build_course_section_history.parse_seat_counts",
+            [os.path.join(SCHEDULER_PAGES_DIR, "Detailed Class Information.html")],
+            _seat_counts,
+        ),
+    ]
+
+
+def calibrate(min_time: float) -> float:
+    """Return iterations/sec of a fixed pure-Python loop (a machine-speed yardstick)."""
+
+    def loop() -> int:
+        words = [f"CS{n:03d}" for n in range(2000)]
+        index = {word: i for i, word in enumerate(sorted(words, reverse=True))}
+        return sum(index[word] for word in words if word.endswith("1"))
+
+    rates = []
+    for _ in range(3):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            loop()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time / 3:
+                break
+        rates.append(count / elapsed)
+    return max(rates)
+
+
+def run_case(case: Case, *, min_time: float = 1.0, rounds: int = 5) -> Dict[str, Any]:
+    """Time ``case`` over its pages; return ops/sec (median round) and peak KiB."""
+
+    pages = [(_read(path), path) for path in case.pages]
+    if not pages:
+        raise FileNotFoundError(f"no fixture pages for benchmark case {case.name!r}")
+
+    # One traced pass: checks every page parses to something, and measures
+    # peak memory without tracemalloc slowing down the timed rounds.
+    tracemalloc.start()
+    try:
+        for html, path in pages:
+            if not case.run(html, path):
+                raise ValueError(f"{case.name}: {os.path.relpath(path, ROOT)} parsed to nothing")
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    rates = []
+    for _ in range(max(1, rounds)):
+        ops = 0
+        start = time.perf_counter()
+        while True:
+            for html, path in pages:
+                case.run(html, path)
+            ops += len(pages)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time / max(1, rounds):
+                break
+        rates.append(ops / elapsed)
+    return {
+        "pages": len(pages),
+        "ops_per_sec": round(statistics.median(rates), 2),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def _throughput_floor(results: Dict[str, Any], baseline: Dict[str, Any], name: str, tolerance: float) -> Optional[float]:
+    expected = baseline["cases"].get(name)
+    if expected is None:
+        return None
+    scale = results["calibration_per_sec"] / baseline["calibration_per_sec"]
+    return expected["ops_per_sec"] * scale * (1 - tolerance)
+
+
+def slow_cases(results: Dict[str, Any], baseline: Dict[str, Any], *, tolerance: float) -> List[str]:
+    """Return the cases whose scaled throughput is below the baseline floor."""
+
+    return [
+        name
+        for name, current in results["cases"].items()
+        if (floor := _throughput_floor(results, baseline, name, tolerance)) is not None and current["ops_per_sec"] < floor
+    ]
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], *, tolerance: float) -> List[str]:
+    """Return one message per case that regressed against ``baseline``."""
+
+    scale = results["calibration_per_sec"] / baseline["calibration_per_sec"]
+    regressions = []
+    for name, current in results["cases"].items():
+        expected = baseline["cases"].get(name)
+        if expected is None:
+            continue
+        floor = _throughput_floor(results, baseline, name, tolerance)
+        if current["ops_per_sec"] < floor:
+            regressions.append(
+                f"{name}: {current['ops_per_sec']:.1f} ops/sec, expected at least {floor:.1f} "
+                f"(baseline {expected['ops_per_sec']:.1f} x machine {scale:.2f})"
+            )
+        ceiling = expected["peak_kib"] * (1 + tolerance)
+        if current["peak_kib"] > ceiling:
+            regressions.append(f"{name}: peak {current['peak_kib']:.0f} KiB, expected at most {ceiling:.0f} KiB")
+    return regressions
+
+
+def run_benchmarks(cases: Sequence[Case], *, min_time: float, rounds: int, out=sys.stdout) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "calibration_per_sec": round(calibrate(min_time), 2),
+        "cases": {},
+    }
+    print(f"{'case':<20} {'pages':>5} {'ops/sec':>10} {'peak KiB':>10}", file=out)
+    for case in cases:
+        stats = run_case(case, min_time=min_time, rounds=rounds)
+        results["cases"][case.name] = stats
+        print(f"{case.name:<20} {stats['pages']:>5} {stats['ops_per_sec']:>10.1f} {stats['peak_kib']:>10.1f}", file=out)
+    return results
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def write_baseline(path: str, results: Dict[str, Any], previous: Optional[Dict[str, Any]] = None) -> None:
+    data = dict(results)
+    if previous:
+        # A partial run (--case) refreshes only the cases it measured.
+        data["cases"] = {**previous.get("cases", {}), **results["cases"]}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    cases = build_cases()
+    parser = argparse.ArgumentParser(description="Benchmark the SUIS page parsers over the committed HTML fixtures.")
+    parser.add_argument("--case", action="append", choices=[case.name for case in cases], help="Run only this case (repeatable).")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to spend timing each case (default: %(default)s).")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case; the median is reported (default: %(default)s).")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON (default: benchmarks/parser_baseline.json).")
+    parser.add_argument("--tolerance", type=float, default=0.35, help="Allowed slowdown / memory growth as a fraction (default: %(default)s).")
+    parser.add_argument("--retries", type=int, default=2, help="Re-time a case that comes out too slow up to this many times (default: %(default)s).")
+    parser.add_argument("--report-only", action="store_true", help="Print regressions but exit 0.")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run's results to the baseline instead of comparing.")
+    parser.add_argument("--json", dest="json_out", help="Also write this run's results to this path.")
+    args = parser.parse_args(argv)
+
+    selected = [case for case in cases if not args.case or case.name in args.case]
+    results = run_benchmarks(selected, min_time=args.min_time, rounds=args.rounds)
+    baseline = load_baseline(args.baseline)
+    if baseline is not None and not args.update_baseline:
+        for _ in range(max(0, args.retries)):
+            slow = set(slow_cases(results, baseline, tolerance=args.tolerance))
+            if not slow:
+                break
+            print(f"Re-timing {', '.join(sorted(slow))}")
+            for case in selected:
+                if case.name in slow:
+                    stats = run_case(case, min_time=args.min_time, rounds=args.rounds)
+                    current = results["cases"][case.name]
+                    current["ops_per_sec"] = max(current["ops_per_sec"], stats["ops_per_sec"])
+    if args.json_out:
+        write_baseline(args.json_out, results)
+
+    if args.update_baseline:
+        write_baseline(args.baseline, results, baseline)
+        print(f"Wrote {os.path.relpath(args.baseline)}")
+        return 0
+    if baseline is None:
+        print(f"No baseline at {os.path.relpath(args.baseline)}; run with --update-baseline to create one.")
+        return 0
+    if baseline.get("python") != results["python"]:
+        print(f"Note: the baseline was recorded on Python {baseline.get('python')}, this is Python {results['python']}.")
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions against {os.path.relpath(args.baseline)} (tolerance {args.tolerance:.0%}).")
+    return 1 if regressions and not args.report_only else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,11 @@
 import argparse
-import json
 import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import jsonl_codec
+
 
 SECONDARY_COMPONENTS = {"recitation", "lab", "laboratory"}
 PLACEHOLDER_INSTRUCTORS = {
@@ -86,16 +87,11 @@ def normalize_instructors(value: Any) -> List[str]:
 
 def iter_schedule_rows(schedule_dir: Path) -> Iterable[Tuple[Path, Dict[str, Any]]]:
     for path in sorted(schedule_dir.glob("*.jsonl")):
-        with path.open("r", encoding="utf-8") as handle:
-            for line_no, line in enumerate(handle, start=1):
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    row = json.loads(raw)
-                except Exception as exc:
-                    raise RuntimeError(f"Invalid JSON in {path}:{line_no}: {exc}") from exc
+        try:
+            for row in jsonl_codec.iter_jsonl(path):
                 yield path, row
+        except jsonl_codec.JsonlDecodeError as exc:
+            raise RuntimeError(str(exc)) from exc
 
 
 def collect_grouped_rows(schedule_dir: Path) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
@@ -172,11 +168,8 @@ def build_history_rows(schedule_dir: Path) -> List[Dict[str, Any]]:
     return output_rows
 
 
-def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="\n") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> bool:
+    return jsonl_codec.write_jsonl_if_changed(path, rows)
 
 
 def main() -> None:
@@ -184,8 +177,10 @@ def main() -> None:
     schedule_dir = Path(args.schedule_dir)
     out_path = Path(args.out)
     rows = build_history_rows(schedule_dir)
-    write_jsonl(out_path, rows)
-    print(f"Wrote {len(rows)} course histories to {out_path}")
+    if write_jsonl(out_path, rows):
+        print(f"Wrote {len(rows)} course histories to {out_path}")
+    else:
+        print(f"{out_path} already holds these {len(rows)} course histories; left unchanged")
 
 
 if __name__ == "__main__":
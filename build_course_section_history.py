@@ -1,19 +1,23 @@
 import argparse
-import json
 import re
-import threading
 import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+
+import jsonl_codec
+from html_text import element_text, first_descendant, has_class
+from suis_archive import ResponseArchive, add_archive_arguments, archive_from_args
+from suis_http import RetryPolicy, SuisClient
 
 
 BASE = "https://suis.sabanciuniv.edu/prod"
 DETAIL_URL = f"{BASE}/bwckschd.p_disp_detail_sched"
+USER_AGENT = "Mozilla/5.0 (compatible; SUrriculum/3.1; +https://github.com/)"
 SECONDARY_COMPONENTS = {"recitation", "lab", "laboratory"}
 PLACEHOLDER_INSTRUCTORS = {
     "",
@@ -27,6 +31,9 @@ ROLE_TOKEN_RE = re.compile(r"\(\s*[A-Za-z]{1,3}\s*\)")
 WHITESPACE_RE = re.compile(r"\s+")
 TERM_CODE_RE = re.compile(r"^\d{6}$")
 INSTRUCTOR_SPLIT_RE = re.compile(r"\s*,\s*")
+SEAT_CAPTION_RE = re.compile(r"registration\s+availability", re.IGNORECASE)
+TABLE_OPEN_RE = re.compile(r"<table\b", re.IGNORECASE)
+TABLE_CLOSE_RE = re.compile(r"</table\s*>", re.IGNORECASE)
 
 
 def parse_args() -> argparse.Namespace:
@@ -46,10 +53,17 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--workers", type=int, default=8)
     parser.add_argument("--max-inflight", type=int, default=4)
+    parser.add_argument("--adaptive", action="store_true", help="Treat --max-inflight as a ceiling and adapt the in-flight limit to SUIS latency and errors (AIMD).")
     parser.add_argument("--timeout", type=float, default=30.0)
     parser.add_argument("--retries", type=int, default=3)
     parser.add_argument("--backoff", type=float, default=1.0)
     parser.add_argument("--max-crns", type=int, default=0, help="Limit fetched CRNs for testing.")
+    parser.add_argument(
+        "--check-seat-parser",
+        action="store_true",
+        help="Compare and time the fast and BeautifulSoup seat-count parsers on the detail pages in --archive-dir, then exit.",
+    )
+    add_archive_arguments(parser)
     return parser.parse_args()
 
 
@@ -114,16 +128,11 @@ def detail_url(term: str, crn: str) -> str:
 
 def iter_schedule_rows(schedule_dir: Path) -> Iterable[Tuple[Path, Dict[str, Any]]]:
     for path in sorted(schedule_dir.glob("*.jsonl")):
-        with path.open("r", encoding="utf-8") as handle:
-            for line_no, line in enumerate(handle, start=1):
-                raw = line.strip()
-                if not raw:
-                    continue
-                try:
-                    row = json.loads(raw)
-                except Exception as exc:
-                    raise RuntimeError(f"Invalid JSON in {path}:{line_no}: {exc}") from exc
+        try:
+            for row in jsonl_codec.iter_jsonl(path):
                 yield path, row
+        except jsonl_codec.JsonlDecodeError as exc:
+            raise RuntimeError(str(exc)) from exc
 
 
 def collect_schedule_rows(schedule_dir: Path, terms: Set[str]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
@@ -217,15 +226,8 @@ def load_existing(path: Path) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
     rows: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
     if not path.exists():
         return rows
-    with path.open("r", encoding="utf-8") as handle:
-        for line_no, line in enumerate(handle, start=1):
-            raw = line.strip()
-            if not raw:
-                continue
-            try:
-                obj = json.loads(raw)
-            except Exception as exc:
-                raise RuntimeError(f"Invalid JSON in {path}:{line_no}: {exc}") from exc
+    try:
+        for obj in jsonl_codec.iter_jsonl(path):
             course_id = normalize_course_id(obj.get("course_id"))
             history = obj.get("history")
             if not course_id or not isinstance(history, list):
@@ -242,10 +244,13 @@ def load_existing(path: Path) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
                 normalized["term"] = term
                 normalized["crn"] = crn
                 rows[(course_id, term, crn)] = normalized
+    except jsonl_codec.JsonlDecodeError as exc:
+        raise RuntimeError(str(exc)) from exc
     return rows
 
 
-def parse_seat_counts(html: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+def parse_seat_counts_bs4(html: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Reference seat-count parser: walks the whole page with BeautifulSoup."""
     soup = BeautifulSoup(html, "lxml")
     for table in soup.select("table.datadisplaytable"):
         caption = table.find("caption")
@@ -270,47 +275,104 @@ def parse_seat_counts(html: str) -> Tuple[Optional[int], Optional[int], Optional
     return None, None, None
 
 
-def fetch_with_retry(
-    session: requests.Session,
-    url: str,
-    *,
-    timeout: float,
-    retries: int,
-    backoff: float,
-) -> str:
-    last_error: Optional[Exception] = None
-    for attempt in range(retries + 1):
+def _seat_table_fragment(html: str) -> Optional[str]:
+    """Return the markup of the one "Registration Availability" table, if unambiguous."""
+    caption = SEAT_CAPTION_RE.search(html)
+    if caption is None or SEAT_CAPTION_RE.search(html, caption.end()) is not None:
+        return None
+    start = max(html.rfind("<table", 0, caption.start()), html.rfind("<TABLE", 0, caption.start()))
+    close = TABLE_CLOSE_RE.search(html, caption.end())
+    if start < 0 or close is None:
+        return None
+    # The caption must sit directly in that table, with no table closing
+    # before it and none nested inside.
+    if TABLE_CLOSE_RE.search(html, start, caption.start()) or TABLE_OPEN_RE.search(html, start + 1, close.start()):
+        return None
+    return html[start:close.end()]
+
+
+def _parse_seat_table(fragment: str) -> Optional[Tuple[Optional[int], Optional[int], Optional[int]]]:
+    root = etree.HTML(fragment)
+    table = first_descendant(root, "table") if root is not None else None
+    if table is None or not has_class(table, "datadisplaytable"):
+        return None
+    caption = first_descendant(table, "caption")
+    if caption is None or "registration availability" not in element_text(caption).lower():
+        return None
+    headers = [element_text(th).lower() for th in table.iterdescendants("th") if has_class(th, "ddheader")]
+    header_index = {name: idx for idx, name in enumerate(headers)}
+    for tr in table.iterdescendants("tr"):
+        row_header = first_descendant(tr, "th", "ddlabel")
+        if row_header is None or element_text(row_header).lower() != "seats":
+            continue
+        cells = [td for td in tr.iterdescendants("td") if has_class(td, "dddefault")]
+
+        def get_cell(name: str) -> Optional[int]:
+            idx = header_index.get(name)
+            if idx is None or idx >= len(cells):
+                return None
+            return parse_int_or_none(element_text(cells[idx]))
+
+        return get_cell("capacity"), get_cell("actual"), get_cell("remaining")
+    return None
+
+
+def parse_seat_counts(html: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Return ``(capacity, actual, remaining)`` from a ``p_disp_detail_sched`` page.
+
+    Only the "Registration Availability" table is cut out and parsed with
+    lxml.  Pages where that table cannot be located unambiguously (caption
+    missing or repeated, nested tables, no "Seats" row) go through
+    :func:`parse_seat_counts_bs4`.
+    """
+    fragment = _seat_table_fragment(html)
+    if fragment is not None:
         try:
-            response = session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response.text
-        except Exception as exc:
-            last_error = exc
-            if attempt < retries:
-                time.sleep(min(8.0, backoff * (2**attempt)))
-    raise RuntimeError(f"Failed to fetch {url}: {last_error}")
+            seats = _parse_seat_table(fragment)
+        except (ValueError, etree.LxmlError):
+            seats = None
+        if seats is not None:
+            return seats
+    return parse_seat_counts_bs4(html)
+
+
+def compare_seat_count_parsers(pages: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """Run both seat-count parsers over ``(name, html)`` pages.
+
+    Returns the names whose results differ and the total seconds each parser
+    took, so a parser change can be checked and timed against saved pages.
+    """
+    divergent: List[str] = []
+    fast_s = reference_s = 0.0
+    count = 0
+    for name, html in pages:
+        count += 1
+        started = time.perf_counter()
+        fast = parse_seat_counts(html)
+        fast_s += time.perf_counter() - started
+        started = time.perf_counter()
+        reference = parse_seat_counts_bs4(html)
+        reference_s += time.perf_counter() - started
+        if fast != reference:
+            divergent.append(name)
+    return {"pages": count, "divergent": divergent, "fast_s": fast_s, "reference_s": reference_s}
+
+
+def archived_detail_pages(archive: ResponseArchive) -> Iterable[Tuple[str, str]]:
+    """Yield ``(url, html)`` for every section detail page in the response archive."""
+    for key in archive.keys():
+        if key.startswith(DETAIL_URL):
+            html = archive.lookup(key)
+            if html is not None:
+                yield key, html
 
 
 def fetch_section(
     base: Dict[str, Any],
     *,
-    timeout: float,
-    retries: int,
-    backoff: float,
-    semaphore: threading.Semaphore,
-    local_state: threading.local,
+    client: SuisClient,
 ) -> Optional[Dict[str, Any]]:
-    session = getattr(local_state, "session", None)
-    if session is None:
-        session = requests.Session()
-        session.headers.update(
-            {"User-Agent": "Mozilla/5.0 (compatible; SUrriculum/3.1; +https://github.com/)"}
-        )
-        local_state.session = session
-
-    url = detail_url(base["term"], base["crn"])
-    with semaphore:
-        html = fetch_with_retry(session, url, timeout=timeout, retries=retries, backoff=backoff)
+    html = client.get_text(detail_url(base["term"], base["crn"]))
     capacity, actual, remaining = parse_seat_counts(html)
     return {
         **base,
@@ -349,11 +411,8 @@ def merge_rows(existing: Dict[Tuple[str, str, str], Dict[str, Any]], updates: It
     return dict(sorted(by_course.items()))
 
 
-def write_jsonl(path: Path, by_course: Dict[str, List[Dict[str, Any]]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="\n") as handle:
-        for course_id in sorted(by_course):
-            handle.write(json.dumps({"course_id": course_id, "history": by_course[course_id]}, ensure_ascii=False) + "\n")
+def write_jsonl(path: Path, by_course: Dict[str, List[Dict[str, Any]]]) -> bool:
+    return jsonl_codec.write_jsonl_if_changed(path, ({"course_id": course_id, "history": by_course[course_id]} for course_id in sorted(by_course)))
 
 
 def resolve_terms(args: argparse.Namespace, schedule_dir: Path) -> Set[str]:
@@ -372,6 +431,15 @@ def resolve_terms(args: argparse.Namespace, schedule_dir: Path) -> Set[str]:
 
 def main() -> None:
     args = parse_args()
+    if args.check_seat_parser:
+        report = compare_seat_count_parsers(archived_detail_pages(ResponseArchive(args.archive_dir, replay=True)))
+        for url in report["divergent"]:
+            print(f"{url}: seat counts differ")
+        print(
+            f"Compared {report['pages']} archived detail pages; {len(report['divergent'])} diverged. "
+            f"fast: {report['fast_s']:.3f}s, BeautifulSoup: {report['reference_s']:.3f}s"
+        )
+        raise SystemExit(1 if report["divergent"] else 0)
     schedule_dir = Path(args.schedule_dir)
     out_path = Path(args.out)
     terms = resolve_terms(args, schedule_dir)
@@ -432,8 +500,14 @@ def main() -> None:
     )
 
     if to_fetch:
-        semaphore = threading.Semaphore(max(1, int(args.max_inflight or 1)))
-        local_state = threading.local()
+        client = SuisClient(
+            user_agent=USER_AGENT,
+            timeout_s=args.timeout,
+            retry=RetryPolicy(retries=args.retries, backoff_s=args.backoff),
+            max_inflight=max(1, int(args.max_inflight or 1)),
+            adaptive=bool(args.adaptive),
+            archive=archive_from_args(args),
+        )
         workers = max(1, int(args.workers or 1))
         print(
             f"Fetching section detail pages with workers={workers} max_inflight={max(1, int(args.max_inflight or 1))}...",
@@ -444,11 +518,7 @@ def main() -> None:
                 executor.submit(
                     fetch_section,
                     section,
-                    timeout=args.timeout,
-                    retries=args.retries,
-                    backoff=args.backoff,
-                    semaphore=semaphore,
-                    local_state=local_state,
+                    client=client,
                 ): section
                 for section in to_fetch
             }
@@ -462,12 +532,15 @@ def main() -> None:
                     print(f"Warning: failed {section['term']} CRN {section['crn']}: {exc}", flush=True)
                 if idx == 1 or idx % 50 == 0 or idx == len(futures):
                     print(f"Fetched {idx}/{len(futures)} section detail pages...", flush=True)
+        client.save_archive()
     else:
         print("No section detail pages need fetching.", flush=True)
 
     by_course = merge_rows(existing_for_merge, updates)
-    write_jsonl(out_path, by_course)
-    print(f"Wrote {len(by_course)} course section histories to {out_path}", flush=True)
+    if write_jsonl(out_path, by_course):
+        print(f"Wrote {len(by_course)} course section histories to {out_path}", flush=True)
+    else:
+        print(f"{out_path} already holds these {len(by_course)} course section histories; left unchanged", flush=True)
     print(f"Fetched {len(updates)} new/updated section rows; reused {len(existing)} existing rows.", flush=True)
 
 
@@ -12,9 +12,10 @@ changes when the data actually changes. Per-term hashes are recorded under
 The "data bundle" is every runtime `.jsonl`/`.json` input under courses/ and
 requirements/. This includes catalog, requirement, schedule, cumulative course
 metadata, and lazy history inputs. It excludes scraper-only intermediates,
-saved/back-up schedule files that no runtime loader can request, and the
-scraper's HTML page cache. `data/manifest.json` lives outside these roots so it
-cannot hash itself.
+saved/back-up schedule files that no runtime loader can request, the packed
+`courses/schedule/<term>.slots.bin` meeting bitmaps, and the scraper's HTML
+page cache. `data/manifest.json` lives outside these roots so it cannot hash
+itself.
 
 Large runtime JSONL files still contribute through streaming hashes; their
 hundreds of individual paths are not copied into the manifest. The much smaller
@@ -36,6 +37,9 @@ import re
 ROOT = os.path.dirname(os.path.abspath(__file__))
 DATA_DIRS = ("courses", "requirements")
 EXCLUDE_SUBSTR = ("coursepage_html_cache",)
+# Scraper-side normalized program catalogs (catalog_store.py); the app loads
+# the compiled courses/<term>/<MAJOR>.jsonl views instead.
+EXCLUDE_PREFIXES = ("courses/catalog/",)
 EXCLUDE_PATHS = {
     # Scraper intermediate merged into the runtime catalog snapshots.
     "courses/basic_science_credits.jsonl",
@@ -89,6 +93,8 @@ def _combined_hash(rel_paths, file_hashes=None):
 def _is_runtime_data_path(rel):
     if any(s in rel for s in EXCLUDE_SUBSTR) or rel in EXCLUDE_PATHS:
         return False
+    if rel.startswith(EXCLUDE_PREFIXES):
+        return False
     # The scheduler only requests courses/schedule/<six-digit-term>.jsonl.
     # Files such as 202502_from_saved.jsonl are local recovery artifacts, not
     # runtime inputs, and must not rotate returning users' cache versions.
@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""Normalized per-term program catalog store.
+
+Every ``courses/<term>/<MAJOR>.jsonl`` catalog repeats the same course rows:
+across the twelve programs of a term only ``EL_Type`` and ``Faculty_Course``
+depend on the program.  The scrapers therefore keep one file per term,
+``courses/catalog/<term>.jsonl``, as the source of truth:
+
+* one line per course with the program-independent fields, in first-seen
+  order over the programs sorted by name;
+* one ``{"program": MAJOR, "courses": [...]}`` line per program listing its
+  courses in catalog order as ``[Major, Code, EL_Type, Faculty_Course]``, with
+  a fifth element holding any field whose value differs from the shared row.
+  A row that cannot be rebuilt that way (a missing field, a different key
+  order) is listed verbatim as an object.
+
+The ``<MAJOR>.jsonl`` files the web app loads are compiled views of this
+store and are byte-identical to what ``fetch_courses.py`` wrote before.  The
+store is scraper-only state: ``build_manifest.py`` leaves it out of the data
+bundle.
+
+Consecutive admit terms differ by a handful of courses, so the store can also
+be kept as a delta chain: the oldest term in full and every later term as
+``<term>.delta.jsonl``, a patch against the term before it (see
+:func:`encode_delta`).  Any term may stay a full snapshot, which starts a new
+chain.  Readers materialize terms in one forward pass over the chain, and
+writers re-encode only the patches whose base or target changed.
+
+    python catalog_store.py --import-views   # build the store from existing views
+    python catalog_store.py --compile        # rewrite every view from the store
+    python catalog_store.py --check          # verify views match the store
+    python catalog_store.py --chain          # store later terms as deltas
+    python catalog_store.py --full           # store every term in full
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import jsonl_codec
+
+COURSES_DIR = "courses"
+STORE_DIRNAME = "catalog"
+DELTA_SUFFIX = ".delta.jsonl"
+# Catalog fields that depend on the program listing the course.
+PROGRAM_FIELDS = ("EL_Type", "Faculty_Course")
+
+CourseId = Tuple[str, str]
+_MISSING = object()
+
+
+def _course_id(row: Mapping[str, Any]) -> CourseId:
+    return (str(row.get("Major")), str(row.get("Code")))
+
+
+def _compile_entry(courses: Mapping[CourseId, Dict[str, Any]], entry: Any) -> Dict[str, Any]:
+    if isinstance(entry, dict):
+        return dict(entry)
+    row = dict(courses[(entry[0], entry[1])])
+    if len(entry) > 2 + len(PROGRAM_FIELDS):
+        row.update(entry[-1])
+    row.update(zip(PROGRAM_FIELDS, entry[2:2 + len(PROGRAM_FIELDS)]))
+    return row
+
+
+class TermCatalog:
+    """One term's shared course table plus each program's membership map."""
+
+    def __init__(self, courses: Mapping[CourseId, Dict[str, Any]], programs: Mapping[str, List[list]]):
+        self.courses: Dict[CourseId, Dict[str, Any]] = dict(courses)
+        self.programs: Dict[str, List[list]] = {major: programs[major] for major in sorted(programs, key=str.casefold)}
+
+    @classmethod
+    def from_program_rows(cls, rows_by_major: Mapping[str, Sequence[Mapping[str, Any]]]) -> "TermCatalog":
+        courses: Dict[CourseId, Dict[str, Any]] = {}
+        programs: Dict[str, List[list]] = {}
+        for major in sorted(rows_by_major, key=str.casefold):
+            entries = []
+            for row in rows_by_major[major]:
+                cid = _course_id(row)
+                shared = courses.setdefault(cid, {k: v for k, v in row.items() if k not in PROGRAM_FIELDS})
+                entry: Any = [cid[0], cid[1]] + [row.get(field) for field in PROGRAM_FIELDS]
+                overrides = {k: v for k, v in row.items() if k not in PROGRAM_FIELDS and shared.get(k, _MISSING) != v}
+                if overrides:
+                    entry.append(overrides)
+                if list(_compile_entry(courses, entry).items()) != list(row.items()):
+                    entry = dict(row)
+                entries.append(entry)
+            programs[major] = entries
+        return cls(courses, programs)
+
+    @property
+    def majors(self) -> List[str]:
+        return list(self.programs)
+
+    def program_rows(self, major: str) -> List[Dict[str, Any]]:
+        """Compile the legacy ``<MAJOR>.jsonl`` rows of one program."""
+        return [_compile_entry(self.courses, entry) for entry in self.programs[major]]
+
+    def rows_by_major(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {major: self.program_rows(major) for major in self.programs}
+
+    def intrinsic_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield each shared course row, then every program row that differs from it.
+
+        Readers that only need program-independent fields (course identity,
+        credits, titles) see every distinct value without expanding the
+        per-program views.
+        """
+        yield from self.courses.values()
+        for entries in self.programs.values():
+            for entry in entries:
+                if isinstance(entry, dict) or len(entry) > 2 + len(PROGRAM_FIELDS):
+                    yield _compile_entry(self.courses, entry)
+
+    def apply_course_fields(self, updates: Mapping[str, Mapping[str, Any]]) -> List[str]:
+        """Set program-independent fields per ``f"{Major}{Code}"`` course id.
+
+        Returns the majors whose rows changed.  Updates are applied to the
+        shared rows and the few differing program rows, without expanding
+        the per-program views.
+        """
+        def course_values(row: Mapping[str, Any]) -> Mapping[str, Any]:
+            return updates.get(f"{row.get('Major')}{row.get('Code')}") or {}
+
+        shared_updates = [(row, course_values(row)) for row in self.courses.values()]
+        if any(field in PROGRAM_FIELDS or field not in row for row, values in shared_updates for field in values):
+            # A new field would land after the program fields in the views;
+            # only a rebuild from full rows keeps that key order.
+            return self._apply_to_rows(updates)
+
+        changed = set()
+        for major, entries in self.programs.items():
+            for entry in entries:
+                if isinstance(entry, dict):
+                    for field, value in course_values(entry).items():
+                        if entry.get(field) != value:
+                            entry[field] = value
+                            changed.add(major)
+                    continue
+                shared = self.courses[(entry[0], entry[1])]
+                overrides = entry[-1] if len(entry) > 2 + len(PROGRAM_FIELDS) else {}
+                for field, value in course_values(shared).items():
+                    # Like the views, a value only changes when it compares
+                    # unequal, so 0 is not rewritten as 0.0.
+                    if field in overrides:
+                        if overrides[field] != value:
+                            overrides[field] = value
+                            changed.add(major)
+                    elif shared[field] != value:
+                        changed.add(major)
+        for row, values in shared_updates:
+            for field, value in values.items():
+                if row[field] != value:
+                    row[field] = value
+        return [major for major in self.programs if major in changed]
+
+    def _apply_to_rows(self, updates: Mapping[str, Mapping[str, Any]]) -> List[str]:
+        rows_by_major = self.rows_by_major()
+        changed = []
+        for major, rows in rows_by_major.items():
+            dirty = False
+            for row in rows:
+                for field, value in (updates.get(f"{row.get('Major')}{row.get('Code')}") or {}).items():
+                    if row.get(field) != value:
+                        row[field] = value
+                        dirty = True
+            if dirty:
+                changed.append(major)
+        rebuilt = TermCatalog.from_program_rows(rows_by_major)
+        self.courses, self.programs = rebuilt.courses, rebuilt.programs
+        return changed
+
+    def updated(self, rows_by_major: Mapping[str, Sequence[Mapping[str, Any]]]) -> "TermCatalog":
+        """Return a catalog with these programs replaced and the others kept."""
+        merged = self.rows_by_major()
+        merged.update(rows_by_major)
+        return TermCatalog.from_program_rows(merged)
+
+    def copy(self) -> "TermCatalog":
+        """Return a catalog whose rows and program entries can be changed independently."""
+        return TermCatalog(
+            {cid: dict(row) for cid, row in self.courses.items()},
+            {major: [_copy_entry(entry) for entry in entries] for major, entries in self.programs.items()},
+        )
+
+    def to_jsonl(self) -> str:
+        return jsonl_codec.jsonl_text(list(self.courses.values()) + [{"program": major, "courses": entries} for major, entries in self.programs.items()])
+
+    @classmethod
+    def from_stored_rows(cls, rows: Iterable[Dict[str, Any]]) -> "TermCatalog":
+        courses: Dict[CourseId, Dict[str, Any]] = {}
+        programs: Dict[str, List[list]] = {}
+        for row in rows:
+            if "program" in row:
+                programs[row["program"]] = row["courses"]
+            else:
+                courses[_course_id(row)] = row
+        return cls(courses, programs)
+
+
+def _copy_entry(entry: Any) -> Any:
+    if isinstance(entry, dict):
+        return dict(entry)
+    if len(entry) > 2 + len(PROGRAM_FIELDS):
+        return entry[:-1] + [dict(entry[-1])]
+    return list(entry)
+
+
+def _sequence_ops(old: Sequence[str], new: Sequence[str], new_items: Sequence[Any]) -> List[list]:
+    """Edit script turning ``old`` into ``new``: ``["=", n]``, ``["-", n]`` and ``["+", items]``."""
+    ops: List[list] = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", list(new_items[j1:j2])])
+    return ops
+
+
+def _apply_ops(old: Sequence[Any], ops: Sequence[list]) -> List[Any]:
+    out: List[Any] = []
+    pos = 0
+    for op, arg in ops:
+        if op == "=":
+            out.extend(old[pos:pos + arg])
+            pos += arg
+        elif op == "-":
+            pos += arg
+        elif op == "+":
+            out.extend(arg)
+        else:
+            raise ValueError(f"unknown catalog delta op {op!r}")
+    if pos != len(old):
+        raise ValueError("catalog delta does not cover its base")
+    return out
+
+
+def _token(value: Any) -> str:
+    # repr keeps what the views' bytes depend on and == would not: key order,
+    # and 0 versus 0.0.
+    return repr(value)
+
+
+def encode_delta(base_term: str, base: TermCatalog, target: TermCatalog) -> List[Dict[str, Any]]:
+    """Return the JSONL rows of the patch that turns ``base`` into ``target``.
+
+    The first row names the base term.  The course table patch adds and
+    removes rows by course id and lists rows whose fields changed in full;
+    each changed program gets an add/remove patch of its entry list, and a
+    dropped program a ``null`` patch.
+    """
+    old_ids = [_token(cid) for cid in base.courses]
+    new_ids = [_token(cid) for cid in target.courses]
+    modified = [
+        row for cid, row in target.courses.items()
+        if cid in base.courses and _token(base.courses[cid]) != _token(row)
+    ]
+    rows: List[Dict[str, Any]] = [
+        {"delta": base_term},
+        {"courses": _sequence_ops(old_ids, new_ids, list(target.courses.values())), "modified": modified},
+    ]
+    for major in sorted(set(base.programs) | set(target.programs), key=str.casefold):
+        if major not in target.programs:
+            rows.append({"program": major, "ops": None})
+            continue
+        old_entries = [_token(entry) for entry in base.programs.get(major, [])]
+        new_entries = [_token(entry) for entry in target.programs[major]]
+        if old_entries != new_entries:
+            rows.append({"program": major, "ops": _sequence_ops(old_entries, new_entries, target.programs[major])})
+    return rows
+
+
+def apply_delta(base_term: str, base: TermCatalog, rows: Iterable[Mapping[str, Any]]) -> TermCatalog:
+    """Apply an :func:`encode_delta` patch to ``base``.
+
+    ``base`` is left unchanged; the result shares its unchanged rows.
+    """
+    rows = list(rows)
+    if not rows or rows[0].get("delta") != base_term:
+        raise ValueError(f"catalog delta is not based on {base_term}")
+    courses = dict(base.courses)
+    programs = dict(base.programs)
+    for row in rows[1:]:
+        if "courses" in row:
+            courses = {_course_id(course): course for course in _apply_ops(list(base.courses.values()), row["courses"])}
+            for changed in row.get("modified", []):
+                courses[_course_id(changed)] = changed
+        elif row.get("ops") is None:
+            programs.pop(row["program"], None)
+        else:
+            programs[row["program"]] = _apply_ops(base.programs.get(row["program"], []), row["ops"])
+    return TermCatalog(courses, programs)
+
+
+def store_dir(courses_dir: str = COURSES_DIR) -> str:
+    return os.path.join(courses_dir, STORE_DIRNAME)
+
+
+def store_path(courses_dir: str, term: str, delta: bool = False) -> str:
+    return os.path.join(store_dir(courses_dir), f"{term}{DELTA_SUFFIX if delta else '.jsonl'}")
+
+
+def _stored_kinds(courses_dir: str) -> Dict[str, bool]:
+    """Return ``{term: is_delta}`` for every term in the store."""
+    try:
+        names = os.listdir(store_dir(courses_dir))
+    except FileNotFoundError:
+        return {}
+    kinds: Dict[str, bool] = {}
+    for name in sorted(names):
+        match = re.fullmatch(r"(\d{6})(\.delta)?\.jsonl", name)
+        if not match:
+            continue
+        term = match.group(1)
+        if term in kinds:
+            # A writer stopped between placing the new form and removing the
+            # old one; neither file can be trusted over the other.
+            raise ValueError(
+                f"catalog store holds both {term}.jsonl and {term}{DELTA_SUFFIX}; "
+                "delete the stale one and run catalog_store.py --check"
+            )
+        kinds[term] = bool(match.group(2))
+    return kinds
+
+
+def store_terms(courses_dir: str = COURSES_DIR) -> List[str]:
+    """Return the terms that have a store file, oldest first."""
+    return sorted(_stored_kinds(courses_dir))
+
+
+def is_delta_chain(courses_dir: str = COURSES_DIR) -> bool:
+    return any(_stored_kinds(courses_dir).values())
+
+
+def iter_term_catalogs(courses_dir: str, terms: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, TermCatalog]]:
+    """Yield ``(term, catalog)`` oldest first, materializing the delta chain in one pass.
+
+    ``terms`` limits what is yielded, not what is read: a delta term still
+    needs every patch back to its full snapshot.  Each yielded catalog is a
+    copy the caller may change.
+    """
+    kinds = _stored_kinds(courses_dir)
+    wanted = set(kinds) if terms is None else set(terms) & set(kinds)
+    if not wanted:
+        return
+    last = max(wanted)
+    previous: Optional[Tuple[str, TermCatalog]] = None
+    for term in sorted(kinds):
+        if term > last:
+            break
+        if kinds[term]:
+            if previous is None:
+                raise ValueError(f"catalog delta {term} has no earlier full snapshot")
+            catalog = apply_delta(previous[0], previous[1], jsonl_codec.read_jsonl(store_path(courses_dir, term, delta=True)))
+        else:
+            catalog = TermCatalog.from_stored_rows(jsonl_codec.iter_jsonl(store_path(courses_dir, term)))
+        previous = (term, catalog)
+        if term in wanted:
+            yield term, catalog.copy()
+
+
+def read_term_catalog(courses_dir: str, term: str) -> Optional[TermCatalog]:
+    for _term, catalog in iter_term_catalogs(courses_dir, [term]):
+        return catalog
+    return None
+
+
+def view_paths(courses_dir: str, term: str) -> Dict[str, str]:
+    """Return ``{MAJOR: path}`` for the legacy views present in ``courses/<term>/``."""
+    term_dir = os.path.join(courses_dir, term)
+    try:
+        names = sorted(os.listdir(term_dir))
+    except FileNotFoundError:
+        return {}
+    return {name[: -len(".jsonl")]: os.path.join(term_dir, name) for name in names if name.endswith(".jsonl")}
+
+
+def import_views(courses_dir: str, term: str) -> Optional[TermCatalog]:
+    """Build a term's catalog from its legacy ``<MAJOR>.jsonl`` views, if any."""
+    rows_by_major = {}
+    for major, path in view_paths(courses_dir, term).items():
+        rows_by_major[major] = jsonl_codec.read_jsonl(path)
+    return TermCatalog.from_program_rows(rows_by_major) if rows_by_major else None
+
+
+def load_term_catalog(courses_dir: str, term: str) -> Optional[TermCatalog]:
+    """Return the stored catalog, falling back to the legacy views of a term with no store yet."""
+    catalog = read_term_catalog(courses_dir, term)
+    return catalog if catalog is not None else import_views(courses_dir, term)
+
+
+def write_term_catalogs(courses_dir: str, catalogs: Mapping[str, TermCatalog], *, chain: Optional[bool] = None) -> None:
+    """Store these terms' catalogs, keeping the rest of the store as it is.
+
+    Each term keeps its current form (full or delta); a new term becomes a
+    delta when the store is a delta chain.  ``chain=True``/``False`` instead
+    re-encodes the whole store as one chain or as full snapshots.  The patch
+    of the term after a changed term is re-encoded against its new base.
+    """
+    kinds = _stored_kinds(courses_dir)
+    if chain is None and not any(kinds.values()):
+        for term, catalog in catalogs.items():
+            jsonl_codec.replace_text_if_changed(store_path(courses_dir, term), catalog.to_jsonl())
+        return
+
+    current = dict(iter_term_catalogs(courses_dir))
+    current.update(catalogs)
+    in_chain = any(kinds.values()) if chain is None else chain
+    previous: Optional[Tuple[str, TermCatalog]] = None
+    rewrite_next = False
+    for term in sorted(current):
+        catalog = current[term]
+        if chain is None:
+            delta = kinds.get(term, in_chain) and previous is not None
+        else:
+            delta = chain and previous is not None
+        if chain is not None or term in catalogs or (rewrite_next and delta) or delta != kinds.get(term):
+            if delta:
+                text = jsonl_codec.jsonl_text(encode_delta(previous[0], previous[1], catalog))
+            else:
+                text = catalog.to_jsonl()
+            # The new form is in place before the old one goes, so a crash
+            # leaves both files (which readers refuse) rather than neither.
+            jsonl_codec.replace_text_if_changed(store_path(courses_dir, term, delta), text)
+            stale = store_path(courses_dir, term, not delta)
+            if os.path.exists(stale):
+                os.unlink(stale)
+        rewrite_next = term in catalogs
+        previous = (term, catalog)
+
+
+def write_term_catalog(courses_dir: str, term: str, catalog: TermCatalog) -> None:
+    write_term_catalogs(courses_dir, {term: catalog})
+
+
+def compile_views(
+    courses_dir: str,
+    term: str,
+    catalog: TermCatalog,
+    majors: Optional[Iterable[str]] = None,
+    *,
+    stats: Optional[jsonl_codec.WriteStats] = None,
+) -> List[str]:
+    """Write the legacy ``<MAJOR>.jsonl`` views of ``majors`` (default: all).
+
+    A view that already matches is left untouched; returns the paths that changed.
+    """
+    written = []
+    for major in catalog.majors if majors is None else majors:
+        path = os.path.join(courses_dir, term, f"{major}.jsonl")
+        if jsonl_codec.write_jsonl_if_changed(path, catalog.program_rows(major), stats=stats):
+            written.append(path)
+    return written
+
+
+def publish_programs(
+    courses_dir: str,
+    term: str,
+    rows_by_major: Mapping[str, Sequence[Mapping[str, Any]]],
+    *,
+    stats: Optional[jsonl_codec.WriteStats] = None,
+) -> TermCatalog:
+    """Merge freshly crawled programs into a term's store and compile their views.
+
+    Programs not in ``rows_by_major`` keep their stored rows (or, before the
+    term has a store, the rows of their existing view).  ``stats`` counts the
+    views written and left unchanged.
+    """
+    existing = load_term_catalog(courses_dir, term)
+    catalog = existing.updated(rows_by_major) if existing is not None else TermCatalog.from_program_rows(rows_by_major)
+    write_term_catalog(courses_dir, term, catalog)
+    compile_views(courses_dir, term, catalog, rows_by_major, stats=stats)
+    return catalog
+
+
+def check_views(courses_dir: str, term: str, catalog: Optional[TermCatalog] = None) -> List[str]:
+    """Return the views of ``term`` that do not match its store (missing, stale or extra)."""
+    if catalog is None:
+        catalog = read_term_catalog(courses_dir, term)
+    if catalog is None:
+        return []
+    views = view_paths(courses_dir, term)
+    problems = [f"{term}/{major}.jsonl: not in the store" for major in views if major not in catalog.programs]
+    for major in catalog.majors:
+        path = views.get(major)
+        if path is None:
+            problems.append(f"{term}/{major}.jsonl: missing")
+            continue
+        with open(path, "r", encoding="utf-8") as fh:
+            if fh.read() != jsonl_codec.jsonl_text(catalog.program_rows(major)):
+                problems.append(f"{term}/{major}.jsonl: differs from the store")
+    return problems
+
+
+def _view_terms(courses_dir: str) -> List[str]:
+    try:
+        names = os.listdir(courses_dir)
+    except FileNotFoundError:
+        return []
+    return sorted(name for name in names if re.fullmatch(r"\d{6}", name) and view_paths(courses_dir, name))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Maintain the normalized program catalog store under courses/catalog/.")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--import-views", action="store_true", help="(Re)build each term's store from its <MAJOR>.jsonl views.")
+    action.add_argument("--compile", action="store_true", help="Rewrite every <MAJOR>.jsonl view that differs from the store.")
+    action.add_argument("--check", action="store_true", help="Exit non-zero if any view differs from the store (materializing every delta).")
+    action.add_argument("--chain", action="store_true", help="Re-encode the store as a full oldest term plus per-term deltas.")
+    action.add_argument("--full", action="store_true", help="Re-encode every stored term as a full snapshot.")
+    parser.add_argument("--courses-dir", default=COURSES_DIR)
+    parser.add_argument("--terms", default="", help="Comma-separated terms (default: all).")
+    args = parser.parse_args(argv)
+
+    selected = {t.strip() for t in args.terms.split(",") if t.strip()}
+    if args.import_views:
+        imported = {}
+        for term in _view_terms(args.courses_dir):
+            if selected and term not in selected:
+                continue
+            imported[term] = catalog = import_views(args.courses_dir, term)
+            print(f"Stored {term}: {len(catalog.courses)} courses across {len(catalog.programs)} programs")
+        write_term_catalogs(args.courses_dir, imported)
+        return 0
+    if args.chain or args.full:
+        write_term_catalogs(args.courses_dir, {}, chain=bool(args.chain))
+        return 0
+
+    problems = []
+    stats = jsonl_codec.WriteStats()
+    for term, catalog in iter_term_catalogs(args.courses_dir, None if not selected else selected):
+        if args.compile:
+            compile_views(args.courses_dir, term, catalog, stats=stats)
+        else:
+            problems.extend(check_views(args.courses_dir, term, catalog))
+    if args.compile:
+        print(f"Compiled views: {stats}")
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
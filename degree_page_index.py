@@ -0,0 +1,141 @@
+"""One-pass document-order index over a parsed SU_DEGREE page.
+
+``fetch_courses.crawl_program`` and ``fetch_minors`` resolve each category
+anchor to the course table and ``p_list_courses`` ("Click") links that follow
+it.  Doing that with ``find_next()`` chains re-walks the document for every
+anchor.  :class:`DegreePageIndex` walks the BeautifulSoup tree once, numbers
+every tag in document order (the order ``find_next()`` visits them) and keeps
+the anchors, tables, bold titles and list links as sorted position lists, so
+"the next table within ten tags" or "the links inside this table" become a
+bisect instead of a traversal.  Per-table checks are memoized with
+:meth:`DegreePageIndex.feature`, so a table shared by several anchors is
+inspected once.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from bs4 import Tag
+
+LIST_COURSES_MARKER = "p_list_courses"
+
+
+class DegreePageIndex:
+    """Document-order positions of the tags in one parsed degree page."""
+
+    def __init__(self, soup: Any):
+        self.elements: List[Tag] = []
+        self._positions: Dict[int, int] = {}
+        self._parents: List[int] = []
+        self._ends: List[int] = []
+        self._by_tag: Dict[str, List[int]] = {}
+        self._anchors: List[int] = []
+        self._list_links: List[int] = []
+        self._features: Dict[Tuple[Hashable, int], Any] = {}
+
+        # Iterative pre-order walk; ``_ends[i]`` is the position of the last
+        # tag inside element ``i`` so its subtree is ``(i, _ends[i]]``.
+        stack: List[Tuple[int, Iterator[Any]]] = [(-1, iter(soup.contents))]
+        while stack:
+            parent, children = stack[-1]
+            for child in children:
+                if not isinstance(child, Tag):
+                    continue
+                pos = len(self.elements)
+                self.elements.append(child)
+                self._positions[id(child)] = pos
+                self._parents.append(parent)
+                self._ends.append(pos)
+                self._by_tag.setdefault(child.name, []).append(pos)
+                if child.name == "a":
+                    if child.get("name") is not None:
+                        self._anchors.append(pos)
+                    href = child.get("href")
+                    if href and LIST_COURSES_MARKER in href:
+                        self._list_links.append(pos)
+                stack.append((pos, iter(child.contents)))
+                break
+            else:
+                stack.pop()
+                if parent >= 0:
+                    self._ends[parent] = len(self.elements) - 1
+
+    def position(self, el: Tag) -> int:
+        return self._positions[id(el)]
+
+    @property
+    def anchors(self) -> List[Tag]:
+        """Every ``<a name>``, in document order (``soup.select('a[name]')``)."""
+        return [self.elements[pos] for pos in self._anchors]
+
+    @property
+    def list_links(self) -> List[Tag]:
+        """Every ``<a href>`` to a ``p_list_courses`` page, in document order."""
+        return [self.elements[pos] for pos in self._list_links]
+
+    def _positions_for(self, tag: Optional[str]) -> Optional[List[int]]:
+        if tag is None:
+            return None
+        if tag == LIST_COURSES_MARKER:
+            return self._list_links
+        return self._by_tag.get(tag, [])
+
+    def following(self, el: Tag, tag: Optional[str] = None, *, window: Optional[int] = None, limit: Optional[int] = None) -> List[Tag]:
+        """Tags after ``el`` in document order, as repeated ``find_next(tag)`` yields them.
+
+        ``window`` keeps only the next ``window`` tags of any name (``window``
+        plain ``find_next()`` steps); ``limit`` caps the number of matches.
+        ``tag`` may be :data:`LIST_COURSES_MARKER` for list links.
+        """
+        pos = self.position(el)
+        stop = len(self.elements) if window is None else min(len(self.elements), pos + 1 + window)
+        positions = self._positions_for(tag)
+        if positions is None:
+            selected = range(pos + 1, stop)
+        else:
+            selected = positions[bisect_right(positions, pos):bisect_left(positions, stop)]
+        if limit is not None:
+            selected = selected[:limit]
+        return [self.elements[i] for i in selected]
+
+    def within(self, el: Tag, tag: str) -> List[Tag]:
+        """Descendants of ``el`` named ``tag``, as ``el.find_all(tag)`` returns them."""
+        pos = self.position(el)
+        positions = self._positions_for(tag)
+        return [self.elements[i] for i in positions[bisect_right(positions, pos):bisect_right(positions, self._ends[pos])]]
+
+    def first_within(self, el: Tag, tag: str) -> Optional[Tag]:
+        """The first descendant of ``el`` named ``tag`` (``el.find(tag)``), or ``None``."""
+        pos = self.position(el)
+        positions = self._positions_for(tag)
+        i = bisect_right(positions, pos)
+        if i < len(positions) and positions[i] <= self._ends[pos]:
+            return self.elements[positions[i]]
+        return None
+
+    def enclosing(self, el: Tag, tag: str) -> Optional[Tag]:
+        """The nearest ancestor of ``el`` named ``tag`` (``el.find_parent(tag)``), or ``None``."""
+        parent = self._parents[self.position(el)]
+        while parent >= 0:
+            if self.elements[parent].name == tag:
+                return self.elements[parent]
+            parent = self._parents[parent]
+        return None
+
+    def next_siblings(self, el: Tag) -> Iterator[Tag]:
+        """Tag siblings after ``el``, as ``el.find_next_siblings()`` returns them."""
+        pos = self.position(el)
+        parent = self._parents[pos]
+        nxt = self._ends[pos] + 1
+        while nxt < len(self.elements) and self._parents[nxt] == parent:
+            yield self.elements[nxt]
+            nxt = self._ends[nxt] + 1
+
+    def feature(self, el: Tag, name: Hashable, compute: Callable[[Tag], Any]) -> Any:
+        """Return ``compute(el)``, computed once per element and ``name``."""
+        key = (name, self.position(el))
+        if key not in self._features:
+            self._features[key] = compute(el)
+        return self._features[key]
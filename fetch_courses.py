@@ -1,25 +1,33 @@
 import re
-import json
-import requests
-from urllib.parse import urljoin
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 from bs4 import BeautifulSoup
 import subprocess
 import os
 import datetime
 import argparse
 import concurrent.futures
-import random
-import threading
 import tempfile
-import time
 
-from term_utils import generate_terms
+import catalog_store
+import jsonl_codec
+import fetch_requirements
+from term_utils import generate_terms, split_frozen_terms
 from suis_page_validation import require_matching_admit_term, validate_suis_term_code
+from suis_archive import add_archive_arguments, archive_cli_args, archive_from_args
+from suis_http import RetryPolicy, SuisClient
+from work_queue import ParsePool, PriorityWorkPool, SingleFlight
+from area_codes import BY_TITLE, CATALOG_ANCHOR, CATALOG_ANCHOR_LINK, CATALOG_PAGE_LINK
+from degree_page_index import LIST_COURSES_MARKER, DegreePageIndex
+from parse_cache import add_parse_cache_arguments, cached_parser, parse_cache_cli_args, parse_cache_from_args
 
 COURSES_DIR = 'courses'
 
 BASE = 'https://suis.sabanciuniv.edu/prod/'
 LIST_URL = BASE + 'SU_DEGREE.p_list_degree?P_LEVEL=UG&P_LANG=EN&P_PRG_TYPE='
+AREA_PARAM_RE = re.compile(r'P_AREA=([^&]+)')
+
+# Bump whenever parse_list_html (or parse_table) output changes (see parse_cache).
+LIST_PARSER_VERSION = 1
 
 PROGRAM_FILES = {
     'BSBIO': 'BIO.jsonl',
@@ -69,50 +77,21 @@ def is_faculty_course(major, code):
     return get_faculty_for_course(major, code) is not None
 
 
-_tls = threading.local()
-_net_semaphore = None
-_http_timeout_s = 30.0
-_http_retries = 2
-_http_backoff_s = 0.5
-_http_sleep_s = 0.0
-
-
-def _get_session():
-    sess = getattr(_tls, "session", None)
-    if sess is None:
-        sess = requests.Session()
-        sess.headers.update(
-            {
-                "User-Agent": "surriculum-fetch/1.0 (+https://github.com/beficent/surriculum)",
-            }
-        )
-        _tls.session = sess
-    return sess
+_client = SuisClient()
+# Set by main() while the terms x programs scheduler runs; crawl_program then
+# queues its p_list_courses fetches on it instead of fetching them inline.
+_work_pool = None
+# p_list_courses pages parsed during this run, keyed by normalized URL. Every
+# degree page links its lists from both the per-anchor and the fallback scan,
+# and concurrent crawls wait on one fetch instead of repeating it.
+_list_cache = SingleFlight()
+# Set by main() from --parse-processes; list pages are parsed on it.
+_parse_pool = ParsePool()
 
 
 def fetch_html(url):
-    """Fetch URL with retries, optional throttling, and per-thread sessions."""
-    sess = _get_session()
-    last_err = None
-    attempts = max(0, int(_http_retries)) + 1
-    for attempt in range(attempts):
-        try:
-            if _net_semaphore is None:
-                resp = sess.get(url, timeout=_http_timeout_s)
-            else:
-                with _net_semaphore:
-                    resp = sess.get(url, timeout=_http_timeout_s)
-            resp.raise_for_status()
-            if _http_sleep_s and _http_sleep_s > 0:
-                time.sleep(_http_sleep_s)
-            return resp.text
-        except Exception as e:
-            last_err = e
-            if attempt >= attempts - 1:
-                raise
-            sleep_for = float(_http_backoff_s) * (2**attempt) + random.uniform(0, 0.25)
-            time.sleep(sleep_for)
-    raise last_err
+    """Fetch URL through the shared SUIS client (retries, throttling, pooling)."""
+    return _client.get_text(url)
 
 
 def get_program_codes():
@@ -200,214 +179,239 @@ def parse_table(table, category):
     return rows
 
 
-def crawl_list(url, category):
-    html = fetch_html(url)
+def normalize_list_url(url):
+    """Return ``url`` with a lower-case host and sorted query parameters."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+@cached_parser(LIST_PARSER_VERSION)
+def parse_list_html(html, category):
+    """Return the catalog rows of one p_list_courses page."""
     soup = BeautifulSoup(html, 'lxml')
     table = soup.find('table')
     return parse_table(table, category) if table else []
 
 
-def crawl_program(code, term):
+def _fetch_list_rows(url, category):
+    return _parse_pool.parse(parse_list_html, fetch_html(url), category)
+
+
+def crawl_list(url, category):
+    # The category is part of the key because parse_table stamps it on rows.
+    rows = _list_cache.do((normalize_list_url(url), category), _fetch_list_rows, url, category)
+    # Callers own their rows; the cached parse stays untouched.
+    return [dict(row) for row in rows]
+
+
+def _crawl_lists(jobs, term):
+    """Return ``crawl_list`` rows for each ``(url, el_type)`` job, in order."""
+    pool = _work_pool
+    if pool is None or not jobs:
+        return [crawl_list(url, el_type) for url, el_type in jobs]
+    # Queue each distinct list once; repeated links reuse the same future.
+    by_key = {}
+    for url, el_type in jobs:
+        key = (normalize_list_url(url), el_type)
+        if key not in by_key:
+            by_key[key] = pool.submit(_list_priority(term), crawl_list, url, el_type)
+    # Help with queued list fetches instead of idling this worker thread.
+    pool.wait(by_key.values(), help_below=_PROGRAM_PRIORITY)
+    return [
+        [dict(row) for row in by_key[(normalize_list_url(url), el_type)].result()]
+        for url, el_type in jobs
+    ]
+
+
+def _list_priority(term):
+    return (0, str(term))
+
+
+def _program_priority(term, program_index):
+    return (1, str(term), program_index)
+
+
+# Every list-fetch priority sorts before every program-crawl priority.
+_PROGRAM_PRIORITY = (1,)
+
+
+def fetch_degree_page(code, term):
+    """Fetch and parse one degree-detail page, rejecting fallback terms."""
     term = validate_suis_term_code(term)
     url = (BASE + 'SU_DEGREE.p_degree_detail?P_PROGRAM={code}&P_LANG=EN&P_LEVEL=UG'
            '&P_TERM={term}&P_SUBMIT=Select').format(code=code, term=term)
     html = fetch_html(url)
     soup = BeautifulSoup(html, 'lxml')
     require_matching_admit_term(soup, term)
-    results = []
-    seen_courses = set()  # Track seen courses to avoid duplicates
+    return soup
+
+
+def crawl_degree_page(code, term):
+    """Return catalog rows and the requirement record from one page fetch.
+
+    The requirement slot holds the exception instead when only the summary
+    fails to parse, so a catalog refresh is not lost with it.
+    """
+    soup = fetch_degree_page(code, term)
+    rows = crawl_program(code, term, soup=soup)
+    major = fetch_requirements.PROGRAM_CODES.get(code, code)
+    try:
+        summary = fetch_requirements.parse_requirements(soup, code)
+        requirement = fetch_requirements.build_requirement_record(major, summary)
+    except Exception as exc:
+        requirement = exc
+    return rows, requirement
+
+
+def _header_strings(table):
+    return [th.string for th in table.find_all('th')]
+
+
+def _has_header(index, table, words):
+    """Whether some ``<th>`` in ``table`` has a ``.string`` containing one of ``words``."""
+    return any(s and any(word in s for word in words) for s in index.feature(table, 'th_strings', _header_strings))
+
+
+def _has_course_rows(table):
+    """Whether a row after the first has a course code in its second of 5+ cells."""
+    for row in table.find_all('tr')[1:]:  # Skip potential header
+        tds = row.find_all('td')
+        if len(tds) >= 5:
+            # Check if the second column looks like a course code
+            course_text = tds[1].get_text(strip=True).replace('\xa0', ' ')
+            if course_text and re.match(r'^[A-Z]+\s*\d+', course_text):
+                return True
+    return False
+
+
+def crawl_program(code, term, soup=None):
+    term = validate_suis_term_code(term)
+    if soup is None:
+        soup = fetch_degree_page(code, term)
+    # Inline table rows (lists) and linked list pages ((url, el_type) tuples),
+    # in the order they appear on the page.
+    segments = []
+
+    # One pass over the page indexes every anchor, table and Click link.
+    index = DegreePageIndex(soup)
 
     # First, try to extract category information from the name attribute
-    for a in soup.select('a[name]'):
-        name_attr = a.get('name', '')
-        # Skip non-category anchors with improved pattern matching
-        if not (name_attr.endswith('_CEL') or name_attr.endswith('_REQ') or
-                name_attr.endswith('_AEL') or name_attr.endswith('_FEL') or name_attr.endswith('_ARE') or name_attr.endswith('_FRE') or
-                name_attr == 'UC_FENS' or name_attr == 'UC_FASS' or
-                name_attr.startswith('main') or
-                # Add more specific patterns for different program types
-                '_COR' in name_attr or '_C1' in name_attr or '_C2' in name_attr or '_CE1' in name_attr or '_CE2' in name_attr or
-                '_PHL' in name_attr or '_MEL' in name_attr):  # Sometimes 'main' is used for categories
+    for a in index.anchors:
+        # Determine the category type based on the name attribute; skip
+        # non-category anchors.
+        el_type = CATALOG_ANCHOR(a.get('name', ''))
+        if el_type is None:
             continue
 
         # Get the category title from the parent element's text or the next bold text
         category_title = ""
-        if a.parent and a.parent.find('b'):
-            category_title = a.parent.find('b').get_text(strip=True)
-        elif a.find_next('b'):
-            category_title = a.find_next('b').get_text(strip=True)
-
-        # Determine the category type based on the name attribute or title
-        el_type = None
-        if name_attr.endswith('_CEL') or '_COR' in name_attr or '_CE1' in name_attr or '_C1' in name_attr or name_attr.endswith('_CE2') or name_attr.endswith('_C2'):
-            el_type = 'core'
-        elif name_attr.endswith('_REQ') or name_attr.endswith('_MEL') or name_attr.endswith('_PHL'):
-            el_type = 'required'
-        elif name_attr.endswith('_AEL') or name_attr.endswith('_ARE'):
-            el_type = 'area'
-        elif name_attr.endswith('_FEL') or name_attr.endswith('_FRE'):
-            el_type = 'free'
-        elif name_attr == 'UC_FENS' or name_attr == 'UC_FASS':
-            el_type = 'university'
-        else:
+        title_tag = index.first_within(a.parent, 'b') if a.parent else None
+        if title_tag is None:
+            title_tag = next(iter(index.following(a, 'b', limit=1)), None)
+        if title_tag is not None:
+            category_title = title_tag.get_text(strip=True)
+
+        if el_type == BY_TITLE:
             # If we can't determine from the name attribute, use the title text
             el_type = map_category(category_title)
 
-        # Improved table finding logic - try multiple approaches
+        # Improved table finding logic - try multiple approaches, all resolved
+        # against the page index instead of re-walking the document.
         table = None
+        anchor_table = index.enclosing(a, 'table')
 
         # Method 1: Look for tables in the next few siblings after the anchor
-        current_element = a
-        for _ in range(10):  # Look through next 10 elements
-            current_element = current_element.find_next()
-            if not current_element:
+        for candidate in index.following(a, 'table', window=10):  # Look through next 10 elements
+            # Check if this table has course-like structure, or course data even without headers
+            if (_has_header(index, candidate, ('Course', 'Name', 'ECTS', 'SU Credits'))
+                    or index.feature(candidate, 'course_rows', _has_course_rows)):
+                table = candidate
                 break
 
-            if current_element.name == 'table':
-                # Check if this table has course-like structure
-                if current_element.find('th', string=lambda s: s and ('Course' in s or 'Name' in s or 'ECTS' in s or 'SU Credits' in s)):
-                    table = current_element
-                    break
-                # Also check for tables with course data even without headers
-                rows = current_element.find_all('tr')
-                if len(rows) > 1:  # Must have more than just header
-                    first_data_row = None
-                    for row in rows[1:]:  # Skip potential header
-                        tds = row.find_all('td')
-                        if len(tds) >= 5 and tds[1] and tds[1].get_text(strip=True):
-                            # Check if the second column looks like a course code
-                            course_text = tds[1].get_text(strip=True).replace('\xa0', ' ')
-                            if re.match(r'^[A-Z]+\s*\d+', course_text):
-                                table = current_element
-                                break
-                    if table:
-                        break
-
         # Method 2: If no table found yet, try looking in parent table structure and finding next sibling tables
-        if not table:
-            parent_table = a.find_parent('table')
-            if parent_table:
-                # Look for the next table after the parent table
-                next_element = parent_table.find_next_sibling()
-                while next_element:
-                    if next_element.name == 'tr':
-                        # Check if this tr contains a table
-                        nested_table = next_element.find('table')
-                        if nested_table and nested_table.find('th', string=lambda s: s and ('Course' in s or 'Name' in s)):
-                            table = nested_table
-                            break
-                    elif next_element.name == 'table':
-                        if next_element.find('th', string=lambda s: s and ('Course' in s or 'Name' in s)):
-                            table = next_element
-                            break
-                    next_element = next_element.find_next_sibling()
+        if not table and anchor_table:
+            # Look for the next table after the parent table
+            for next_element in index.next_siblings(anchor_table):
+                if next_element.name == 'tr':
+                    # Check if this tr contains a table
+                    nested_table = index.first_within(next_element, 'table')
+                    if nested_table and _has_header(index, nested_table, ('Course', 'Name')):
+                        table = nested_table
+                        break
+                elif next_element.name == 'table':
+                    if _has_header(index, next_element, ('Course', 'Name')):
+                        table = next_element
+                        break
 
         # Method 3: Alternative approach - look for tables within a reasonable distance
         if not table:
-            # Find all tables after this anchor within a reasonable scope
-            all_tables = []
-            current = a
-            for _ in range(20):  # Look through next 20 elements
-                current = current.find_next('table')
-                if not current:
-                    break
-                all_tables.append(current)
-
-            # Find the first table that looks like a course table
-            for candidate_table in all_tables:
-                if candidate_table.find('th', string=lambda s: s and ('Course' in s or 'Name' in s or 'ECTS' in s)):
+            # Find the first of the next 20 tables that looks like a course table
+            for candidate_table in index.following(a, 'table', limit=20):
+                if _has_header(index, candidate_table, ('Course', 'Name', 'ECTS')):
                     table = candidate_table
                     break
 
         # If we found a table, parse it
         if table:
-            new_rows = parse_table(table, el_type)
-            for row in new_rows:
-                course_id = f"{row['Major']}{row['Code']}"
-                if course_id not in seen_courses:
-                    results.append(row)
-                    seen_courses.add(course_id)
+            segments.append(index.feature(table, ('rows', el_type), lambda t: parse_table(t, el_type)))
 
         # Check for a link to additional courses in this category (existing logic)
         links = []
-        if a.find_parent('table'):
-            links = a.find_parent('table').find_all('a', href=lambda h: h and 'p_list_courses' in h)
+        if anchor_table:
+            links = index.within(anchor_table, LIST_COURSES_MARKER)
 
         # If no links found, try a broader search in nearby elements
         if not links and a.parent:
             # Look in following siblings and their children
-            for sibling in a.parent.find_next_siblings():
-                links.extend(sibling.find_all('a', href=lambda h: h and 'p_list_courses' in h))
-
-            # Also search in the next few elements after the anchor
-            current_element = a
-            for _ in range(15):  # Look through next 15 elements for Click links
-                current_element = current_element.find_next()
-                if not current_element:
-                    break
-                if current_element.name == 'a' and current_element.get('href') and 'p_list_courses' in current_element.get('href'):
-                    links.append(current_element)
+            for sibling in index.next_siblings(a.parent):
+                links.extend(index.within(sibling, LIST_COURSES_MARKER))
+
+            # Also search in the next few elements after the anchor for Click links
+            links.extend(index.following(a, LIST_COURSES_MARKER, window=15))
 
         for link in links:
             # Extract category from the link URL to double-check
-            area_match = re.search(r'P_AREA=([^&]+)', link['href'])
+            area_match = AREA_PARAM_RE.search(link['href'])
             if area_match:
-                area_code = area_match.group(1)
                 # Override el_type if we have a more specific area code from the URL
-                if '_CEL' in area_code or '_COR' in area_code or '_CE1' in area_code or '_C1' in area_code or '_CE2' in area_code or '_C2' in area_code:
-                    el_type = 'core'
-                elif '_REQ' in area_code or '_MEL' in area_code or '_PHL' in area_code:
-                    el_type = 'required'
-                elif '_AEL' in area_code or '_ARE' in area_code:
-                    el_type = 'area'
-                elif '_FEL' in area_code or '_FRE' in area_code:
-                    el_type = 'free'
-                elif 'UC_' in area_code:
-                    el_type = 'university'
-                else:
-                    el_type = 'unknown'
-            list_url = urljoin(BASE, link['href'])
-            new_rows = crawl_list(list_url, el_type)
-            for row in new_rows:
-                course_id = f"{row['Major']}{row['Code']}"
-                if course_id not in seen_courses:
-                    results.append(row)
-                    seen_courses.add(course_id)
+                el_type = CATALOG_ANCHOR_LINK(area_match.group(1))
+            segments.append((urljoin(BASE, link['href']), el_type))
 
     # Add a fallback method to catch links that might have been missed
     # Look for all "Click" links throughout the page
-    for click_link in soup.find_all('a', href=lambda h: h and 'p_list_courses' in h):
-        area_match = re.search(r'P_AREA=([^&]+)', click_link['href'])
+    for click_link in index.list_links:
+        area_match = AREA_PARAM_RE.search(click_link['href'])
         if area_match:
-            area_code = area_match.group(1)
             # Determine category from area code
-            if '_CEL' in area_code or '_COR' in area_code or '_CE1' in area_code or '_CE2' in area_code or '_C1' in area_code or '_C2' in area_code:
-                el_type = 'core'
-            elif '_REQ' in area_code:
-                el_type = 'required'
-            elif '_AEL' in area_code or '_ARE' in area_code:
-                el_type = 'area'
-            elif '_FEL' in area_code or '_FRE' in area_code:
-                el_type = 'free'
-            elif 'UC_' in area_code:
-                el_type = 'university'
-            elif '_PHL' in area_code or '_MEL' in area_code:
-                el_type = 'required'
-            else:
-                # Default to if unknown
-                el_type = 'unknown'
-
-            list_url = urljoin(BASE, click_link['href'])
-            new_rows = crawl_list(list_url, el_type)
-            for row in new_rows:
-                course_id = f"{row['Major']}{row['Code']}"
-                if course_id not in seen_courses:
-                    results.append(row)
-                    seen_courses.add(course_id)
+            el_type = CATALOG_PAGE_LINK(area_match.group(1))
+            segments.append((urljoin(BASE, click_link['href']), el_type))
+
+    # Fetch every linked list page (concurrently when a work pool is active),
+    # then merge in page order so de-duplication matches a sequential crawl.
+    list_jobs = [segment for segment in segments if isinstance(segment, tuple)]
+    list_rows = iter(_crawl_lists(list_jobs, term))
+    results = []
+    seen_courses = set()  # Track seen courses to avoid duplicates
+    for segment in segments:
+        new_rows = next(list_rows) if isinstance(segment, tuple) else segment
+        for row in new_rows:
+            course_id = f"{row['Major']}{row['Code']}"
+            if course_id not in seen_courses:
+                results.append(row)
+                seen_courses.add(course_id)
 
     return results
 
 
+def published_course_terms():
+    """Return the term codes that already have a row in courses/terms.jsonl."""
+    target = os.path.join(COURSES_DIR, 'terms.jsonl')
+    if not os.path.exists(target):
+        return set()
+    return {record.get('term') for record in jsonl_codec.iter_jsonl(target)}
+
+
 def merge_course_terms_index_atomic(successful_terms):
     """Publish complete term rows without dropping last-known-good entries."""
     if not successful_terms:
@@ -416,12 +420,9 @@ def merge_course_terms_index_atomic(successful_terms):
     target = os.path.join(COURSES_DIR, 'terms.jsonl')
     merged = {}
     if os.path.exists(target):
-        with open(target, 'r', encoding='utf-8') as fh:
-            for line_number, line in enumerate(fh, 1):
-                if not line.strip():
-                    continue
+        try:
+            for line_number, record in jsonl_codec.iter_jsonl_numbered(target):
                 try:
-                    record = json.loads(line)
                     term = validate_suis_term_code(record.get('term'))
                     majors = record.get('majors')
                     if not isinstance(majors, list) or not majors or not all(
@@ -435,6 +436,10 @@ def merge_course_terms_index_atomic(successful_terms):
                         f'Invalid course term index row {line_number}: {exc}'
                     ) from exc
                 merged[term] = record
+        except jsonl_codec.JsonlDecodeError as exc:
+            raise ValueError(
+                f'Invalid course term index row {exc.line_no}: {exc.error}'
+            ) from exc.error
 
     for raw_term, raw_majors in successful_terms.items():
         term = validate_suis_term_code(raw_term)
@@ -457,8 +462,7 @@ def merge_course_terms_index_atomic(successful_terms):
             delete=False,
         ) as fh:
             temp_path = fh.name
-            for term in sorted(merged):
-                fh.write(json.dumps(merged[term], ensure_ascii=False) + "\n")
+            jsonl_codec.write_rows(fh, (merged[term] for term in sorted(merged)))
             fh.flush()
             os.fsync(fh.fileno())
         os.replace(temp_path, target)
@@ -471,7 +475,7 @@ def merge_course_terms_index_atomic(successful_terms):
 
 
 def main():
-    global _net_semaphore, _http_timeout_s, _http_retries, _http_backoff_s, _http_sleep_s
+    global _client, _work_pool, _parse_pool
 
     parser = argparse.ArgumentParser(description="Fetch and regenerate course catalogs.")
     parser.add_argument("--workers", type=int, default=6, help="Parallel workers for fetching programs.")
@@ -481,6 +485,13 @@ def main():
         default=6,
         help="Maximum simultaneous HTTP requests (helps avoid throttling).",
     )
+    parser.add_argument("--adaptive", action="store_true", help="Treat --max-inflight as a ceiling and adapt the in-flight limit to SUIS latency and errors (AIMD).")
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse p_list_courses pages in N worker processes instead of the fetch threads (0 = parse inline).",
+    )
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds.")
     parser.add_argument("--retries", type=int, default=2, help="Retry count for HTTP errors.")
     parser.add_argument("--backoff", type=float, default=0.5, help="Base backoff seconds for retries (exponential).")
@@ -490,13 +501,26 @@ def main():
     parser.add_argument("--max-programs", type=int, default=0, help="Limit number of programs per term (debug).")
     parser.add_argument("--skip-minors", action="store_true", help="Skip fetching minor catalogs/requirements.")
     parser.add_argument("--skip-coursepages", action="store_true", help="Skip running scrape_coursepages.py after fetching.")
+    parser.add_argument(
+        "--with-requirements",
+        action="store_true",
+        help="Also write requirements/<term>.jsonl from the same degree pages (replaces a separate fetch_requirements.py run).",
+    )
+    parser.add_argument("--freeze-age", type=int, default=0, help="Skip generated terms at least this many terms older than the current one once they are published (0 = never).")
+    parser.add_argument("--frozen-terms", default="", help="Comma-separated term codes to skip once published, regardless of age.")
+    parser.add_argument("--audit", action="store_true", help="Ignore --freeze-age/--frozen-terms and re-verify every generated term.")
+    add_archive_arguments(parser)
+    add_parse_cache_arguments(parser)
     args = parser.parse_args()
 
-    _http_timeout_s = float(args.timeout)
-    _http_retries = int(args.retries)
-    _http_backoff_s = float(args.backoff)
-    _http_sleep_s = float(args.sleep)
-    _net_semaphore = threading.Semaphore(max(1, int(args.max_inflight)))
+    _client = SuisClient(
+        timeout_s=float(args.timeout),
+        retry=RetryPolicy(retries=int(args.retries), backoff_s=float(args.backoff)),
+        max_inflight=max(1, int(args.max_inflight)),
+        adaptive=bool(args.adaptive),
+        sleep_s=float(args.sleep),
+        archive=archive_from_args(args),
+    )
 
     os.makedirs(COURSES_DIR, exist_ok=True)
 
@@ -506,6 +530,20 @@ def main():
         # Generate terms dynamically (same date rules as the web app) so we do
         # not have to bump a hard-coded year cap each year.
         terms = [validate_suis_term_code(t) for t in generate_terms(start_year=2019)]
+        if not args.audit:
+            # Old admit-term catalogs almost never change; nightly runs skip
+            # frozen terms that are already published and audits re-verify them.
+            published = published_course_terms()
+            if args.with_requirements:
+                published &= fetch_requirements.published_requirement_terms()
+            terms, frozen = split_frozen_terms(
+                terms,
+                freeze_age=args.freeze_age,
+                frozen_terms=[validate_suis_term_code(t) for t in args.frozen_terms.split(",") if t.strip()],
+                published=published,
+            )
+            if frozen:
+                print(f"Skipping {len(frozen)} frozen terms ({frozen[0]}..{frozen[-1]}); run with --audit to re-verify them.")
 
     if args.max_terms and args.max_terms > 0:
         terms = terms[: int(args.max_terms)]
@@ -521,55 +559,116 @@ def main():
 
     majors_by_term = {}
     failed_terms = []
+    failed_requirement_terms = []
+    with_requirements = bool(args.with_requirements)
 
     workers = max(1, int(args.workers))
     program_items = list(PROGRAM_FILES.items())
     if args.max_programs and args.max_programs > 0:
         program_items = program_items[: int(args.max_programs)]
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-        for term in terms:
-            term_dir = os.path.join(COURSES_DIR, term)
-            os.makedirs(term_dir, exist_ok=True)
-            majors_found = []
-
-            futures = {}
-            for code, fname in program_items:
-                if code not in programs:
-                    continue
-                futures[executor.submit(crawl_program, code, term)] = (code, fname)
-
+    def finish_term(term, majors_found, expected):
+        if len(majors_found) == expected and majors_found:
+            # Keep deterministic output regardless of thread completion order.
+            majors_by_term[term] = sorted(set(majors_found))
+            # Publish complete rows as soon as each term finishes. Existing
+            # unrequested and failed term rows remain last-known-good, and
+            # the merged index is replaced atomically.
+            if not args.max_programs:
+                merge_course_terms_index_atomic({term: majors_by_term[term]})
+                print(f"Published course term index row for {term}")
+        else:
+            failed_terms.append(term)
+            print(
+                f"Incomplete catalog refresh for {term}: "
+                f"accepted {len(majors_found)}/{expected} programs; "
+                "preserving the existing term index."
+            )
+
+    def publish_term_catalog(term, rows_by_major):
+        # The term's catalog store is the source of truth; only the views of
+        # programs crawled now are rewritten, the rest stay last-known-good.
+        if not rows_by_major:
+            return
+        stats = jsonl_codec.WriteStats()
+        catalog_store.publish_programs(COURSES_DIR, term, rows_by_major, stats=stats)
+        records = sum(len(rows) for rows in rows_by_major.values())
+        print(f"Published {len(rows_by_major)} program views for term {term} ({records} records): {stats}")
+
+    def finish_requirements(term, records):
+        # A partial term never replaces the published requirements file, and
+        # program-limited debug runs cannot form a complete one.
+        if args.max_programs:
+            return
+        try:
+            os.makedirs(fetch_requirements.REQUIREMENTS_DIR, exist_ok=True)
+            fetch_requirements.write_requirements_term_atomic(term, records)
+            print(f"Wrote complete requirements for {term} ({len(records)} programs).")
+        except Exception as e:
+            failed_requirement_terms.append(term)
+            print(f"Failed to publish requirements for {term}: {e}; the existing requirements file was preserved.")
+
+    # One prioritized queue for every (term, program) crawl and its follow-up
+    # p_list_courses fetches: earlier terms first, list pages of in-progress
+    # crawls before new crawls, so workers never idle on a term boundary.
+    futures = {}
+    expected_by_term = {}
+    majors_found_by_term = {}
+    rows_by_term = {}
+    requirements_by_term = {}
+    crawl = crawl_degree_page if with_requirements else crawl_program
+    with PriorityWorkPool(workers) as pool:
+        _work_pool = pool
+        _parse_pool = ParsePool(args.parse_processes, cache=parse_cache_from_args(args))
+        try:
+            for term in terms:
+                os.makedirs(os.path.join(COURSES_DIR, term), exist_ok=True)
+                majors_found_by_term[term] = []
+                rows_by_term[term] = {}
+                requirements_by_term[term] = {}
+                expected_by_term[term] = 0
+                for program_index, (code, fname) in enumerate(program_items):
+                    if code not in programs:
+                        continue
+                    future = pool.submit(_program_priority(term, program_index), crawl, code, term)
+                    futures[future] = (term, code, fname)
+                    expected_by_term[term] += 1
+                if not expected_by_term[term]:
+                    finish_term(term, [], 0)
+
+            remaining = dict(expected_by_term)
             for future in concurrent.futures.as_completed(futures):
-                code, fname = futures[future]
+                term, code, fname = futures[future]
                 try:
                     data = future.result()
+                    if with_requirements:
+                        data, requirement = data
+                        if isinstance(requirement, Exception):
+                            print(f"Failed requirements {code} {term}: {requirement}")
+                        else:
+                            major = fetch_requirements.PROGRAM_CODES.get(code, code)
+                            requirements_by_term[term][major] = requirement
                     if not data:
                         raise ValueError('no data parsed')
                 except Exception as e:
                     print(f"Failed {code} {term}: {e}")
-                    continue
-                majors_found.append(os.path.splitext(fname)[0])
-                with open(os.path.join(term_dir, fname), 'w', encoding='utf-8') as f:
-                    for rec in data:
-                        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-                print(f"Updated {fname} for term {term} with {len(data)} records")
-
-            if len(majors_found) == len(futures) and majors_found:
-                # Keep deterministic output regardless of thread completion order.
-                majors_by_term[term] = sorted(set(majors_found))
-            else:
-                failed_terms.append(term)
-                print(
-                    f"Incomplete catalog refresh for {term}: "
-                    f"accepted {len(majors_found)}/{len(futures)} programs; "
-                    "preserving the existing term index."
-                )
-
-    # Publish only complete rows. Existing unrequested and failed term rows
-    # remain last-known-good, and the merged manifest is replaced atomically.
-    if majors_by_term and not args.max_programs:
-        merge_course_terms_index_atomic(majors_by_term)
-    else:
+                else:
+                    major = os.path.splitext(fname)[0]
+                    majors_found_by_term[term].append(major)
+                    rows_by_term[term][major] = data
+                remaining[term] -= 1
+                if remaining[term] == 0:
+                    publish_term_catalog(term, rows_by_term.pop(term))
+                    finish_term(term, majors_found_by_term[term], expected_by_term[term])
+                    if with_requirements:
+                        finish_requirements(term, requirements_by_term.pop(term))
+        finally:
+            _work_pool = None
+            _parse_pool.shutdown()
+            _parse_pool = ParsePool()
+            _client.save_archive()
+
+    if not majors_by_term or args.max_programs:
         print("No complete term rows to publish; preserving the existing term index.")
 
     if failed_terms:
@@ -579,6 +678,13 @@ def main():
         )
         return 1
 
+    if failed_requirement_terms:
+        print(
+            "Requirement refresh failed for: " + ", ".join(failed_requirement_terms)
+            + ". No incomplete term file was published."
+        )
+        return 1
+
     if not args.skip_minors:
         # Fetch minor catalogs + requirements. By default we only fetch the
         # same term set as majors (either the explicit --terms list, or the
@@ -590,7 +696,7 @@ def main():
                 # minors scraping is an additional N requests per term.
                 minor_workers = min(max(1, int(args.workers)), 3)
                 minor_max_inflight = min(max(1, int(args.max_inflight)), 3)
-                minor_sleep = max(float(_http_sleep_s or 0.0), 0.05 if len(minor_terms) > 1 else 0.0)
+                minor_sleep = max(float(args.sleep or 0.0), 0.05 if len(minor_terms) > 1 else 0.0)
                 print("\nRunning fetch_minors.py to update minor catalogs/requirements...\n")
                 subprocess.run(
                     [
@@ -599,12 +705,12 @@ def main():
                         '--terms', ",".join(minor_terms),
                         '--workers', str(minor_workers),
                         '--max-inflight', str(minor_max_inflight),
-                        '--timeout', str(_http_timeout_s),
-                        '--retries', str(_http_retries),
-                        '--backoff', str(_http_backoff_s),
+                        '--timeout', str(float(args.timeout)),
+                        '--retries', str(int(args.retries)),
+                        '--backoff', str(float(args.backoff)),
                         '--sleep', str(minor_sleep),
                         '--write-legacy',
-                    ],
+                    ] + (['--adaptive'] if args.adaptive else []) + archive_cli_args(args) + parse_cache_cli_args(args),
                     check=True
                 )
         except Exception as e:
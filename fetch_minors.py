@@ -1,21 +1,23 @@
 import argparse
-import json
 import os
 import re
-import random
 import shutil
 import tempfile
-import threading
-import time
 import concurrent.futures
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
+import jsonl_codec
+from area_codes import MINOR_AREA
+from degree_page_index import DegreePageIndex
+from parse_cache import add_parse_cache_arguments, cached_parser, parse_cache_from_args
+from suis_archive import add_archive_arguments, archive_from_args
+from suis_http import RetryPolicy, SuisClient
 from suis_page_validation import require_matching_admit_term, validate_suis_term_code
+from work_queue import ParsePool
 
 BASE = "https://suis.sabanciuniv.edu/prod/"
 LIST_URL = BASE + "SU_DEGREE.p_list_degree?P_LEVEL=UG&P_LANG=EN&P_PRG_TYPE=MINOR"
@@ -25,13 +27,10 @@ REQUIREMENTS_LEGACY_PATH = os.path.join("requirements", "minors.jsonl")
 REQUIREMENTS_DIR = os.path.join("requirements", "minors")
 REQUIREMENTS_TERMS_MANIFEST = os.path.join(REQUIREMENTS_DIR, "terms.jsonl")
 COURSEPAGE_INFO_PATH = os.path.join("courses", "all_coursepage_info.jsonl")
+# Bump whenever parse_minor_requirements output changes (see parse_cache).
+MINOR_REQUIREMENTS_PARSER_VERSION = 1
 
-_tls = threading.local()
-_net_semaphore = None
-_http_timeout_s = 30.0
-_http_retries = 2
-_http_backoff_s = 0.5
-_http_sleep_s = 0.0
+_client = SuisClient()
 
 
 @dataclass(frozen=True)
@@ -41,36 +40,8 @@ class MinorProgram:
 
 
 def fetch_html(url: str, timeout: float = 30.0) -> str:
-    # Use shared retry/throttle settings; keep signature for backward compat.
-    global _http_timeout_s
-    if timeout:
-        _http_timeout_s = float(timeout)
-    sess = getattr(_tls, "session", None)
-    if sess is None:
-        sess = requests.Session()
-        sess.headers.update({"User-Agent": "surriculum-fetch/1.0 (+https://github.com/beficent/surriculum)"})
-        _tls.session = sess
-
-    last_err = None
-    attempts = max(0, int(_http_retries)) + 1
-    for attempt in range(attempts):
-        try:
-            if _net_semaphore is None:
-                resp = sess.get(url, timeout=_http_timeout_s)
-            else:
-                with _net_semaphore:
-                    resp = sess.get(url, timeout=_http_timeout_s)
-            resp.raise_for_status()
-            if _http_sleep_s and _http_sleep_s > 0:
-                time.sleep(_http_sleep_s)
-            return resp.text
-        except Exception as e:
-            last_err = e
-            if attempt >= attempts - 1:
-                raise
-            sleep_for = float(_http_backoff_s) * (2**attempt) + random.uniform(0, 0.25)
-            time.sleep(sleep_for)
-    raise last_err
+    # Shared client settings come from main(); keep signature for backward compat.
+    return _client.get_text(url, timeout_s=float(timeout) if timeout else None)
 
 
 def load_coursepage_credit_lookup(path: str = COURSEPAGE_INFO_PATH) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
@@ -78,28 +49,20 @@ def load_coursepage_credit_lookup(path: str = COURSEPAGE_INFO_PATH) -> Dict[str,
     if not os.path.exists(path):
         return out
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = (line or "").strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except Exception:
-                    continue
-                course_id = str(rec.get("course_id") or "").strip().upper().replace(" ", "")
-                if not course_id:
-                    subj = str(rec.get("subj_code") or "").strip().upper()
-                    numb = str(rec.get("crse_numb") or "").strip().upper()
-                    if subj and numb:
-                        course_id = f"{subj}{numb}"
-                if not course_id:
-                    continue
-                eng = rec.get("engineering")
-                bs = rec.get("basic_science")
-                eng_val = float(eng) if isinstance(eng, (int, float)) else None
-                bs_val = float(bs) if isinstance(bs, (int, float)) else None
-                out[course_id] = (eng_val, bs_val)
+        for rec in jsonl_codec.iter_jsonl(path, skip_invalid=True):
+            course_id = str(rec.get("course_id") or "").strip().upper().replace(" ", "")
+            if not course_id:
+                subj = str(rec.get("subj_code") or "").strip().upper()
+                numb = str(rec.get("crse_numb") or "").strip().upper()
+                if subj and numb:
+                    course_id = f"{subj}{numb}"
+            if not course_id:
+                continue
+            eng = rec.get("engineering")
+            bs = rec.get("basic_science")
+            eng_val = float(eng) if isinstance(eng, (int, float)) else None
+            bs_val = float(bs) if isinstance(bs, (int, float)) else None
+            out[course_id] = (eng_val, bs_val)
     except Exception:
         return {}
     return out
@@ -110,23 +73,15 @@ def load_existing_minor_credit_lookup(path: str) -> Dict[str, Tuple[Optional[flo
     if not os.path.exists(path):
         return out
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = (line or "").strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except Exception:
-                    continue
-                course_id = f"{str(rec.get('Major') or '').strip().upper()}{str(rec.get('Code') or '').strip().upper()}"
-                if not course_id:
-                    continue
-                eng = rec.get("Engineering")
-                bs = rec.get("Basic_Science")
-                eng_val = float(eng) if isinstance(eng, (int, float)) else None
-                bs_val = float(bs) if isinstance(bs, (int, float)) else None
-                out[course_id] = (eng_val, bs_val)
+        for rec in jsonl_codec.iter_jsonl(path, skip_invalid=True):
+            course_id = f"{str(rec.get('Major') or '').strip().upper()}{str(rec.get('Code') or '').strip().upper()}"
+            if not course_id:
+                continue
+            eng = rec.get("Engineering")
+            bs = rec.get("Basic_Science")
+            eng_val = float(eng) if isinstance(eng, (int, float)) else None
+            bs_val = float(bs) if isinstance(bs, (int, float)) else None
+            out[course_id] = (eng_val, bs_val)
     except Exception:
         return {}
     return out
@@ -155,6 +110,84 @@ def enrich_minor_course_credits(
     return courses
 
 
+class MinorPage:
+    """One SUIS minor page (degree detail or linked ``p_list_courses``), parsed once.
+
+    The admit-term check, the requirement summary and the course lists all
+    read :attr:`soup` and the indexes below, which are built on first use
+    instead of once per consumer.  A page pickles as its HTML only, so it can
+    be handed to a :class:`work_queue.ParsePool` worker.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        self._soup: Optional[BeautifulSoup] = None
+        self._index: Optional[DegreePageIndex] = None
+        self._category_anchors: Optional[List[Tuple[str, Any]]] = None
+        self._list_links: Optional[List[Tuple[str, str]]] = None
+
+    @classmethod
+    def of(cls, page: Union[str, "MinorPage"]) -> "MinorPage":
+        return page if isinstance(page, MinorPage) else cls(page)
+
+    def __getstate__(self) -> Dict[str, str]:
+        return {"html": self.html}
+
+    def __setstate__(self, state: Dict[str, str]) -> None:
+        self.__init__(state["html"])
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+    @property
+    def index(self) -> DegreePageIndex:
+        if self._index is None:
+            self._index = DegreePageIndex(self.soup)
+        return self._index
+
+    @property
+    def category_anchors(self) -> List[Tuple[str, Any]]:
+        """``(category, anchor)`` for every ``<a name>`` that names a course category."""
+        if self._category_anchors is None:
+            self._category_anchors = []
+            for a in self.index.anchors:
+                category = map_anchor_to_category(a.get("name") or "")
+                if category:
+                    self._category_anchors.append((category, a))
+        return self._category_anchors
+
+    def course_table_after(self, anchor) -> Optional[Any]:
+        return _find_course_table_after(anchor, self.index)
+
+    @property
+    def list_links(self) -> List[Tuple[str, str]]:
+        """Distinct ``(category, href)`` links to separate ``p_list_courses`` pages."""
+        if self._list_links is None:
+            self._list_links = []
+            seen = set()
+            for a in self.soup.select('a[href*="SU_DEGREE.p_list_courses"]'):
+                href = (a.get("href") or "").strip()
+                if not href:
+                    continue
+                area_code = ""
+                try:
+                    area_code = (parse_qs(urlparse(href).query).get("P_AREA", [""])[0] or "").strip()
+                except Exception:
+                    area_code = ""
+                category = _guess_linked_category(area_code, a.get_text(" ", strip=True))
+                if not category:
+                    continue
+                key = (category, href)
+                if key in seen:
+                    continue
+                seen.add(key)
+                self._list_links.append(key)
+        return self._list_links
+
+
 def parse_minor_list(html: str) -> List[MinorProgram]:
     soup = BeautifulSoup(html, "lxml")
     out: List[MinorProgram] = []
@@ -173,49 +206,30 @@ def parse_minor_list(html: str) -> List[MinorProgram]:
 
 
 def map_anchor_to_category(name_attr: str) -> Optional[str]:
-    if not name_attr:
-        return None
-    # Minor pages use the same anchor suffixes as majors.
-    if name_attr.endswith("_REQ") or "_PHL" in name_attr or "_MEL" in name_attr:
-        return "required"
-    # Some minors use a generic "_ELEC" section name for electives.
-    # In the summary table this typically corresponds to "Core" (or equivalent)
-    # elective requirements, so we map it to "core".
-    if name_attr.endswith("_ELEC"):
-        return "core"
-    if name_attr.endswith("_CEL") or "_COR" in name_attr or "_CE1" in name_attr or "_C1" in name_attr or "_CE2" in name_attr or "_C2" in name_attr:
-        return "core"
-    if name_attr.endswith("_ARE") or name_attr.endswith("_AEL"):
-        return "area"
-    if name_attr.endswith("_FRE") or name_attr.endswith("_FEL"):
-        return "free"
-    if name_attr == "UC_FENS" or name_attr == "UC_FASS":
-        return "university"
-    return None
+    # Minor pages use the same anchor suffixes as majors (see area_codes).
+    return MINOR_AREA(name_attr or "")
 
 
-def _find_course_table_after(anchor) -> Optional[BeautifulSoup]:
+def _find_course_table_after(anchor, index: DegreePageIndex) -> Optional[BeautifulSoup]:
     # Look for the first table after the anchor that looks like a course table.
     # Some category description tables contain "(N courses)" which would
     # falsely match simple text heuristics, so we require real <th> headers.
-    cur = anchor
-    for _ in range(40):
-        cur = cur.find_next()
-        if not cur:
-            break
-        if getattr(cur, "name", None) != "table":
-            continue
-        ths = [th.get_text(" ", strip=True).lower() for th in cur.find_all("th")]
-        if not ths:
-            continue
-        has_course = any("course" == t or t.startswith("course ") or " course" in t for t in ths)
-        has_su = any("su" in t and "credit" in t for t in ths)
-        has_ects = any("ects" in t for t in ths)
-        if has_course and has_su and has_ects:
-            return cur
+    for table in index.following(anchor, "table", window=40):
+        if index.feature(table, "minor_course_table", _is_course_table):
+            return table
     return None
 
 
+def _is_course_table(table) -> bool:
+    ths = [th.get_text(" ", strip=True).lower() for th in table.find_all("th")]
+    if not ths:
+        return False
+    has_course = any("course" == t or t.startswith("course ") or " course" in t for t in ths)
+    has_su = any("su" in t and "credit" in t for t in ths)
+    has_ects = any("ects" in t for t in ths)
+    return has_course and has_su and has_ects
+
+
 def parse_course_rows(table, category: str) -> List[Dict]:
     rows: List[Dict] = []
     # These pages often omit <tbody>, so do not depend on tbody selectors.
@@ -252,10 +266,9 @@ def parse_course_rows(table, category: str) -> List[Dict]:
     return rows
 
 
-def parse_course_rows_from_html(html: str, category: str) -> List[Dict]:
-    soup = BeautifulSoup(html, "lxml")
+def parse_course_rows_from_html(html: Union[str, MinorPage], category: str) -> List[Dict]:
     out: List[Dict] = []
-    for table in soup.find_all("table"):
+    for table in MinorPage.of(html).soup.find_all("table"):
         parsed = parse_course_rows(table, category)
         if parsed:
             out.extend(parsed)
@@ -344,20 +357,16 @@ def _load_linked_course_page_html(
 
 
 def parse_minor_courses(
-    html: str,
+    html: Union[str, MinorPage],
     program: Optional[str] = None,
     offline_dir: Optional[str] = None,
     timeout: float = 30.0,
 ) -> List[Dict]:
-    soup = BeautifulSoup(html, "lxml")
+    page = MinorPage.of(html)
     results: List[Dict] = []
     seen = set()
-    for a in soup.select("a[name]"):
-        name_attr = a.get("name") or ""
-        category = map_anchor_to_category(name_attr)
-        if not category:
-            continue
-        table = _find_course_table_after(a)
+    for category, a in page.category_anchors:
+        table = page.course_table_after(a)
         if not table:
             continue
         for rec in parse_course_rows(table, category):
@@ -368,39 +377,27 @@ def parse_minor_courses(
             results.append(rec)
 
     # Some minors place category lists (currently mostly area electives) on a
-    # separate `SU_DEGREE.p_list_courses` page. Follow these links as well.
-    linked_targets: List[Tuple[str, str]] = []
-    linked_seen = set()
-    for a in soup.select('a[href*="SU_DEGREE.p_list_courses"]'):
-        href = (a.get("href") or "").strip()
-        if not href:
-            continue
-        area_code = ""
-        try:
-            area_code = (parse_qs(urlparse(href).query).get("P_AREA", [""])[0] or "").strip()
-        except Exception:
-            area_code = ""
-        category = _guess_linked_category(area_code, a.get_text(" ", strip=True))
-        if not category:
-            continue
-        key = (category, href)
-        if key in linked_seen:
-            continue
-        linked_seen.add(key)
-        linked_targets.append(key)
-
-    for category, href in linked_targets:
-        try:
-            linked_html = _load_linked_course_page_html(
-                href=href,
-                program=program or "",
-                category=category,
-                offline_dir=offline_dir,
-                timeout=timeout,
-            )
-        except Exception:
+    # separate `SU_DEGREE.p_list_courses` page. Follow these links as well;
+    # a page linked under two categories is loaded and parsed once.
+    linked_pages: Dict[str, Optional[MinorPage]] = {}
+    for category, href in page.list_links:
+        if href not in linked_pages:
+            try:
+                linked_pages[href] = MinorPage(
+                    _load_linked_course_page_html(
+                        href=href,
+                        program=program or "",
+                        category=category,
+                        offline_dir=offline_dir,
+                        timeout=timeout,
+                    )
+                )
+            except Exception:
+                linked_pages[href] = None
+        linked_page = linked_pages[href]
+        if linked_page is None:
             continue
-        for rec in parse_course_rows_from_html(linked_html, category):
+        for rec in parse_course_rows_from_html(linked_page, category):
             cid = f"{rec['Major']}{rec['Code']}"
             if cid in seen:
                 continue
@@ -414,8 +411,9 @@ def _extract_int(text: str) -> int:
     return int(m.group(0)) if m else 0
 
 
-def parse_minor_requirements(html: str) -> Dict:
-    soup = BeautifulSoup(html, "lxml")
+@cached_parser(MINOR_REQUIREMENTS_PARSER_VERSION)
+def parse_minor_requirements(html: Union[str, MinorPage]) -> Dict:
+    soup = MinorPage.of(html).soup
     out: Dict = {"categories": {}}
 
     # Term name (e.g., "Spring 2025-2026")
@@ -497,18 +495,18 @@ def parse_minor_requirements(html: str) -> Dict:
     return out
 
 
-def load_minor_detail_html(program: str, term: Optional[str], offline_dir: Optional[str], timeout: float) -> str:
+def load_minor_detail_page(program: str, term: Optional[str], offline_dir: Optional[str], timeout: float) -> MinorPage:
     if offline_dir:
         base = program.split("-")[0].lower()
         fname = f"SU_DEGREE.p_degree_detail_{base}.html"
         path = os.path.join(offline_dir, fname)
         if os.path.exists(path):
             with open(path, "r", encoding="utf-8") as f:
-                html = f.read()
+                page = MinorPage(f.read())
             if term:
                 term = validate_suis_term_code(term)
-                require_matching_admit_term(BeautifulSoup(html, "lxml"), term)
-            return html
+                require_matching_admit_term(page.soup, term)
+            return page
 
     # Online: if term is not provided, fall back to the latest term exposed.
     if not term:
@@ -524,13 +522,9 @@ def load_minor_detail_html(program: str, term: Optional[str], offline_dir: Optio
         BASE
         + "SU_DEGREE.p_degree_detail?P_PROGRAM={p}&P_LANG=EN&P_LEVEL=UG&P_TERM={t}&P_SUBMIT=Select"
     ).format(p=program, t=term)
-    html = fetch_html(detail_url, timeout=timeout)
-    require_matching_admit_term(BeautifulSoup(html, "lxml"), term)
-    return html
-
-
-def _jsonl_text(records: List[Dict]) -> str:
-    return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    page = MinorPage(fetch_html(detail_url, timeout=timeout))
+    require_matching_admit_term(page.soup, term)
+    return page
 
 
 def _load_minor_requirement_records(path: str) -> Dict[str, Dict]:
@@ -538,21 +532,16 @@ def _load_minor_requirement_records(path: str) -> Dict[str, Dict]:
     records: Dict[str, Dict] = {}
     if not os.path.exists(path):
         return records
-    with open(path, "r", encoding="utf-8") as req_in:
-        for line_number, line in enumerate(req_in, start=1):
-            line = (line or "").strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except Exception as exc:
-                raise ValueError(f"invalid JSON on line {line_number} of {path}") from exc
+    try:
+        for line_number, record in jsonl_codec.iter_jsonl_numbered(path):
             if not isinstance(record, dict) or not str(record.get("minor") or "").strip():
                 raise ValueError(f"invalid minor requirement record on line {line_number} of {path}")
             program = str(record["minor"]).strip()
             if program in records:
                 raise ValueError(f"duplicate minor {program} in {path}")
             records[program] = record
+    except jsonl_codec.JsonlDecodeError as exc:
+        raise ValueError(f"invalid JSON on line {exc.line_no} of {path}") from exc
     return records
 
 
@@ -560,19 +549,14 @@ def _load_minor_terms_manifest(path: str) -> set[str]:
     terms: set[str] = set()
     if not os.path.exists(path):
         return terms
-    with open(path, "r", encoding="utf-8") as manifest_in:
-        for line_number, line in enumerate(manifest_in, start=1):
-            line = (line or "").strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except Exception as exc:
-                raise ValueError(f"invalid JSON on line {line_number} of {path}") from exc
+    try:
+        for line_number, record in jsonl_codec.iter_jsonl_numbered(path):
             term = record.get("term") if isinstance(record, dict) else None
             if not term or not re.fullmatch(r"\d{6}", str(term)):
                 raise ValueError(f"invalid minor term record on line {line_number} of {path}")
             terms.add(str(term))
+    except jsonl_codec.JsonlDecodeError as exc:
+        raise ValueError(f"invalid JSON on line {exc.line_no} of {path}") from exc
     return terms
 
 
@@ -649,23 +633,31 @@ def main():
     parser.add_argument("--programs", default="", help="Comma-separated minor program codes to fetch (e.g. PHYS-MINOR,MATH-MINOR).")
     parser.add_argument("--workers", type=int, default=6, help="Parallel workers for fetching minors (per term).")
     parser.add_argument("--max-inflight", type=int, default=6, help="Maximum simultaneous HTTP requests (helps avoid throttling).")
+    parser.add_argument("--adaptive", action="store_true", help="Treat --max-inflight as a ceiling and adapt the in-flight limit to SUIS latency and errors (AIMD).")
     parser.add_argument("--retries", type=int, default=2, help="Retry count for HTTP errors.")
     parser.add_argument("--backoff", type=float, default=0.5, help="Base backoff seconds for retries (exponential).")
     parser.add_argument("--sleep", type=float, default=0.0, help="Optional sleep after each successful request.")
     parser.add_argument("--max-programs", type=int, default=0, help="Limit number of minors processed (debug).")
     parser.add_argument("--write-legacy", action="store_true", help="Also write legacy snapshot files under courses/minors/ and requirements/minors.jsonl.")
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout in seconds.")
+    parser.add_argument("--parse-processes", type=int, default=0, help="Parse minor requirement summaries in N worker processes instead of the fetch threads (0 = parse inline).")
+    add_archive_arguments(parser)
+    add_parse_cache_arguments(parser)
     args = parser.parse_args()
 
-    global _net_semaphore, _http_timeout_s, _http_retries, _http_backoff_s, _http_sleep_s
+    global _client
     offline_dir = args.offline_dir.strip() or None
     timeout = float(args.timeout)
-    _http_timeout_s = timeout
-    _http_retries = int(args.retries)
-    _http_backoff_s = float(args.backoff)
-    _http_sleep_s = float(args.sleep)
-    _net_semaphore = threading.Semaphore(max(1, int(args.max_inflight)))
+    _client = SuisClient(
+        timeout_s=timeout,
+        retry=RetryPolicy(retries=int(args.retries), backoff_s=float(args.backoff)),
+        max_inflight=max(1, int(args.max_inflight)),
+        adaptive=bool(args.adaptive),
+        sleep_s=float(args.sleep),
+        archive=archive_from_args(args),
+    )
     workers = max(1, int(args.workers))
+    parse_pool = ParsePool(args.parse_processes, cache=parse_cache_from_args(args))
 
     os.makedirs(COURSES_DIR, exist_ok=True)
     os.makedirs(REQUIREMENTS_DIR, exist_ok=True)
@@ -762,8 +754,8 @@ def main():
         failures: List[Tuple[str, str]] = []
 
         def _worker(prog: MinorProgram):
-            detail_html = load_minor_detail_html(prog.program, None if is_offline else term, offline_dir, timeout)
-            req = parse_minor_requirements(detail_html)
+            detail_page = load_minor_detail_page(prog.program, None if is_offline else term, offline_dir, timeout)
+            req = parse_pool.parse(parse_minor_requirements, detail_page)
             rec = {
                 "minor": prog.program,
                 "name": prog.name,
@@ -771,7 +763,7 @@ def main():
                 **req,
             }
             courses = parse_minor_courses(
-                detail_html,
+                detail_page,
                 program=prog.program,
                 offline_dir=offline_dir,
                 timeout=timeout,
@@ -807,7 +799,7 @@ def main():
                 req_records[program] = record
 
             publication: Dict[str, str] = {
-                req_path: _jsonl_text([req_records[program] for program in sorted(req_records)])
+                req_path: jsonl_codec.jsonl_text([req_records[program] for program in sorted(req_records)])
             }
 
             for minor in minors:
@@ -819,7 +811,7 @@ def main():
                     existing_lookup=load_existing_minor_credit_lookup(course_path),
                 )
                 results[minor.program] = (_record, courses)
-                publication[course_path] = _jsonl_text(courses)
+                publication[course_path] = jsonl_codec.jsonl_text(courses)
 
             if write_legacy_here:
                 if subset_mode:
@@ -828,17 +820,17 @@ def main():
                         legacy_req_records[program] = record
                 else:
                     legacy_req_records = req_records
-                publication[REQUIREMENTS_LEGACY_PATH] = _jsonl_text(
+                publication[REQUIREMENTS_LEGACY_PATH] = jsonl_codec.jsonl_text(
                     [legacy_req_records[program] for program in sorted(legacy_req_records)]
                 )
                 for minor in minors:
                     _record, courses = results[minor.program]
-                    publication[os.path.join(COURSES_DIR, f"{minor.program}.jsonl")] = _jsonl_text(courses)
+                    publication[os.path.join(COURSES_DIR, f"{minor.program}.jsonl")] = jsonl_codec.jsonl_text(courses)
 
             if not is_offline and not subset_mode:
                 next_terms = set(existing_terms)
                 next_terms.add(term)
-                publication[REQUIREMENTS_TERMS_MANIFEST] = _jsonl_text(
+                publication[REQUIREMENTS_TERMS_MANIFEST] = jsonl_codec.jsonl_text(
                     [{"term": indexed_term} for indexed_term in sorted(next_terms, key=int, reverse=True)]
                 )
 
@@ -853,6 +845,9 @@ def main():
         for minor in minors:
             print(f"Updated {minor.program} ({label}): {len(results[minor.program][1])} courses")
 
+    parse_pool.shutdown()
+    _client.save_archive()
+
     if failed_terms:
         print(
             "Minor refresh failed for: " + ", ".join(failed_terms)
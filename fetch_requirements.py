@@ -1,5 +1,3 @@
-import json
-import requests
 from bs4 import BeautifulSoup
 import os
 import datetime
@@ -8,7 +6,10 @@ import argparse
 import subprocess
 import tempfile
 
-from term_utils import generate_terms
+import jsonl_codec
+from term_utils import generate_terms, split_frozen_terms
+from suis_archive import add_archive_arguments, archive_cli_args, archive_from_args
+from suis_http import SuisClient
 from suis_page_validation import require_matching_admit_term, validate_suis_term_code
 
 REQUIREMENTS_DIR = 'requirements'
@@ -42,19 +43,7 @@ REQUIREMENT_GROUP_RULES = frozenset({
     'offeringCount', 'advancedCount',
 })
 
-_session = None
-
-
-def _get_session():
-    global _session
-    if _session is None:
-        _session = requests.Session()
-        _session.headers.update(
-            {
-                "User-Agent": "surriculum-fetch/1.0 (+https://github.com/beficent/surriculum)",
-            }
-        )
-    return _session
+_client = SuisClient()
 
 
 def fetch_requirements(program, term, offline_dir=None, timeout_s: float = 30.0):
@@ -80,12 +69,20 @@ def fetch_requirements(program, term, offline_dir=None, timeout_s: float = 30.0)
             BASE +
             'SU_DEGREE.p_degree_detail?P_PROGRAM={p}&P_LANG=EN&P_LEVEL=UG&P_TERM={t}&P_SUBMIT=Select'
         ).format(p=program, t=term)
-        resp = _get_session().get(url, timeout=float(timeout_s or 30.0))
-        resp.raise_for_status()
-        html = resp.text
+        html = _client.get_text(url, timeout_s=float(timeout_s or 30.0))
 
     soup = BeautifulSoup(html, 'lxml')
     require_matching_admit_term(soup, term)
+    return parse_requirements(soup, program)
+
+
+def parse_requirements(soup, program):
+    """Parse the requirement summary out of an already validated degree page.
+
+    ``fetch_courses.py --with-requirements`` calls this on the tree it parsed
+    for the catalog, so each degree page is fetched once for both outputs.
+    """
+
     # Summary table usually has class "t_mezuniyet"; fall back to the first
     # table containing "SUMMARY OF DEGREE" text.
     table = soup.find('table', class_='t_mezuniyet')
@@ -452,6 +449,28 @@ def validate_requirement_record(major, data):
                 raise ValueError('groups contain an unknown or malformed rule')
 
 
+def build_requirement_record(major, data):
+    """Complete a parsed summary into the validated record written per major."""
+    if not data:
+        raise ValueError('no data parsed')
+    data['humRequired'] = hum_required(major, data.get('university'))
+    scraped_pools = data.pop('_pools', None)
+    data.update(special_requirements(major, scraped_pools))
+    validate_requirement_record(major, data)
+    return data
+
+
+def published_requirement_terms():
+    """Return the term codes that already have a requirements/<term>.jsonl file."""
+    if not os.path.isdir(REQUIREMENTS_DIR):
+        return set()
+    return {
+        name[:-len('.jsonl')]
+        for name in os.listdir(REQUIREMENTS_DIR)
+        if re.fullmatch(r'\d{6}\.jsonl', name)
+    }
+
+
 def write_requirements_term_atomic(term, records):
     """Write one complete term without exposing a truncated intermediate file."""
     if set(records) != set(EXPECTED_MAJORS):
@@ -474,8 +493,7 @@ def write_requirements_term_atomic(term, records):
             delete=False,
         ) as fh:
             temp_path = fh.name
-            for major in EXPECTED_MAJORS:
-                fh.write(json.dumps({"major": major, **records[major]}, ensure_ascii=False) + "\n")
+            jsonl_codec.write_rows(fh, ({"major": major, **records[major]} for major in EXPECTED_MAJORS))
             fh.flush()
             os.fsync(fh.fileno())
         os.replace(temp_path, target)
@@ -491,8 +509,16 @@ def main():
     parser.add_argument("--terms", default="", help="Comma-separated explicit term codes (e.g. 202401,202402).")
     parser.add_argument("--max-terms", type=int, default=0, help="Limit number of terms processed (debug).")
     parser.add_argument("--skip-minors", action="store_true", help="Skip fetching minor catalogs/requirements.")
+    parser.add_argument("--freeze-age", type=int, default=0, help="Skip generated terms at least this many terms older than the current one once they are published (0 = never).")
+    parser.add_argument("--frozen-terms", default="", help="Comma-separated term codes to skip once published, regardless of age.")
+    parser.add_argument("--audit", action="store_true", help="Ignore --freeze-age/--frozen-terms and re-verify every generated term.")
+    add_archive_arguments(parser)
     args = parser.parse_args()
 
+    archive = archive_from_args(args)
+    if archive is not None:
+        _client.archive = archive
+
     os.makedirs(REQUIREMENTS_DIR, exist_ok=True)
 
     if args.terms.strip():
@@ -501,6 +527,15 @@ def main():
         # Generate terms dynamically (same date rules as the web app) so we do
         # not have to bump a hard-coded year cap each year.
         terms = [validate_suis_term_code(t) for t in generate_terms(start_year=2019)]
+        if not args.audit:
+            terms, frozen = split_frozen_terms(
+                terms,
+                freeze_age=args.freeze_age,
+                frozen_terms=[validate_suis_term_code(t) for t in args.frozen_terms.split(",") if t.strip()],
+                published=published_requirement_terms(),
+            )
+            if frozen:
+                print(f"Skipping {len(frozen)} frozen terms ({frozen[0]}..{frozen[-1]}); run with --audit to re-verify them.")
 
     if args.max_terms and args.max_terms > 0:
         terms = terms[: int(args.max_terms)]
@@ -512,13 +547,7 @@ def main():
         for prog, major in PROGRAM_CODES.items():
             try:
                 data = fetch_requirements(prog, term, None, timeout_s=args.timeout)
-                if not data:
-                    raise ValueError('no data parsed')
-                data['humRequired'] = hum_required(major, data.get('university'))
-                scraped_pools = data.pop('_pools', None)
-                data.update(special_requirements(major, scraped_pools))
-                validate_requirement_record(major, data)
-                out[major] = data
+                out[major] = build_requirement_record(major, data)
             except Exception as e:
                 failures.append((major, str(e)))
                 print(f"Failed {major} {term}: {e}")
@@ -538,6 +567,8 @@ def main():
             failed_terms.append(term)
             print(f"Failed to publish {term}: {e}; the existing requirements file was preserved.")
 
+    _client.save_archive()
+
     if failed_terms:
         print(
             "Requirement refresh failed for: " + ", ".join(failed_terms) +
@@ -571,7 +602,7 @@ def main():
                     "--sleep",
                     "0.05" if len(terms) > 1 else "0.0",
                     "--write-legacy",
-                ],
+                ] + archive_cli_args(args),
                 check=True,
             )
         except Exception as e:
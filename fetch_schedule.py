@@ -1,17 +1,28 @@
 import argparse
+import collections
+import concurrent.futures
+import copy
+import itertools
 import json
 import re
 import subprocess
 import sys
-import time
+import threading
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-import requests
 from bs4 import BeautifulSoup
-
+from lxml import etree
+
+import jsonl_codec
+import meeting_bitmaps
+from html_text import element_text, first_descendant, has_class
+from parse_cache import add_parse_cache_arguments, cached_parser, parse_cache_from_args
+from suis_archive import add_archive_arguments, archive_cli_args, archive_from_args
+from suis_http import RateLimit, RetryPolicy, SuisClient
 from sync_coursepage_offerings import reconcile_coursepage_offerings
 from term_utils import generate_terms, term_code_from_date, today_in_tz
+from work_queue import ParsePool
 
 
 BASE = "https://suis.sabanciuniv.edu/prod"
@@ -22,6 +33,9 @@ DETAIL_URL = f"{BASE}/bwckschd.p_disp_detail_sched"
 SCHEDULE_DIR = Path("courses") / "schedule"
 SUBJECT_MANIFEST_PATH = Path("courses") / "schedule_subjects.json"
 COURSEPAGE_INFO_PATH = Path("courses") / "all_coursepage_info.jsonl"
+USER_AGENT = "Mozilla/5.0 (compatible; SUrriculum/3.1; +https://github.com/)"
+
+_client = SuisClient(user_agent=USER_AGENT, retry=RetryPolicy(retries=4, backoff_s=1.0))
 
 
 def _parse_float(s: str) -> float:
@@ -31,37 +45,6 @@ def _parse_float(s: str) -> float:
         return 0.0
 
 
-def _clock_to_minutes(token: str) -> Optional[int]:
-    t = str(token).strip().lower()
-    if not t:
-        return None
-    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$", t)
-    if not m:
-        return None
-    hh = int(m.group(1))
-    mm = int(m.group(2) or "0")
-    ap = m.group(3) or ""
-    if ap == "am":
-        if hh == 12:
-            hh = 0
-    elif ap == "pm":
-        if hh != 12:
-            hh += 12
-    return hh * 60 + mm
-
-
-def _parse_time_range_to_minutes(time_str: str) -> Tuple[Optional[int], Optional[int]]:
-    s = str(time_str or "").strip()
-    if not s or re.search(r"\bTBA\b", s, re.I):
-        return None, None
-    parts = [p.strip() for p in s.split("-")]
-    if len(parts) < 2:
-        return None, None
-    start = _clock_to_minutes(parts[0])
-    end = _clock_to_minutes(parts[1])
-    return start, end
-
-
 def _norm_course_id(subj: str, numb: str) -> str:
     return f"{subj}{numb}".upper().replace(" ", "")
 
@@ -176,32 +159,6 @@ def _resolve_terms_to_scrape(
     return [_validate_term_code(current_term, arg_name="current term")]
 
 
-def _fetch_with_retry(
-    sess: requests.Session,
-    method: str,
-    url: str,
-    *,
-    data: Optional[Iterable[Tuple[str, str]]] = None,
-    timeout: float = 30.0,
-    retries: int = 4,
-    backoff_s: float = 1.0,
-) -> str:
-    last_err: Optional[Exception] = None
-    for i in range(retries + 1):
-        try:
-            if method.upper() == "GET":
-                resp = sess.get(url, timeout=timeout)
-            else:
-                resp = sess.post(url, data=data, timeout=timeout)
-            resp.raise_for_status()
-            return resp.text
-        except Exception as e:
-            last_err = e
-            sleep_s = backoff_s * (2**i)
-            time.sleep(min(8.0, sleep_s))
-    raise RuntimeError(f"Failed to fetch {url}: {last_err}")
-
-
 def _parse_subject_codes_from_search(html: str) -> List[str]:
     soup = BeautifulSoup(html, "lxml")
     sel = soup.select_one("select#subj_id")
@@ -277,11 +234,7 @@ def _seed_subject_manifest_from_schedule_files(manifest: Dict[str, Any]) -> None
             continue
         subjects: Set[str] = set()
         try:
-            for line in path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                rec = json.loads(line)
+            for rec in jsonl_codec.iter_jsonl(path):
                 subj = str(rec.get("subject") or "").strip().upper()
                 if subj and re.fullmatch(r"[A-Z0-9]{1,6}", subj):
                     subjects.add(subj)
@@ -392,135 +345,168 @@ def _resolve_subjects_for_term(term: str, manifest: Dict[str, Any], current_term
     return [], ""
 
 
-def _parse_sections_from_listing(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "lxml")
-    sections_table = None
-    for t in soup.select("table.datadisplaytable"):
-        cap = t.find("caption")
-        if cap and "Sections Found" in cap.get_text(" ", strip=True):
-            sections_table = t
-            break
-    if not sections_table:
-        return []
+_SECTION_COURSE_RE = re.compile(r"^([A-Z0-9]+)\s+([0-9]{3,5}[A-Z0-9]?)$")
+_COMPONENT_RE = re.compile(r"\b([A-Za-z]+)\s+Schedule Type\b")
+_CREDITS_RE = re.compile(r"(\d+(?:\.\d+)?)\s+Credits\b")
+_EMPTY_LISTING_MARKERS = ("no classes were found", "no sections found")
+# Bump whenever _parse_listing output changes; --parse-cache entries from
+# older versions are then discarded.
+LISTING_PARSER_VERSION = 1
 
-    # Banner sometimes omits explicit <tbody>. Collect only the rows whose
-    # nearest table ancestor is this "Sections Found" table (exclude nested
-    # meeting-time tables).
-    rows = []
-    for tr in sections_table.find_all("tr"):
-        parent_table = tr.find_parent("table")
-        if parent_table is sections_table:
-            rows.append(tr)
 
-    out: List[Dict[str, Any]] = []
+def _parse_section_header(text: str) -> Optional[Tuple[str, str, str, str]]:
+    # "<title> - <crn> - <SUBJ> <NUMB> - <SECTION>"
+    parts = [p.strip() for p in text.split(" - ")]
+    if len(parts) < 4:
+        return None
+    section = parts[-1]
+    course_part = parts[-2]  # "CS 201" or "CS 201R"
+    crn = parts[-3]
+    title = " - ".join(parts[:-3]).strip()
+    # Course numbers are usually 3 digits (e.g., CS 201 / CS 201R) but some
+    # programs use 4–5 digits (e.g., CS 48004 in the dynamic schedule).
+    m = _SECTION_COURSE_RE.match(course_part.strip().upper())
+    if not m:
+        return None
+    course_id = _norm_course_id(m.group(1), m.group(2))
+    return title, crn, course_id, section
 
-    def parse_header_text(text: str) -> Optional[Tuple[str, str, str, str]]:
-        # "<title> - <crn> - <SUBJ> <NUMB> - <SECTION>"
-        parts = [p.strip() for p in text.split(" - ")]
-        if len(parts) < 4:
-            return None
-        section = parts[-1]
-        course_part = parts[-2]  # "CS 201" or "CS 201R"
-        crn = parts[-3]
-        title = " - ".join(parts[:-3]).strip()
-        # Course numbers are usually 3 digits (e.g., CS 201 / CS 201R) but some
-        # programs use 4–5 digits (e.g., CS 48004 in the dynamic schedule).
-        m = re.match(r"^([A-Z0-9]+)\s+([0-9]{3,5}[A-Z0-9]?)$", course_part.strip().upper())
-        if not m:
-            return None
-        course_id = _norm_course_id(m.group(1), m.group(2))
-        return title, crn, course_id, section
 
-    for i in range(len(rows) - 1):
-        th = rows[i].find("th", class_="ddlabel")
-        if not th:
+def _captioned_table(tables: Iterable[Any], caption: str) -> Any:
+    for table in tables:
+        if not has_class(table, "datadisplaytable"):
+            continue
+        cap = first_descendant(table, "caption")
+        if cap is not None and caption in element_text(cap):
+            return table
+    return None
+
+
+def _own_rows(table: Any) -> Iterator[Any]:
+    """Yield, in document order, the rows whose nearest table ancestor is ``table``.
+
+    Banner sometimes omits explicit <tbody>, and each section's detail cell
+    nests a meeting-time table; those nested rows are skipped without being
+    visited.
+    """
+    stack = list(reversed(table))
+    while stack:
+        el = stack.pop()
+        if not isinstance(el.tag, str) or el.tag == "table":
             continue
-        a = th.find("a")
-        if not a:
+        if el.tag == "tr":
+            yield el
+        stack.extend(reversed(el))
+
+
+def _parse_meetings(detail: Any) -> List[Dict[str, Any]]:
+    meetings: List[Dict[str, Any]] = []
+    mt = _captioned_table(detail.iterdescendants("table"), "Scheduled Meeting Times")
+    if mt is None:
+        return meetings
+    # skip header row(s)
+    for r in itertools.islice(mt.iterdescendants("tr"), 1, None):
+        cols = list(r.iterdescendants("td"))
+        if len(cols) < 7:
             continue
-        header_text = a.get_text(" ", strip=True)
-        parsed = parse_header_text(header_text)
+        time_s = element_text(cols[1])
+        start_min, end_min = meeting_bitmaps.parse_time_range_to_minutes(time_s)
+        meetings.append(
+            {
+                "time": time_s,
+                "days": element_text(cols[2]),
+                "where": element_text(cols[3]),
+                "date_range": element_text(cols[4]),
+                "instructors": element_text(cols[6]),
+                "start_min": start_min,
+                "end_min": end_min,
+            }
+        )
+    return meetings
+
+
+def _iter_listing_sections(root: Any) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per section of a "Sections Found" listing, in page order.
+
+    A section is a ``th.ddlabel`` header row followed by its
+    ``td.dddefault`` detail row; the rows are walked once and each cell's
+    text is built once.
+    """
+    sections_table = _captioned_table(root.iter("table"), "Sections Found")
+    if sections_table is None:
+        return
+
+    header_row = None
+    for row in _own_rows(sections_table):
+        prev, header_row = header_row, row
+        if prev is None:
+            continue
+        th = first_descendant(prev, "th", "ddlabel")
+        if th is None:
+            continue
+        a = first_descendant(th, "a")
+        if a is None:
+            continue
+        parsed = _parse_section_header(element_text(a))
         if not parsed:
             continue
         title, crn, course_id, section = parsed
 
-        td = rows[i + 1].find("td", class_="dddefault")
-        if not td:
+        td = first_descendant(row, "td", "dddefault")
+        if td is None:
             continue
+        detail_text = element_text(td)
 
         # Component like "Lecture Schedule Type" / "Recitation Schedule Type"
-        component = ""
-        comp_m = re.search(r"\b([A-Za-z]+)\s+Schedule Type\b", td.get_text(" ", strip=True))
-        if comp_m:
-            component = comp_m.group(1).strip()
+        comp_m = _COMPONENT_RE.search(detail_text)
+        component = comp_m.group(1).strip() if comp_m else ""
 
         # Credits like "3.000 Credits"
-        credits = 0.0
-        cred_m = re.search(r"(\d+(?:\.\d+)?)\s+Credits\b", td.get_text(" ", strip=True))
-        if cred_m:
-            credits = _parse_float(cred_m.group(1))
-
-        meetings: List[Dict[str, Any]] = []
-        mt = None
-        for t in td.select("table.datadisplaytable"):
-            cap = t.find("caption")
-            if cap and "Scheduled Meeting Times" in cap.get_text(" ", strip=True):
-                mt = t
-                break
-        if mt:
-            mt_rows = mt.select("tr")
-            # skip header row(s)
-            for r in mt_rows[1:]:
-                cols = r.find_all("td")
-                if len(cols) < 7:
-                    continue
-                time_s = cols[1].get_text(" ", strip=True)
-                days_s = cols[2].get_text(" ", strip=True)
-                where_s = cols[3].get_text(" ", strip=True)
-                date_range_s = cols[4].get_text(" ", strip=True)
-                instr_s = cols[6].get_text(" ", strip=True)
-                start_min, end_min = _parse_time_range_to_minutes(time_s)
-                meetings.append(
-                    {
-                        "time": time_s,
-                        "days": days_s,
-                        "where": where_s,
-                        "date_range": date_range_s,
-                        "instructors": instr_s,
-                        "start_min": start_min,
-                        "end_min": end_min,
-                    }
-                )
+        cred_m = _CREDITS_RE.search(detail_text)
+        credits = _parse_float(cred_m.group(1)) if cred_m else 0.0
 
         href = a.get("href") or ""
         if href and href.startswith("/"):
             href = BASE + href
-        out.append(
-            {
-                "course_id": course_id,
-                "title": title,
-                "crn": crn,
-                "section": section,
-                "component": component,
-                "credits": credits,
-                "meetings": meetings,
-                "source_url": href,
-            }
-        )
+        yield {
+            "course_id": course_id,
+            "title": title,
+            "crn": crn,
+            "section": section,
+            "component": component,
+            "credits": credits,
+            "meetings": _parse_meetings(td),
+            "source_url": href,
+        }
 
-    return out
 
+@cached_parser(LISTING_PARSER_VERSION)
+def _parse_listing(html: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """Parse a subject listing once: ``(sections, explicitly_empty)``.
 
-def _is_explicitly_empty_listing(html: str) -> bool:
-    text = BeautifulSoup(html or "", "lxml").get_text(" ", strip=True).lower()
-    return "no classes were found" in text or "no sections found" in text
+    ``explicitly_empty`` is true only for a listing with no sections that
+    carries Banner's "no classes were found" marker, which distinguishes a
+    genuinely empty subject from a truncated or error page.
+    """
+    try:
+        root = etree.HTML(html) if html else None
+    except (ValueError, etree.LxmlError):
+        root = None
+    if root is None:
+        return [], False
+    rows = list(_iter_listing_sections(root))
+    if rows:
+        return rows, False
+    text = element_text(root).lower()
+    return rows, any(marker in text for marker in _EMPTY_LISTING_MARKERS)
+
+
+def _parse_sections_from_listing(html: str) -> List[Dict[str, Any]]:
+    return _parse_listing(html)[0]
 
 
 def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="\n") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    jsonl_codec.write_jsonl(path, rows)
 
 
 def scrape_term_schedule(
@@ -530,15 +516,25 @@ def scrape_term_schedule(
     delay_s: float,
     max_subjects: Optional[int],
     subject_manifest: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    rate: Optional[RateLimit] = None,
+    parse_pool: Optional[ParsePool] = None,
+    stop: Optional[threading.Event] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    sess = requests.Session()
-    sess.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (compatible; SUrriculum/3.1; +https://github.com/)",
-        }
-    )
-
-    dyn_html = _fetch_with_retry(sess, "GET", DYN_SCHED_URL, timeout=timeout)
+    """Scrape one term's class schedule listing, one search POST per subject.
+
+    Subjects are fetched by ``workers`` threads on the same term-bound cookie
+    session; each thread parses its listing while the others wait on SUIS,
+    or hands it to ``parse_pool`` when one is given.
+    ``delay_s`` (or a shared ``rate``) spaces request starts rather than
+    sleeping after each response. Rows keep subject order.  Once ``stop`` is
+    set, the remaining subjects are skipped and reported as failed.
+    """
+    sess = _client.new_session()
+    rate = rate if rate is not None else RateLimit(delay_s)
+    parse_pool = parse_pool if parse_pool is not None else ParsePool()
+
+    dyn_html = _client.get_text(DYN_SCHED_URL, session=sess, timeout_s=timeout)
     if not term:
         term = _extract_term_code_from_dyn_sched(dyn_html) or term
     if not term:
@@ -546,12 +542,11 @@ def scrape_term_schedule(
 
     # Establish a term-bound session. Banner commonly expects this step and
     # returns the search form for the selected term.
-    search_html = _fetch_with_retry(
-        sess,
-        "POST",
+    search_html = _client.post_text(
         PROC_TERM_URL,
-        data=[("p_calling_proc", "bwckschd.p_disp_dyn_sched"), ("p_term", term)],
-        timeout=timeout,
+        [("p_calling_proc", "bwckschd.p_disp_dyn_sched"), ("p_term", term)],
+        session=sess,
+        timeout_s=timeout,
     )
 
     live_subjects = _parse_subject_codes_from_search(search_html)
@@ -573,9 +568,12 @@ def scrape_term_schedule(
         omitted_subjects = subjects[max_subjects:]
         subjects = subjects[: max_subjects]
 
-    all_sections: List[Dict[str, Any]] = []
-    failed_subjects: List[str] = []
-    for idx, subj in enumerate(subjects, start=1):
+    def stopped() -> bool:
+        return stop is not None and stop.is_set()
+
+    def fetch_subject(idx: int, subj: str) -> Optional[List[Dict[str, Any]]]:
+        if stopped():
+            return None
         print(f"[{idx}/{len(subjects)}] Fetching schedule listing for {subj}...")
         # Banner can return 500 errors if time fields are omitted; send a full
         # inclusive range by default (00:00–23:55).
@@ -604,21 +602,34 @@ def scrape_term_schedule(
             ("end_ap", "p"),
         ]
         try:
-            html = _fetch_with_retry(sess, "POST", SEARCH_URL, data=data, timeout=timeout)
-            rows = _parse_sections_from_listing(html)
-            if not rows and not _is_explicitly_empty_listing(html):
+            rate.wait()
+            if stopped():
+                return None
+            html = _client.post_text(SEARCH_URL, data, session=sess, timeout_s=timeout)
+            rows, explicitly_empty = parse_pool.parse(_parse_listing, html)
+            if not rows and not explicitly_empty:
                 raise RuntimeError("schedule listing response contained neither sections nor an empty-result marker")
             for r in rows:
                 r["term"] = term
                 r["subject"] = subj
                 r["source_url"] = _build_detail_url(term, r.get("crn", ""))
-            all_sections.extend(rows)
+            return rows
         except Exception as e:
             # Avoid aborting the entire scrape due to transient server errors.
             print(f"Warning: failed to fetch {subj}: {e}")
+            return None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, int(workers or 1))) as executor:
+        futures = [executor.submit(fetch_subject, idx, subj) for idx, subj in enumerate(subjects, start=1)]
+        results = [future.result() for future in futures]
+
+    all_sections: List[Dict[str, Any]] = []
+    failed_subjects: List[str] = []
+    for subj, rows in zip(subjects, results):
+        if rows is None:
             failed_subjects.append(subj)
-        if delay_s:
-            time.sleep(delay_s)
+        else:
+            all_sections.extend(rows)
 
     meta = {
         "term": term,
@@ -671,6 +682,7 @@ def rebuild_section_history(
     *,
     refresh: bool = True,
     crn_pairs: Optional[Iterable[Tuple[str, str]]] = None,
+    extra_args: Iterable[str] = (),
 ) -> None:
     requested_terms = sorted({str(term or "").strip() for term in terms if re.fullmatch(r"\d{6}", str(term or "").strip())})
     if not requested_terms:
@@ -691,6 +703,7 @@ def rebuild_section_history(
         )
         if pairs:
             cmd.extend(["--crns", ",".join(f"{term}:{crn}" for term, crn in pairs)])
+    cmd.extend(extra_args)
     print(
         "Course section history command: "
         f"terms={','.join(requested_terms)} refresh={refresh} crn_filter={len(pairs)}",
@@ -751,20 +764,9 @@ def _primary_section_signatures(rows: Iterable[Dict[str, Any]]) -> Dict[str, str
 
 
 def _read_schedule_jsonl(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
     if not path.exists():
-        return rows
-    for line in path.read_text(encoding="utf-8").splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
-        try:
-            obj = json.loads(raw)
-        except Exception:
-            continue
-        if isinstance(obj, dict):
-            rows.append(obj)
-    return rows
+        return []
+    return [obj for obj in jsonl_codec.iter_jsonl(path, skip_invalid=True) if isinstance(obj, dict)]
 
 
 def _row_subject(row: Dict[str, Any]) -> str:
@@ -823,9 +825,57 @@ def _write_rows_if_nonempty(path: Path, rows: List[Dict[str, Any]]) -> bool:
     if not rows:
         return False
     write_jsonl(path, rows)
+    if _is_schedule_output_path(path):
+        meeting_bitmaps.write_term_bitmaps(path, rows)
     return True
 
 
+def _iter_term_scrapes(
+    terms: Iterable[str],
+    *,
+    term_workers: int,
+    subject_manifest: Dict[str, Any],
+    **scrape_kwargs: Any,
+) -> Iterator[Tuple[str, "concurrent.futures.Future"]]:
+    """Scrape up to ``term_workers`` terms at once, yielding finished futures in term order.
+
+    Each term is submitted with a snapshot of the subject manifest taken when
+    its slot opens, so with one worker every term still sees the entries the
+    caller recorded for earlier terms. Stopping the iteration cancels the
+    speculative terms that have not started yet and tells the running ones to
+    skip their remaining subjects, so at most the in-flight subject requests
+    are wasted.
+    """
+    term_iter = iter(terms)
+    stop = threading.Event()
+    pending: "collections.deque[Tuple[str, concurrent.futures.Future]]" = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, int(term_workers or 1))) as executor:
+
+        def submit_next() -> None:
+            term = next(term_iter, None)
+            if term is not None:
+                pending.append((term, executor.submit(
+                    scrape_term_schedule,
+                    term,
+                    subject_manifest=copy.deepcopy(subject_manifest),
+                    stop=stop,
+                    **scrape_kwargs,
+                )))
+
+        try:
+            for _ in range(max(1, int(term_workers or 1))):
+                submit_next()
+            while pending:
+                term, future = pending.popleft()
+                concurrent.futures.wait([future])
+                yield term, future
+                submit_next()
+        finally:
+            stop.set()
+            for _term, future in pending:
+                future.cancel()
+
+
 def scrape_terms_forward(
     start_term: str,
     *,
@@ -834,20 +884,31 @@ def scrape_terms_forward(
     max_subjects: Optional[int],
     subject_manifest: Dict[str, Any],
     stop_after_empty_terms: int = 2,
+    workers: int = 1,
+    term_workers: int = 1,
+    rate: Optional[RateLimit] = None,
+    parse_pool: Optional[ParsePool] = None,
 ) -> Tuple[List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]], Dict[str, Any]]:
     current_term = _validate_term_code(start_term, arg_name="start term code")
     consecutive_empty = 0
     results: List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]] = []
-    for term in _iter_term_codes_forward(current_term):
-        print(f"[auto] Scraping term {term}...")
+    # With term_workers > 1 later terms are scraped speculatively; the empty-
+    # term stopping rule is still applied in term order as results arrive.
+    scrapes = _iter_term_scrapes(
+        _iter_term_codes_forward(current_term),
+        term_workers=term_workers,
+        subject_manifest=subject_manifest,
+        timeout=timeout,
+        delay_s=delay_s,
+        max_subjects=max_subjects,
+        workers=workers,
+        rate=rate if rate is not None else RateLimit(delay_s),
+        parse_pool=parse_pool,
+    )
+    for term, future in scrapes:
+        print(f"[auto] Scraped term {term}.")
         try:
-            rows, meta = scrape_term_schedule(
-                term,
-                timeout=timeout,
-                delay_s=delay_s,
-                max_subjects=max_subjects,
-                subject_manifest=subject_manifest,
-            )
+            rows, meta = future.result()
         except Exception as e:
             print(f"Warning: failed to scrape term {term}: {e}")
             rows = []
@@ -874,6 +935,7 @@ def scrape_terms_forward(
 
         consecutive_empty += 1
         if consecutive_empty >= max(1, int(stop_after_empty_terms)):
+            scrapes.close()
             break
     return results, subject_manifest
 
@@ -902,7 +964,25 @@ def main() -> None:
         help="Output JSONL path. Only valid with a single scraped term. Default: courses/schedule/<term>.jsonl",
     )
     parser.add_argument("--timeout", type=float, default=30.0, help="HTTP timeout seconds.")
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between subject requests (seconds).")
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.5,
+        help="Minimum seconds between subject request starts (a rate limit shared by all workers).",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Subjects fetched concurrently per term.")
+    parser.add_argument(
+        "--term-workers",
+        type=int,
+        default=1,
+        help="Terms scraped concurrently (auto-forward, --terms and --from-term); all terms share the --delay rate limit.",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse subject listings in N worker processes instead of the fetch threads (0 = parse inline).",
+    )
     parser.add_argument("--max-subjects", type=int, default=0, help="Limit subjects for testing (0 = no limit).")
     parser.add_argument(
         "--future-stop-after",
@@ -932,8 +1012,14 @@ def main() -> None:
         default="delta",
         help="How to update section seat history after schedule writes.",
     )
+    add_archive_arguments(parser)
+    add_parse_cache_arguments(parser)
     args = parser.parse_args()
 
+    archive = archive_from_args(args)
+    if archive is not None:
+        _client.archive = archive
+
     term = str(args.term or "").strip()
     terms_arg = str(args.terms or "").strip()
     from_term = str(args.from_term or "").strip()
@@ -973,6 +1059,9 @@ def main() -> None:
     complete_written_terms: Set[str] = set()
     changed_section_crns_by_term: Dict[str, Set[str]] = {}
     subject_manifest = _load_subject_manifest()
+    # One request budget and one parser pool for every term scraped in this run.
+    rate = RateLimit(args.delay)
+    parse_pool = ParsePool(0 if args.html else args.parse_processes, cache=parse_cache_from_args(args))
 
     if auto_forward_mode:
         scraped, subject_manifest = scrape_terms_forward(
@@ -982,6 +1071,10 @@ def main() -> None:
             max_subjects=max_subjects,
             subject_manifest=subject_manifest,
             stop_after_empty_terms=args.future_stop_after,
+            workers=args.workers,
+            term_workers=args.term_workers,
+            rate=rate,
+            parse_pool=parse_pool,
         )
         for resolved_term, rows, meta in scraped:
             out_path = SCHEDULE_DIR / f"{resolved_term}.jsonl"
@@ -1000,19 +1093,27 @@ def main() -> None:
                     + (f" [{meta.get('subject_source')} subjects]" if meta.get("subject_source") else "")
                 )
     else:
+        scrapes = None
+        if not args.html:
+            scrapes = _iter_term_scrapes(
+                terms_to_scrape,
+                term_workers=args.term_workers,
+                subject_manifest=subject_manifest,
+                timeout=args.timeout,
+                delay_s=args.delay,
+                max_subjects=max_subjects,
+                workers=args.workers,
+                rate=rate,
+                parse_pool=parse_pool,
+            )
         for idx, resolved_term in enumerate(terms_to_scrape, start=1):
             if args.html:
                 rows = parsed_rows
                 meta = None
             else:
-                print(f"[{idx}/{len(terms_to_scrape)}] Scraping term {resolved_term}...")
-                rows, meta = scrape_term_schedule(
-                    resolved_term,
-                    timeout=args.timeout,
-                    delay_s=args.delay,
-                    max_subjects=max_subjects,
-                    subject_manifest=subject_manifest,
-                )
+                _scraped_term, future = next(scrapes)
+                print(f"[{idx}/{len(terms_to_scrape)}] Scraped term {resolved_term}.")
+                rows, meta = future.result()
                 if meta and meta.get("had_live_subjects"):
                     _record_subject_manifest_entry(subject_manifest, resolved_term, meta.get("live_subjects", []))
                 elif meta and rows and not meta.get("subject_list_was_truncated"):
@@ -1033,7 +1134,9 @@ def main() -> None:
             else:
                 print(f"Skipped writing empty schedule output for {resolved_term}")
 
+    parse_pool.shutdown()
     _save_subject_manifest(subject_manifest)
+    _client.save_archive()
 
     written_terms = [path.stem for path in written_paths if _is_schedule_output_path(path)]
     terms_to_reconcile = [term for term in written_terms if term in complete_written_terms]
@@ -1082,7 +1185,7 @@ def main() -> None:
             flush=True,
         )
         if args.section_history_mode == "full":
-            rebuild_section_history(written_terms, refresh=True)
+            rebuild_section_history(written_terms, refresh=True, extra_args=archive_cli_args(args))
         else:
             crn_pairs = [
                 (term, crn)
@@ -1093,7 +1196,9 @@ def main() -> None:
                 f"Changed primary section CRNs detected for delta refresh: {len(crn_pairs)}",
                 flush=True,
             )
-            rebuild_section_history(written_terms, refresh=False, crn_pairs=crn_pairs)
+            rebuild_section_history(
+                written_terms, refresh=False, crn_pairs=crn_pairs, extra_args=archive_cli_args(args)
+            )
 
 
 if __name__ == "__main__":
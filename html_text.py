@@ -0,0 +1,57 @@
+"""BeautifulSoup-compatible text helpers for lxml trees.
+
+The scrapers were written against ``Tag.get_text(" ", strip=True)`` and
+``find(..., class_=...)``.  The lxml fast paths use these helpers so their
+output stays identical to the BeautifulSoup reference behaviour.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+# BeautifulSoup's get_text() skips strings inside these elements (but keeps
+# their tails).
+SKIPPED_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+
+def _collect_text(el: Any, pieces: List[str]) -> None:
+    text = el.text
+    if text:
+        text = text.strip()
+        if text:
+            pieces.append(text)
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in SKIPPED_TEXT_TAGS:
+            _collect_text(child, pieces)
+        tail = child.tail
+        if tail:
+            tail = tail.strip()
+            if tail:
+                pieces.append(tail)
+
+
+def element_text(el: Any) -> str:
+    """Return what ``get_text(" ", strip=True)`` gives for ``el`` ("" for ``None``)."""
+
+    if el is None:
+        return ""
+    if not len(el):
+        return (el.text or "").strip()
+    pieces: List[str] = []
+    _collect_text(el, pieces)
+    return " ".join(pieces)
+
+
+def has_class(el: Any, name: str) -> bool:
+    """Return whether ``name`` is one of ``el``'s CSS classes."""
+
+    return name in (el.get("class") or "").split()
+
+
+def first_descendant(el: Any, tag: str, class_: Optional[str] = None) -> Any:
+    """Return the first descendant ``tag`` (optionally with CSS class ``class_``), or ``None``."""
+
+    for child in el.iterdescendants(tag):
+        if class_ is None or has_class(child, class_):
+            return child
+    return None
@@ -0,0 +1,267 @@
+"""Streaming JSON Lines reader and writer shared by the scrapers and builders.
+
+Every committed ``.jsonl`` file holds one ``json.dumps(row,
+ensure_ascii=False)`` per line.  Reads decode with msgspec or orjson when
+either is installed and with the standard library otherwise; a line the fast
+decoder rejects (``NaN``, ``1e400``, lone surrogates, malformed JSON) is
+decoded again by ``json.loads``, so values and error messages are exactly
+the standard library's.  orjson reads integers beyond 64 bits as floats, so
+with that backend a line holding a run of 19 or more digits also goes to
+``json.loads``.
+
+Writes always use the standard library encoder.  Neither fast encoder can
+emit the ``", "`` and ``": "`` separators of the committed files, and
+re-spacing their compact output costs more than it saves; one shared encoder
+and batched writes keep the bytes identical and still beat ``json.dumps``
+per row.
+
+Generated outputs are published with :func:`write_jsonl_if_changed`, which
+renders the file in memory and atomically replaces it only when the bytes
+differ, so a no-op run leaves files and their mtimes untouched.
+
+    for line_no, row in iter_jsonl_numbered(path):
+        ...
+    write_jsonl_if_changed(path, rows, stats=stats)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+WRITE_BATCH = 512
+BACKENDS = ("msgspec", "orjson", "json")
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_DIGITS = bytes.maketrans(b"123456789", b"000000000")
+_LONG_INT = b"0" * 19
+# New files get the mode open() would give them.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _backend_decoder(name: str) -> Callable[[Union[str, bytes]], Any]:
+    if name == "msgspec":
+        import msgspec
+
+        decode = msgspec.json.Decoder().decode
+
+        def fast(data: Union[str, bytes]) -> Any:
+            try:
+                return decode(data)
+            except msgspec.MsgspecError:
+                return json.loads(data)
+
+        return fast
+    if name == "orjson":
+        import orjson
+
+        def fast(data: Union[str, bytes]) -> Any:
+            raw = data if isinstance(data, bytes) else data.encode("utf-8", "surrogatepass")
+            if _LONG_INT in raw.translate(_DIGITS):
+                return json.loads(data)
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                return json.loads(data)
+
+        return fast
+    if name == "json":
+        return json.loads
+    raise ValueError(f"unknown JSONL backend {name!r}; expected one of {', '.join(BACKENDS)}")
+
+
+def set_backend(name: str) -> None:
+    """Decode with ``name`` from now on; raises ImportError if it is not installed."""
+
+    global BACKEND, _decode
+    _decode = _backend_decoder(name)
+    BACKEND = name
+
+
+def _first_available() -> str:
+    for name in BACKENDS[:-1]:
+        try:
+            _backend_decoder(name)
+        except ImportError:
+            continue
+        return name
+    return "json"
+
+
+BACKEND = _first_available()
+_decode = _backend_decoder(BACKEND)
+
+
+class JsonlDecodeError(ValueError):
+    """A line that is not valid JSON, with where it was found."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], line_no: int, error: ValueError):
+        super().__init__(f"Invalid JSON in {path}:{line_no}: {error}")
+        self.path = path
+        self.line_no = line_no
+        self.error = error
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode one JSON document exactly as ``json.loads`` would."""
+
+    return _decode(data)
+
+
+def dumps(value: Any) -> str:
+    """Return ``json.dumps(value, ensure_ascii=False)``."""
+
+    return _ENCODER.encode(value)
+
+
+def iter_jsonl_numbered(path: Union[str, "os.PathLike[str]"], *, skip_invalid: bool = False) -> Iterator[Tuple[int, Any]]:
+    """Yield ``(line_no, value)`` for each non-blank line of ``path``.
+
+    Lines are read one at a time, never the whole file.  An undecodable line
+    raises :class:`JsonlDecodeError`, or is passed over with ``skip_invalid``.
+    """
+
+    decode = _decode
+    # The fast decoders take the UTF-8 bytes as they are.
+    fh = open(path, "r", encoding="utf-8") if BACKEND == "json" else open(path, "rb")
+    with fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                value = decode(line)
+            except ValueError as exc:
+                if skip_invalid:
+                    continue
+                raise JsonlDecodeError(path, line_no, exc) from exc
+            yield line_no, value
+
+
+def iter_jsonl(path: Union[str, "os.PathLike[str]"], *, skip_invalid: bool = False) -> Iterator[Any]:
+    """Yield the decoded value of each non-blank line of ``path``."""
+
+    for _line_no, value in iter_jsonl_numbered(path, skip_invalid=skip_invalid):
+        yield value
+
+
+def read_jsonl(path: Union[str, "os.PathLike[str]"], *, skip_invalid: bool = False) -> List[Any]:
+    return list(iter_jsonl(path, skip_invalid=skip_invalid))
+
+
+def iter_jsonl_lines(rows: Iterable[Any]) -> Iterator[str]:
+    encode = _ENCODER.encode
+    for row in rows:
+        yield encode(row) + "\n"
+
+
+def jsonl_text(rows: Iterable[Any]) -> str:
+    """Return ``rows`` as JSON Lines text, one ``dumps`` per line."""
+
+    return "".join(iter_jsonl_lines(rows))
+
+
+def write_rows(fh: IO[str], rows: Iterable[Any], *, batch_size: int = WRITE_BATCH) -> int:
+    """Write ``rows`` to an open text file ``batch_size`` lines per call; return the row count."""
+
+    count = 0
+    batch: List[str] = []
+    for line in iter_jsonl_lines(rows):
+        batch.append(line)
+        if len(batch) >= batch_size:
+            fh.write("".join(batch))
+            count += len(batch)
+            batch.clear()
+    if batch:
+        fh.write("".join(batch))
+        count += len(batch)
+    return count
+
+
+def write_jsonl(path: Union[str, "os.PathLike[str]"], rows: Iterable[Any], *, batch_size: int = WRITE_BATCH) -> int:
+    """Replace ``path`` with ``rows`` as JSON Lines, creating its directory; return the row count."""
+
+    parent = os.path.dirname(os.fspath(path))
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as fh:
+        return write_rows(fh, rows, batch_size=batch_size)
+
+
+@dataclass
+class WriteStats:
+    """Files replaced and files already up to date, across ``*_if_changed`` calls."""
+
+    written: int = 0
+    unchanged: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.written} written, {self.unchanged} unchanged"
+
+
+def _holds(path: Union[str, "os.PathLike[str]"], data: bytes) -> bool:
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as fh:
+            return fh.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def replace_bytes_if_changed(
+    path: Union[str, "os.PathLike[str]"], data: bytes, *, stats: Optional[WriteStats] = None
+) -> bool:
+    """Atomically replace ``path`` with ``data`` unless it already holds exactly these bytes.
+
+    Returns whether the file was written.  A replaced file keeps its mode.
+    """
+
+    if _holds(path, data):
+        if stats is not None:
+            stats.unchanged += 1
+        return False
+    directory = os.path.dirname(os.fspath(path)) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fh.fileno(), mode)
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    if stats is not None:
+        stats.written += 1
+    return True
+
+
+def replace_text_if_changed(
+    path: Union[str, "os.PathLike[str]"], text: str, *, stats: Optional[WriteStats] = None
+) -> bool:
+    """:func:`replace_bytes_if_changed` with ``text`` encoded as UTF-8."""
+
+    return replace_bytes_if_changed(path, text.encode("utf-8"), stats=stats)
+
+
+def write_jsonl_if_changed(
+    path: Union[str, "os.PathLike[str]"], rows: Iterable[Any], *, stats: Optional[WriteStats] = None
+) -> bool:
+    """:func:`replace_text_if_changed` with ``rows`` as JSON Lines."""
+
+    return replace_text_if_changed(path, jsonl_text(rows), stats=stats)
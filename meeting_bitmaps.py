@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""Packed weekly meeting-time bitmaps for the term schedules.
+
+Every section in ``courses/schedule/<term>.jsonl`` lists its meetings as
+free text (``days``, ``time``, ``date_range``) plus ``start_min`` and
+``end_min``, and the scheduler re-derives occupancy from them on every
+conflict check.  ``fetch_schedule.py`` therefore also writes
+``courses/schedule/<term>.slots.bin`` next to each term, holding one
+fixed-width bitmap per CRN and date range, so that two sections conflict
+exactly when their bitmaps share a set bit on a weekday both date ranges
+cover.
+
+A bitmap has one bit per five-minute slot of the week: bit ``day * 288 +
+slot``, days ordered ``U M T W R F S`` (Sunday first, as JavaScript's
+``getUTCDay()`` numbers them), 2016 bits in 252 bytes, little-endian.  A
+meeting covers the slots from its start rounded down to the end rounded up,
+so a meeting off the five-minute grid can only ever add a conflict, never
+hide one; such records carry :data:`ROUNDED`.  An end of 12:00 am means
+midnight, and a meeting whose end is earlier than its start runs past
+midnight into the next weekday (Saturday wraps to Sunday).
+
+The file is little-endian and every field is four-byte aligned:
+
+* a 16-byte header: ``b"SUMB"``, version, slot minutes, days per week, a
+  zero byte, slots per day (u16), date-range count (u16), record count (u32);
+* the date-range table, ``(first_day, last_day)`` as i32 days since
+  1970-01-01, for ids ``1..n``;
+* the records sorted by CRN then range id, each ``crn`` (u32), ``range_id``
+  (u16), ``flags`` (u16) and the 252-byte bitmap.
+
+Range id 0 (:data:`UNKNOWN_RANGE`) stands for a missing or unparseable date
+range, or a weekday the range never reaches, and is treated as the whole
+term.  A CRN whose meetings are missing or unusable keeps a record with
+:data:`INCOMPLETE` set, the same sections the scheduler flags as having
+incomplete meeting data.  The files are a local build output: nothing reads
+them yet, so git ignores them and ``build_manifest.py`` leaves them out of
+the data bundle.  They can always be rebuilt from the committed schedules.
+
+    python meeting_bitmaps.py            # (re)write every term's bitmaps
+    python meeting_bitmaps.py --check    # verify them against the schedules
+"""
+
+import argparse
+import datetime
+import re
+import struct
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import jsonl_codec
+
+SCHEDULE_DIR = Path("courses") / "schedule"
+SUFFIX = ".slots.bin"
+MAGIC = b"SUMB"
+VERSION = 1
+
+SLOT_MINUTES = 5
+DAY_MINUTES = 24 * 60
+SLOTS_PER_DAY = DAY_MINUTES // SLOT_MINUTES
+DAY_KEYS = "UMTWRFS"
+WEEK_BITS = len(DAY_KEYS) * SLOTS_PER_DAY
+BITMAP_BYTES = WEEK_BITS // 8
+
+UNKNOWN_RANGE = 0
+# Record flags.
+INCOMPLETE = 1
+ROUNDED = 2
+
+_HEADER = struct.Struct("<4sBBBxHHI")
+_RANGE = struct.Struct("<ii")
+_RECORD = struct.Struct("<IHH")
+_RECORD_BYTES = _RECORD.size + BITMAP_BYTES
+_WEEK = (1 << WEEK_BITS) - 1
+_DAY = (1 << SLOTS_PER_DAY) - 1
+# Every slot of the weekdays in a seven-bit weekday mask.
+_DAY_MASKS = [
+    sum(_DAY << (day * SLOTS_PER_DAY) for day in range(7) if weekdays >> day & 1) for weekdays in range(128)
+]
+_ALL_WEEKDAYS = 0x7F
+_TERM_FILE_RE = re.compile(r"\d{6}\.jsonl")
+_DAYS_RE = re.compile(r"[MTWRFSU]+")
+_MONTHS = {name: number for number, name in enumerate("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1)}
+_DATE_RANGE_RE = re.compile(r"([A-Z][a-z]{2}) (\d{1,2}), (\d{4}) - ([A-Z][a-z]{2}) (\d{1,2}), (\d{4})")
+_EPOCH = datetime.date(1970, 1, 1)
+
+DateRange = Tuple[int, int]
+
+
+def clock_to_minutes(token: str) -> Optional[int]:
+    """Minutes after midnight for ``"2:30 pm"``, ``"08:40"`` or ``"14:30"``."""
+
+    t = str(token).strip().lower()
+    if not t:
+        return None
+    m = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*(am|pm)?$", t)
+    if not m:
+        return None
+    hh = int(m.group(1))
+    mm = int(m.group(2) or "0")
+    ap = m.group(3) or ""
+    if ap == "am":
+        if hh == 12:
+            hh = 0
+    elif ap == "pm":
+        if hh != 12:
+            hh += 12
+    return hh * 60 + mm
+
+
+def parse_time_range_to_minutes(time_str: str) -> Tuple[Optional[int], Optional[int]]:
+    """``(start, end)`` for ``"12:40 pm - 2:30 pm"``; ``(None, None)`` for TBA or garbage."""
+
+    s = str(time_str or "").strip()
+    if not s or re.search(r"\bTBA\b", s, re.I):
+        return None, None
+    parts = [p.strip() for p in s.split("-")]
+    if len(parts) < 2:
+        return None, None
+    return clock_to_minutes(parts[0]), clock_to_minutes(parts[1])
+
+
+def parse_days(days: Any) -> List[int]:
+    """Weekday numbers (Sunday 0) of a Banner day string such as ``"MW"`` or ``"T R"``.
+
+    Like the scheduler, a string with anything but day letters (``"TBA"``)
+    yields no days rather than the days its letters happen to spell.
+    """
+
+    s = re.sub(r"\s+", "", str(days or "").upper())
+    if not _DAYS_RE.fullmatch(s):
+        return []
+    return sorted({DAY_KEYS.index(key) for key in s})
+
+
+def parse_date_range(value: Any) -> Optional[DateRange]:
+    """``(first_day, last_day)`` in days since 1970-01-01 for ``"Feb 15, 2027 - May 28, 2027"``."""
+
+    match = _DATE_RANGE_RE.fullmatch(re.sub(r"\s+", " ", str(value or "").strip()))
+    if not match:
+        return None
+    try:
+        first, last = (
+            datetime.date(int(year), _MONTHS[month], int(day)) for month, day, year in (match.group(1, 2, 3), match.group(4, 5, 6))
+        )
+    except (KeyError, ValueError):
+        return None
+    if last < first:
+        return None
+    return (first - _EPOCH).days, (last - _EPOCH).days
+
+
+def range_weekdays(date_range: Optional[DateRange]) -> int:
+    """Seven-bit mask of the weekdays that occur in ``date_range``; all of them when unknown."""
+
+    if date_range is None or date_range[1] - date_range[0] >= 6:
+        return _ALL_WEEKDAYS
+    mask = 0
+    for day in range(date_range[0], date_range[1] + 1):
+        # 1970-01-01 was a Thursday.
+        mask |= 1 << ((day + 4) % 7)
+    return mask
+
+
+def meeting_minutes(meeting: Mapping[str, Any]) -> Optional[Tuple[int, int]]:
+    """``(start, end)`` minutes of a meeting, ``end`` past 1440 when it runs over midnight.
+
+    ``start_min``/``end_min`` win over the ``time`` text, as in the scheduler.
+    Returns None when there is no usable time.
+    """
+
+    start, end = meeting.get("start_min"), meeting.get("end_min")
+    if start is None or end is None:
+        start, end = parse_time_range_to_minutes(meeting.get("time", ""))
+    if not isinstance(start, int) or not isinstance(end, int) or isinstance(start, bool) or isinstance(end, bool):
+        return None
+    if not 0 <= start < DAY_MINUTES or not 0 <= end <= DAY_MINUTES or start == end:
+        return None
+    if end < start:
+        end += DAY_MINUTES
+    return start, end
+
+
+def slot_bits(day: int, start: int, end: int) -> int:
+    """Bits of the five-minute slots touched by ``[start, end)`` minutes on weekday ``day``."""
+
+    first = start // SLOT_MINUTES
+    last = -(-end // SLOT_MINUTES)
+    bits = ((1 << (last - first)) - 1) << (day * SLOTS_PER_DAY + first)
+    # Saturday night runs into Sunday morning.
+    return (bits | bits >> WEEK_BITS) & _WEEK
+
+
+class SlotRecord(NamedTuple):
+    crn: int
+    range_id: int
+    flags: int
+    bitmap: int
+
+
+def _crn_number(value: Any) -> Optional[int]:
+    crn = str(value or "").strip()
+    if not crn.isdigit() or int(crn) >= 1 << 32:
+        return None
+    return int(crn)
+
+
+def _section_slots(row: Mapping[str, Any]) -> Tuple[int, Dict[Optional[DateRange], int]]:
+    meetings = row.get("meetings")
+    meetings = meetings if isinstance(meetings, list) else []
+    flags = 0 if meetings else INCOMPLETE
+    by_range: Dict[Optional[DateRange], int] = {}
+    for meeting in meetings:
+        if not isinstance(meeting, dict):
+            flags |= INCOMPLETE
+            continue
+        days = parse_days(meeting.get("days"))
+        minutes = meeting_minutes(meeting)
+        date_range = parse_date_range(meeting.get("date_range"))
+        if not days or minutes is None or date_range is None:
+            flags |= INCOMPLETE
+        if not days or minutes is None:
+            continue
+        start, end = minutes
+        if start % SLOT_MINUTES or end % SLOT_MINUTES:
+            flags |= ROUNDED
+        covered = range_weekdays(date_range)
+        for day in days:
+            # A weekday the range never reaches is as unknown as no range.
+            key = date_range if covered >> day & 1 else None
+            if date_range is not None and key is None:
+                flags |= INCOMPLETE
+            by_range[key] = by_range.get(key, 0) | slot_bits(day, start, end)
+    return flags, by_range
+
+
+@dataclass
+class TermBitmaps:
+    """The bitmaps of one term: ``ranges[i - 1]`` is range id ``i``."""
+
+    ranges: List[DateRange] = field(default_factory=list)
+    records: List[SlotRecord] = field(default_factory=list)
+    _by_crn: Optional[Dict[int, List[SlotRecord]]] = field(default=None, repr=False, compare=False)
+
+    def sections(self, crn: Any) -> List[SlotRecord]:
+        """Records of ``crn``; empty when the term has no such section."""
+
+        if self._by_crn is None:
+            self._by_crn = {}
+            for record in self.records:
+                self._by_crn.setdefault(record.crn, []).append(record)
+        number = _crn_number(crn)
+        return self._by_crn.get(number, []) if number is not None else []
+
+    def range_of(self, range_id: int) -> Optional[DateRange]:
+        return self.ranges[range_id - 1] if range_id != UNKNOWN_RANGE else None
+
+    def shared_weekdays(self, a_id: int, b_id: int) -> int:
+        """Seven-bit mask of the weekdays on which both date ranges can meet."""
+
+        a, b = self.range_of(a_id), self.range_of(b_id)
+        if a is None or b is None:
+            return _ALL_WEEKDAYS
+        both = (max(a[0], b[0]), min(a[1], b[1]))
+        return range_weekdays(both) if both[0] <= both[1] else 0
+
+    def records_conflict(self, a: Iterable[SlotRecord], b: Iterable[SlotRecord]) -> bool:
+        b = list(b)
+        for x in a:
+            for y in b:
+                common = x.bitmap & y.bitmap
+                if common and common & _DAY_MASKS[self.shared_weekdays(x.range_id, y.range_id)]:
+                    return True
+        return False
+
+    def conflict(self, crn_a: Any, crn_b: Any) -> bool:
+        """Whether two sections of the term ever meet at the same time."""
+
+        return self.records_conflict(self.sections(crn_a), self.sections(crn_b))
+
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(MAGIC, VERSION, SLOT_MINUTES, len(DAY_KEYS), SLOTS_PER_DAY, len(self.ranges), len(self.records))]
+        parts.extend(_RANGE.pack(*date_range) for date_range in self.ranges)
+        for record in self.records:
+            parts.append(_RECORD.pack(record.crn, record.range_id, record.flags))
+            parts.append(record.bitmap.to_bytes(BITMAP_BYTES, "little"))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TermBitmaps":
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated meeting bitmap file")
+        magic, version, slot_minutes, days, slots, range_count, record_count = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} meeting bitmap file")
+        if (slot_minutes, days, slots) != (SLOT_MINUTES, len(DAY_KEYS), SLOTS_PER_DAY):
+            raise ValueError(f"unsupported slot layout {slot_minutes} min x {slots} x {days} days")
+        offset = _HEADER.size
+        if len(data) != offset + range_count * _RANGE.size + record_count * _RECORD_BYTES:
+            raise ValueError("meeting bitmap file size does not match its header")
+        ranges = [_RANGE.unpack_from(data, offset + i * _RANGE.size) for i in range(range_count)]
+        offset += range_count * _RANGE.size
+        records = []
+        for _ in range(record_count):
+            crn, range_id, flags = _RECORD.unpack_from(data, offset)
+            bitmap = int.from_bytes(data[offset + _RECORD.size : offset + _RECORD_BYTES], "little")
+            records.append(SlotRecord(crn, range_id, flags, bitmap))
+            offset += _RECORD_BYTES
+        return cls(ranges=ranges, records=records)
+
+
+def build_term_bitmaps(rows: Iterable[Mapping[str, Any]]) -> TermBitmaps:
+    """Bitmaps for the section rows of one term; rows of the same CRN are merged."""
+
+    flags_by_crn: Dict[int, int] = {}
+    slots_by_crn: Dict[int, Dict[Optional[DateRange], int]] = {}
+    for row in rows:
+        crn = _crn_number(row.get("crn"))
+        if crn is None:
+            continue
+        flags, by_range = _section_slots(row)
+        flags_by_crn[crn] = flags_by_crn.get(crn, 0) | flags
+        merged = slots_by_crn.setdefault(crn, {})
+        for key, bits in by_range.items():
+            merged[key] = merged.get(key, 0) | bits
+
+    ranges = sorted({key for by_range in slots_by_crn.values() for key in by_range if key is not None})
+    range_ids = {date_range: i for i, date_range in enumerate(ranges, start=1)}
+    records = []
+    for crn in sorted(slots_by_crn):
+        by_range = slots_by_crn[crn]
+        flags = flags_by_crn[crn]
+        if not by_range:
+            records.append(SlotRecord(crn, UNKNOWN_RANGE, flags, 0))
+            continue
+        for range_id, bits in sorted((range_ids.get(key, UNKNOWN_RANGE), bits) for key, bits in by_range.items()):
+            records.append(SlotRecord(crn, range_id, flags, bits))
+    return TermBitmaps(ranges=ranges, records=records)
+
+
+def bitmap_path(schedule_path: Path) -> Optional[Path]:
+    """``<term>.slots.bin`` beside a ``<term>.jsonl`` schedule; None for other files."""
+
+    schedule_path = Path(schedule_path)
+    if not _TERM_FILE_RE.fullmatch(schedule_path.name):
+        return None
+    return schedule_path.with_name(schedule_path.stem + SUFFIX)
+
+
+def read_term_bitmaps(path: Path) -> TermBitmaps:
+    return TermBitmaps.from_bytes(Path(path).read_bytes())
+
+
+def write_term_bitmaps(
+    schedule_path: Path, rows: Iterable[Mapping[str, Any]], *, stats: Optional[jsonl_codec.WriteStats] = None
+) -> bool:
+    """Write the bitmaps of ``rows`` beside ``schedule_path`` if they changed; return whether written."""
+
+    path = bitmap_path(schedule_path)
+    if path is None:
+        return False
+    return jsonl_codec.replace_bytes_if_changed(path, build_term_bitmaps(rows).to_bytes(), stats=stats)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the per-term meeting bitmaps under courses/schedule/.")
+    parser.add_argument("--schedule-dir", default=str(SCHEDULE_DIR))
+    parser.add_argument("--terms", default="", help="Comma-separated terms (default: all).")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if any term's bitmaps are missing or stale.")
+    args = parser.parse_args(argv)
+
+    selected = {t.strip() for t in args.terms.split(",") if t.strip()}
+    problems = []
+    stats = jsonl_codec.WriteStats()
+    for schedule_path in sorted(Path(args.schedule_dir).glob("*.jsonl")):
+        path = bitmap_path(schedule_path)
+        if path is None or (selected and schedule_path.stem not in selected):
+            continue
+        rows = jsonl_codec.read_jsonl(schedule_path)
+        if not args.check:
+            write_term_bitmaps(schedule_path, rows, stats=stats)
+        elif not path.exists() or path.read_bytes() != build_term_bitmaps(rows).to_bytes():
+            problems.append(f"{path}: missing or stale; run python meeting_bitmaps.py")
+    if not args.check:
+        print(f"Meeting bitmaps: {stats}")
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,8 @@ import json
 import os
 from typing import Any, Dict, Iterable, List, Tuple
 
+import jsonl_codec
+
 
 COURSES_DIR = "courses"
 REQUIREMENTS_DIR = "requirements"
@@ -16,10 +18,7 @@ def _iter_json_files(root: str) -> Iterable[str]:
 
 
 def _write_jsonl(path: str, records: Iterable[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    jsonl_codec.write_jsonl(path, records)
 
 
 def _convert_terms(courses_dir: str) -> Tuple[int, int]:
@@ -0,0 +1,172 @@
+"""Persistent cache of parser output keyed by parser version and page content.
+
+SUIS pages rarely change between runs, yet every run re-parses them: the
+course-page scraper re-reads its HTML cache to hydrate new fields, and the
+schedule, catalog and minor scrapers parse identical listings day after day.
+:class:`ParseCache` stores each parser's structured result under
+``<root>/<parser>/v<version>-<format>/`` keyed by the SHA-256 of the page
+body (plus any extra arguments the parser takes), so a hit skips the HTML
+parser entirely.
+
+A parser opts in with :func:`cached_parser`; bumping its version constant
+moves it to a fresh directory and drops the old one, leaving every other
+parser's entries in place.  Results are stored as JSON, so a cached parser
+must return JSON-compatible values (tuples come back as lists); dict keys
+come back in the order the parser produced them.
+
+The cache is local-only state under ``.suis_cache`` (see ``.gitignore``) and
+is enabled per run with ``--parse-cache``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Optional, Set, TypeVar
+
+DEFAULT_PARSE_CACHE_DIR = os.path.join(".suis_cache", "parsed")
+# Part of every version directory name.  Entries keep the key order the parser
+# produced; earlier caches sorted keys and are dropped like a version bump.
+ENTRY_FORMAT = "ordered"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def cached_parser(version: int) -> Callable[[F], F]:
+    """Mark a module-level parser as cacheable at ``version``.
+
+    The first positional argument is the page: a string, or an object whose
+    ``html`` attribute holds it (``fetch_minors.MinorPage``).
+    """
+
+    def mark(fn: F) -> F:
+        fn.parser_version = int(version)  # type: ignore[attr-defined]
+        return fn
+
+    return mark
+
+
+def parser_version(fn: Callable[..., Any]) -> Optional[int]:
+    return getattr(fn, "parser_version", None)
+
+
+def content_key(*args: Any, **kwargs: Any) -> str:
+    """Return the SHA-256 hex digest identifying one parser call."""
+
+    body = args[0] if args else ""
+    if not isinstance(body, str):
+        body = body.html
+    digest = hashlib.sha256(body.encode("utf-8"))
+    if len(args) > 1 or kwargs:
+        extra = json.dumps([list(args[1:]), kwargs], sort_keys=True, separators=(",", ":"), default=str)
+        digest.update(b"\0" + extra.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """On-disk ``(parser, version, content digest) -> parsed result`` store."""
+
+    def __init__(self, root: str = DEFAULT_PARSE_CACHE_DIR):
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._prepared: Set[str] = set()
+
+    def _parser_name(self, fn: Callable[..., Any]) -> str:
+        # Named after the defining file, not ``__module__``: a scraper run as
+        # a script defines its parsers in ``__main__``.
+        module = os.path.splitext(os.path.basename(fn.__code__.co_filename))[0]
+        return f"{module}.{fn.__qualname__}"
+
+    def _version_dir(self, fn: Callable[..., Any]) -> str:
+        name = self._parser_name(fn)
+        parser_dir = os.path.join(self.root, name)
+        version_dir = os.path.join(parser_dir, f"v{parser_version(fn)}-{ENTRY_FORMAT}")
+        with self._lock:
+            if name not in self._prepared:
+                self._prepared.add(name)
+                # Entries written by other versions of this parser are stale.
+                if os.path.isdir(parser_dir):
+                    for entry in os.listdir(parser_dir):
+                        path = os.path.join(parser_dir, entry)
+                        if path != version_dir and os.path.isdir(path):
+                            shutil.rmtree(path, ignore_errors=True)
+        return version_dir
+
+    def _entry_path(self, fn: Callable[..., Any], digest: str) -> str:
+        return os.path.join(self._version_dir(fn), digest[:2], f"{digest}.json.gz")
+
+    def lookup(self, fn: Callable[..., Any], digest: str) -> Any:
+        """Return ``(True, result)`` for a cached call, else ``(False, None)``."""
+
+        try:
+            with gzip.open(self._entry_path(fn, digest), "rt", encoding="utf-8") as fh:
+                return True, json.load(fh)
+        except (OSError, ValueError, EOFError):
+            return False, None
+
+    def store(self, fn: Callable[..., Any], digest: str, result: Any) -> None:
+        path = self._entry_path(fn, digest)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        payload = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".entry.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh:
+                fh.write(payload.encode("utf-8"))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def parse(self, fn: Callable[..., Any], *args: Any, run: Optional[Callable[..., Any]] = None, **kwargs: Any) -> Any:
+        """Return ``fn(*args, **kwargs)``, from the cache when ``fn`` is a :func:`cached_parser`.
+
+        ``run`` performs a miss (``run(fn, *args, **kwargs)``), e.g.
+        :meth:`work_queue.ParsePool.parse`; by default ``fn`` is called inline.
+        """
+
+        if parser_version(fn) is None:
+            return run(fn, *args, **kwargs) if run is not None else fn(*args, **kwargs)
+        digest = content_key(*args, **kwargs)
+        hit, result = self.lookup(fn, digest)
+        if hit:
+            with self._lock:
+                self.hits += 1
+            return result
+        result = run(fn, *args, **kwargs) if run is not None else fn(*args, **kwargs)
+        self.store(fn, digest, result)
+        with self._lock:
+            self.misses += 1
+        return result
+
+
+def add_parse_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--parse-cache``/``--parse-cache-dir`` flags shared by the scrapers."""
+
+    parser.add_argument("--parse-cache", action="store_true", help="Reuse parser output for page bodies already parsed by the same parser version.")
+    parser.add_argument("--parse-cache-dir", default=DEFAULT_PARSE_CACHE_DIR, help="Parse-result cache directory (default: %(default)s).")
+
+
+def parse_cache_from_args(args: argparse.Namespace) -> Optional[ParseCache]:
+    """Return the cache selected by :func:`add_parse_cache_arguments` flags, if any."""
+
+    if not getattr(args, "parse_cache", False):
+        return None
+    return ParseCache(args.parse_cache_dir)
+
+
+def parse_cache_cli_args(args: argparse.Namespace) -> list:
+    """Return the parse-cache flags to forward to a scraper run as a subprocess."""
+
+    if not getattr(args, "parse_cache", False):
+        return []
+    return ["--parse-cache", "--parse-cache-dir", str(args.parse_cache_dir)]
@@ -1,32 +1,42 @@
 import argparse
 import datetime as _dt
+import itertools
 import json
 import math
 import os
 import re
 import time
 import concurrent.futures
-import threading
-import random
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
-import requests
 from bs4 import BeautifulSoup
-
+from lxml import etree
+
+import catalog_store
+import jsonl_codec
+from html_text import element_text, first_descendant
+from parse_cache import ParseCache, add_parse_cache_arguments, cached_parser, parse_cache_from_args
+from suis_archive import add_archive_arguments, archive_from_args
+from suis_http import DEFAULT_VALIDATORS_PATH, NO_RETRY, RetryPolicy, SuisClient, Validator, ValidatorStore
 from sync_coursepage_offerings import available_current_future_terms, reconcile_coursepage_offerings
+from work_queue import ParsePool
 
 
 BASE = "https://suis.sabanciuniv.edu/prod/"
 COURSEPAGE_ENDPOINT = "sabanci_www.p_get_courses"
+USER_AGENT = "surriculum-scraper/1.0 (+https://github.com/beficent/surriculum)"
 
 
 DEFAULT_COURSES_DIR = "courses"
 DEFAULT_OUT_BASIC_SCIENCE = os.path.join(DEFAULT_COURSES_DIR, "basic_science_credits.jsonl")
 DEFAULT_OUT_ALL_INFO = os.path.join(DEFAULT_COURSES_DIR, "all_coursepage_info.jsonl")
 DEFAULT_CACHE_DIR = os.path.join(DEFAULT_COURSES_DIR, "coursepage_html_cache")
+# Bump whenever parse_coursepage_html output changes; --parse-cache entries
+# from older versions are then discarded.
+COURSEPAGE_PARSER_VERSION = 1
 
 GENERAL_REQUIREMENT_FIELDS = (
     "general_requirements",
@@ -231,7 +241,8 @@ def ensure_general_requirement_fields(record: Dict[str, Any], *, course_id: str
     )
 
 
-def parse_coursepage_html(html: str, *, source_url: str) -> Dict[str, Any]:
+def parse_coursepage_html_bs4(html: str, *, source_url: str) -> Dict[str, Any]:
+    """Reference BeautifulSoup parser; :func:`parse_coursepage_html` must match it."""
     soup = BeautifulSoup(html, "lxml")
 
     header_text = ""
@@ -358,6 +369,41 @@ def parse_coursepage_html(html: str, *, source_url: str) -> Dict[str, Any]:
                 elif collecting == "general":
                     general_requirements.append(text)
 
+    return _coursepage_result(
+        header_text=header_text,
+        title=title,
+        parsed_subj=parsed_subj,
+        parsed_numb=parsed_numb,
+        su_credits=su_credits,
+        ects_total=ects_total,
+        engineering=engineering,
+        basic_science=basic_science,
+        description=description,
+        prerequisites=prerequisites,
+        corequisites=corequisites,
+        general_requirements=general_requirements,
+        last_offered=last_offered,
+        source_url=source_url,
+    )
+
+
+def _coursepage_result(
+    *,
+    header_text: str,
+    title: Optional[str],
+    parsed_subj: Optional[str],
+    parsed_numb: Optional[str],
+    su_credits: Optional[float],
+    ects_total: Optional[float],
+    engineering: Optional[float],
+    basic_science: Optional[float],
+    description: Optional[str],
+    prerequisites: List[str],
+    corequisites: List[str],
+    general_requirements: List[str],
+    last_offered: List[Dict[str, Any]],
+    source_url: str,
+) -> Dict[str, Any]:
     general_requirements_text = normalize_general_requirements(" ".join(general_requirements))
     parsed_course_id = f"{parsed_subj or ''}{parsed_numb or ''}"
 
@@ -390,8 +436,201 @@ def parse_coursepage_html(html: str, *, source_url: str) -> Dict[str, Any]:
     return result
 
 
+# XPath pre-filters for the document-wide scans.  Both are necessary
+# conditions only (the string-value is a superset of the get_text() pieces);
+# the exact BeautifulSoup tests still run on the candidates they return.  The
+# long s is folded in because ``re.IGNORECASE`` matches it against ``S``.
+_XP_ECTS_CELLS = etree.XPath("//td[contains(translate(., 'ectsſ', 'ECTSS'), 'ECTS')]")
+_XP_OFFERED_TABLES = etree.XPath("//table[contains(translate(., 'OFERD', 'oferd'), 'offered')]")
+
+_HEADER_RE = re.compile(r"^\s*([A-Z]+)\s+([0-9A-Z]+)\s+(.*?)\s*$")
+_CREDIT_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*Credits?\b", flags=re.IGNORECASE)
+_ECTS_WORD_RE = re.compile(r"\bECTS\b", flags=re.IGNORECASE)
+_ECTS_BREAKDOWN_HINT_RE = re.compile(r"\bENGINEERING\b|\bBASIC\b|\bECTS\s+Credit", flags=re.IGNORECASE)
+
+
+@cached_parser(COURSEPAGE_PARSER_VERSION)
+def parse_coursepage_html(html: str, *, source_url: str) -> Dict[str, Any]:
+    """Parse one SUIS course page.
+
+    Walks the lxml tree directly and uses compiled XPath to narrow the
+    document-wide ECTS and "Last Offered Terms" scans, producing the same dict
+    as :func:`parse_coursepage_html_bs4`.  Pages lxml cannot take as a string
+    (empty documents, XML encoding declarations) go through the reference
+    parser.
+    """
+    try:
+        root = etree.HTML(html)
+    except (ValueError, etree.LxmlError):
+        root = None
+    if root is None:
+        return parse_coursepage_html_bs4(html, source_url=source_url)
+
+    header_text = ""
+    su_credits = None
+    title = None
+    parsed_subj = None
+    parsed_numb = None
+
+    first_th = next(root.iter("th"), None)
+    if first_th is not None:
+        header_text = element_text(first_th)
+        m = _HEADER_RE.match(header_text)
+        if m:
+            parsed_subj, parsed_numb, title = m.group(1), m.group(2), m.group(3)
+        else:
+            title = header_text.strip() or None
+
+        header_row = next(first_th.iterancestors("tr"), None)
+        ths = list(header_row.iterdescendants("th")) if header_row is not None else []
+        if len(ths) >= 2:
+            m_credit = _CREDIT_RE.search(element_text(ths[1]))
+            if m_credit:
+                su_credits = _to_float(m_credit.group(1))
+
+    description = None
+    ects_total = None
+    engineering = None
+    basic_science = None
+    prerequisites: List[str] = []
+    corequisites: List[str] = []
+    general_requirements: List[str] = []
+    last_offered: List[Dict[str, Any]] = []
+
+    outer_table = next(root.iter("table"), None)
+    if outer_table is not None:
+        trs = [child for child in outer_table if child.tag == "tr"] or list(outer_table.iterdescendants("tr"))
+        for tr in trs[1:]:
+            td = first_descendant(tr, "td")
+            if td is None:
+                continue
+            if first_descendant(td, "table") is not None:
+                continue
+            text = element_text(td)
+            if not text:
+                continue
+            if first_descendant(td, "b") is not None:
+                continue
+            description = text
+            break
+
+    for td in _XP_ECTS_CELLS(root):
+        txt = element_text(td)
+        if not txt or not _ECTS_WORD_RE.search(txt):
+            continue
+        if not _ECTS_BREAKDOWN_HINT_RE.search(txt):
+            continue
+        ects_total, engineering, basic_science = parse_ects_breakdown(txt)
+        if ects_total is not None:
+            break
+
+    for table in _XP_OFFERED_TABLES(root):
+        headers = [element_text(cell).lower() for cell in table if cell.tag == "td"]
+        if not headers:
+            headers = [element_text(cell).lower() for cell in itertools.islice(table.iterdescendants("th", "td"), 3)]
+        if headers and any("last offered terms" in h for h in headers):
+            for row in list(table.iterdescendants("tr"))[1:]:
+                cols = [element_text(c) for c in row.iterdescendants("td")]
+                if len(cols) >= 3:
+                    last_offered.append(
+                        {
+                            "term": cols[0],
+                            "course_name": cols[1],
+                            "su_credit": _to_float(cols[2]) if cols[2] else None,
+                        }
+                    )
+            break
+
+    # Same block scan as the reference parser, but a cell's full text (which
+    # for the "Last Offered Terms" row spans a whole nested table) is only
+    # built when it can be collected or decides whether the row is skipped.
+    blocks = {"pre": prerequisites, "co": corequisites, "general": general_requirements}
+    collecting: Optional[str] = None  # "pre" | "co" | "general"
+    if outer_table is not None:
+        for tr in outer_table.iterdescendants("tr"):
+            td = first_descendant(tr, "td")
+            if td is None:
+                continue
+            b = first_descendant(td, "b")
+            if b is None:
+                if collecting is None:
+                    continue
+                text = element_text(td)
+                if text and text != "\xa0":
+                    blocks[collecting].append(text)
+                continue
+            b_text = element_text(b)
+            if not b_text:
+                text = element_text(td)
+                if text and text != "\xa0":
+                    collecting = None
+                continue
+            label = b_text.lower()
+            if "prerequisite" in label:
+                collecting = "pre"
+            elif "corequisite" in label:
+                collecting = "co"
+            elif "general requirements" in label:
+                collecting = "general"
+            else:
+                collecting = None
+                continue
+            rest = element_text(td)[len(b_text) :].strip()
+            if rest:
+                blocks[collecting].append(rest)
+
+    return _coursepage_result(
+        header_text=header_text,
+        title=title,
+        parsed_subj=parsed_subj,
+        parsed_numb=parsed_numb,
+        su_credits=su_credits,
+        ects_total=ects_total,
+        engineering=engineering,
+        basic_science=basic_science,
+        description=description,
+        prerequisites=prerequisites,
+        corequisites=corequisites,
+        general_requirements=general_requirements,
+        last_offered=last_offered,
+        source_url=source_url,
+    )
+
+
+def compare_coursepage_parsers(html: str, *, source_url: str = "") -> List[str]:
+    """Return the fields on which the lxml and BeautifulSoup parsers disagree."""
+    fast = parse_coursepage_html(html, source_url=source_url)
+    reference = parse_coursepage_html_bs4(html, source_url=source_url)
+    fields = sorted((set(fast) | set(reference)) - {"scraped_at"})
+    missing = object()
+    return [field for field in fields if fast.get(field, missing) != reference.get(field, missing)]
+
+
+def check_coursepage_parsers(cache_dir: str) -> Dict[str, List[str]]:
+    """Run both parsers over every cached page; returns ``{file name: divergent fields}``."""
+    divergent: Dict[str, List[str]] = {}
+    for path in sorted(Path(cache_dir).glob("*.html")):
+        fields = compare_coursepage_parsers(path.read_text(encoding="utf-8"), source_url=path.as_uri())
+        if fields:
+            divergent[path.name] = fields
+    return divergent
+
+
 def iter_course_json_paths(courses_dir: str) -> Iterable[str]:
-    for root, _, files in os.walk(courses_dir):
+    """Yield catalog-like JSON files other than the program catalog store and its views.
+
+    Program catalogs of terms in ``courses/catalog/`` are read from the store
+    (see :func:`iter_catalog_sources`); their ``<MAJOR>.jsonl`` views are
+    compiled copies and are skipped here.
+    """
+    store_root = catalog_store.store_dir(courses_dir)
+    stored = set(catalog_store.store_terms(courses_dir))
+    for root, dirs, files in os.walk(courses_dir):
+        if os.path.normpath(root) == os.path.normpath(store_root):
+            dirs[:] = []
+            continue
+        if os.path.normpath(os.path.dirname(root)) == os.path.normpath(courses_dir) and os.path.basename(root) in stored:
+            continue
         for fname in files:
             if not (fname.endswith(".json") or fname.endswith(".jsonl")):
                 continue
@@ -443,14 +682,7 @@ def collect_catalog_courses(
     expected_breakdown: set[str] = set()
     fallback_by_course_id: Dict[str, Dict[str, Any]] = {}
 
-    paths = sorted(
-        iter_course_json_paths(courses_dir),
-        key=lambda path: _catalog_path_sort_key(path, courses_dir),
-    )
-    for path in paths:
-        data = read_course_list(path)
-        if not data:
-            continue
+    for data in iter_catalog_sources(courses_dir):
         for item in data:
             if not isinstance(item, dict):
                 continue
@@ -483,40 +715,41 @@ def collect_catalog_courses(
     return unique, expected_breakdown, fallback_by_course_id
 
 
+def iter_catalog_sources(courses_dir: str) -> Iterator[Iterable[Dict[str, Any]]]:
+    """Yield catalog row batches, newest term first, in a stable path order.
+
+    A stored term contributes its shared course rows plus the program rows
+    that differ from them (:meth:`catalog_store.TermCatalog.intrinsic_rows`)
+    in the place its ``<term>/<MAJOR>.jsonl`` views would have sorted.
+    """
+    catalogs = dict(catalog_store.iter_term_catalogs(courses_dir))
+    sources = [
+        (_catalog_path_sort_key(os.path.join(courses_dir, term, ""), courses_dir), term, None)
+        for term in catalogs
+    ]
+    sources.extend(
+        (_catalog_path_sort_key(path, courses_dir), None, path)
+        for path in iter_course_json_paths(courses_dir)
+    )
+    for _key, term, path in sorted(sources, key=lambda source: source[0]):
+        if term is not None:
+            yield catalogs[term].intrinsic_rows()
+        else:
+            data = read_course_list(path)
+            if data:
+                yield data
+
+
 def read_course_list(path: str) -> List[Dict[str, Any]]:
     if path.endswith(".jsonl"):
-        records: List[Dict[str, Any]] = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(rec, dict):
-                    records.append(rec)
-        return records
+        return [rec for rec in jsonl_codec.iter_jsonl(path, skip_invalid=True) if isinstance(rec, dict)]
 
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except json.JSONDecodeError:
         # Best-effort fallback: treat as JSONL if a .json file already migrated.
-        records: List[Dict[str, Any]] = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(rec, dict):
-                    records.append(rec)
-        return records
+        return [rec for rec in jsonl_codec.iter_jsonl(path, skip_invalid=True) if isinstance(rec, dict)]
     except Exception:
         return []
 
@@ -599,26 +832,25 @@ def read_jsonl_by_course_id(path: str) -> Dict[str, Dict[str, Any]]:
     if not os.path.exists(path):
         return {}
     out: Dict[str, Dict[str, Any]] = {}
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            course_id = obj.get("course_id")
-            if isinstance(course_id, str) and course_id:
-                out[course_id] = obj
+    for obj in jsonl_codec.iter_jsonl(path, skip_invalid=True):
+        course_id = obj.get("course_id")
+        if isinstance(course_id, str) and course_id:
+            out[course_id] = obj
     return out
 
 
 def hydrate_general_requirement_fields_from_cache(
     coursepage_info: Dict[str, Dict[str, Any]],
     cache_dir: str,
+    *,
+    parse_cache: Optional[ParseCache] = None,
 ) -> int:
-    """Reparse cached pages for additive fields without altering old metadata."""
+    """Reparse cached pages for additive fields without altering old metadata.
+
+    With a ``parse_cache``, pages whose content was parsed before are not
+    parsed again.
+    """
+    parse = ParsePool(cache=parse_cache).parse
     hydrated = 0
     for course_id, record in coursepage_info.items():
         if all(field in record for field in GENERAL_REQUIREMENT_FIELDS):
@@ -633,7 +865,8 @@ def hydrate_general_requirement_fields_from_cache(
             continue
         try:
             with open(cache_path, "r", encoding="utf-8") as handle:
-                parsed = parse_coursepage_html(
+                parsed = parse(
+                    parse_coursepage_html,
                     handle.read(),
                     source_url=str(record.get("source_url") or build_coursepage_url(subject, number)),
                 )
@@ -647,22 +880,18 @@ def hydrate_general_requirement_fields_from_cache(
     return hydrated
 
 
-def write_jsonl(path: str, records: List[Dict[str, Any]]) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+def write_jsonl(path: str, records: List[Dict[str, Any]], *, stats: Optional[jsonl_codec.WriteStats] = None) -> bool:
+    """Replace ``path`` with ``records`` unless it already holds them; returns whether it was written."""
+    return jsonl_codec.write_jsonl_if_changed(path, records, stats=stats)
 
 
 def fetch_coursepage_html(
-    session: requests.Session,
+    client: SuisClient,
     course: CourseKey,
     *,
     cache_dir: Optional[str],
-    timeout_s: float,
-    retries: int = 3,
-    backoff_s: float = 0.5,
-    net_semaphore: Optional[threading.Semaphore] = None,
+    timeout_s: Optional[float] = None,
+    retry: Optional[RetryPolicy] = None,
     read_cache: bool = True,
     write_cache: bool = True,
 ) -> Tuple[str, str]:
@@ -673,26 +902,7 @@ def fetch_coursepage_html(
         with open(cache_path, "r", encoding="utf-8") as f:
             return f.read(), url
 
-    last_err: Optional[BaseException] = None
-    attempts = max(0, int(retries)) + 1
-    for attempt in range(attempts):
-        try:
-            if net_semaphore is None:
-                resp = session.get(url, timeout=timeout_s)
-            else:
-                with net_semaphore:
-                    resp = session.get(url, timeout=timeout_s)
-            resp.raise_for_status()
-            html = resp.text
-            break
-        except Exception as e:
-            last_err = e
-            if attempt >= attempts - 1:
-                raise
-            sleep_for = float(backoff_s) * (2**attempt) + random.uniform(0, 0.25)
-            time.sleep(sleep_for)
-    else:
-        raise last_err if last_err else RuntimeError("failed to fetch course page")
+    html = client.get_text(url, timeout_s=timeout_s, retry=retry)
 
     if write_cache and cache_path:
         os.makedirs(os.path.dirname(cache_path), exist_ok=True)
@@ -702,7 +912,51 @@ def fetch_coursepage_html(
     return html, url
 
 
+def fetch_coursepage_html_if_changed(
+    client: SuisClient,
+    course: CourseKey,
+    *,
+    cache_dir: Optional[str],
+    timeout_s: Optional[float] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> Tuple[str, str, bool, Optional[Validator]]:
+    """Always hit the network, but report whether the page changed since the last run.
+
+    The cached copy (if any) lets the client send a conditional request and
+    answer a ``304`` locally; the body hash in the client's validator store
+    decides ``changed`` when SUIS sends no validators.  The returned validator
+    is recorded by the caller only once the page has parsed as valid.
+    """
+    url = build_coursepage_url(course.subj_code, course.crse_numb)
+    cache_path = os.path.join(cache_dir, f"{course.course_id}.html") if cache_dir else None
+    cached_text = None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached_text = f.read()
+    html, changed, validator = client.get_if_changed(url, cached_text=cached_text, timeout_s=timeout_s, retry=retry)
+    return html, url, changed, validator
+
+
 def update_course_json_files(courses_dir: str, credits_by_course_id: Dict[str, Dict[str, float]]) -> None:
+    # Stored terms are updated in the store; only views whose rows changed
+    # are recompiled.
+    updates = {
+        course_id: {"Basic_Science": credits.get("Basic_Science", 0.0), "Engineering": credits.get("Engineering", 0.0)}
+        for course_id, credits in credits_by_course_id.items()
+        if credits
+    }
+    changed_catalogs = {}
+    changed_majors = {}
+    for term, catalog in catalog_store.iter_term_catalogs(courses_dir):
+        changed = catalog.apply_course_fields(updates)
+        if changed:
+            changed_catalogs[term] = catalog
+            changed_majors[term] = changed
+    if changed_catalogs:
+        catalog_store.write_term_catalogs(courses_dir, changed_catalogs)
+        for term, catalog in changed_catalogs.items():
+            catalog_store.compile_views(courses_dir, term, catalog, changed_majors[term])
+
     for path in iter_course_json_paths(courses_dir):
         data = read_course_list(path)
         if not data:
@@ -727,9 +981,7 @@ def update_course_json_files(courses_dir: str, credits_by_course_id: Dict[str, D
 
         if changed:
             if path.endswith(".jsonl"):
-                with open(path, "w", encoding="utf-8") as f:
-                    for rec in data:
-                        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                jsonl_codec.write_jsonl(path, data)
             else:
                 with open(path, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
@@ -740,6 +992,84 @@ def _is_valid_scrape(parsed: Dict[str, Any], course: CourseKey) -> bool:
     return bool(subj and numb and subj == course.subj_code and str(numb) == str(course.crse_numb))
 
 
+def coursepage_records(
+    course: CourseKey,
+    parsed: Dict[str, Any],
+    *,
+    scrape_ok: bool,
+    scraped_at: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """Build the ``all_coursepage_info`` and ``basic_science_credits`` records of one parsed page."""
+    course_id = course.course_id
+    # A --parse-cache hit carries the time of the first parse, so the time is
+    # stamped here rather than taken from ``parsed``.
+    scraped_at = scraped_at or _now_iso()
+    info_record = {
+        "course_id": course_id,
+        "subj_code": course.subj_code,
+        "crse_numb": course.crse_numb,
+        "scrape_ok": scrape_ok,
+        "scrape_error": None if scrape_ok else "invalid_coursepage_response",
+        **parsed,
+        "scraped_at": scraped_at,
+    }
+
+    ects_total = parsed.get("ects")
+    eng_raw = parsed.get("engineering")
+    bs_raw = parsed.get("basic_science")
+    breakdown_present = isinstance(eng_raw, (int, float)) or isinstance(bs_raw, (int, float))
+    # Many non-FENS/FENS-like courses have no ENGINEERING/BASIC breakdown on
+    # the course page; treat that as 0 credits (but keep breakdown_present
+    # so we can distinguish it from parse failures on courses that are
+    # expected to have a breakdown).
+    eng_val = float(eng_raw) if isinstance(eng_raw, (int, float)) else 0.0
+    bs_val = float(bs_raw) if isinstance(bs_raw, (int, float)) else 0.0
+    credit_record = {
+        "course_id": course_id,
+        "subj_code": course.subj_code,
+        "crse_numb": course.crse_numb,
+        "scrape_ok": scrape_ok,
+        "scrape_error": None if scrape_ok else "invalid_coursepage_response",
+        "ects": ects_total,
+        "engineering": eng_val,
+        "basic_science": bs_val,
+        "breakdown_present": breakdown_present,
+        "source_url": parsed.get("source_url"),
+        "scraped_at": scraped_at,
+    }
+    return course_id, info_record, credit_record
+
+
+def reparse_cached_coursepages(
+    courses: Iterable[CourseKey],
+    cache_dir: str,
+    *,
+    parse_pool: ParsePool,
+    workers: int = 1,
+) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """Yield the records of every course whose page is in ``cache_dir``, without network access.
+
+    Pages are read and handed to ``parse_pool`` by ``workers`` threads and
+    yielded in ``courses`` order.  A page that fails :func:`_is_valid_scrape`
+    yields ``scrape_ok=False`` records, as an invalid live response would.
+    Records keep the cache file's modification time as ``scraped_at``, the
+    time the page was fetched.
+    """
+
+    def reparse(course: CourseKey) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        cache_path = os.path.join(cache_dir, f"{course.course_id}.html")
+        with open(cache_path, "r", encoding="utf-8") as handle:
+            html = handle.read()
+        fetched_at = _dt.datetime.fromtimestamp(os.path.getmtime(cache_path), _dt.timezone.utc).isoformat()
+        url = build_coursepage_url(course.subj_code, course.crse_numb)
+        parsed = parse_pool.parse(parse_coursepage_html, html, source_url=url)
+        return coursepage_records(course, parsed, scrape_ok=_is_valid_scrape(parsed, course), scraped_at=fetched_at)
+
+    cached = [course for course in courses if os.path.exists(os.path.join(cache_dir, f"{course.course_id}.html"))]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
+        yield from executor.map(reparse, cached)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description=(
@@ -765,12 +1095,40 @@ def main() -> int:
         default=4,
         help="Maximum number of simultaneous network requests (useful to avoid throttling).",
     )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse course pages in N worker processes instead of the network threads (0 = parse inline).",
+    )
+    parser.add_argument("--adaptive", action="store_true", help="Treat --max-inflight as a ceiling and adapt the in-flight limit to SUIS latency and errors (AIMD).")
     parser.add_argument("--retries", type=int, default=3, help="Retry count for network errors and invalid responses.")
     parser.add_argument("--backoff", type=float, default=0.5, help="Base backoff seconds for retries (exponential).")
     parser.add_argument("--sleep", type=float, default=0.0, help="Optional sleep seconds per request (applied inside each worker).")
     parser.add_argument("--max-courses", type=int, default=0, help="If set, only scrape up to N missing courses.")
     parser.add_argument("--no-update-course-json", action="store_true", help="Do not rewrite program course JSON files.")
     parser.add_argument("--from-file", default="", help="Parse a local coursepage HTML file (debug) and print JSON to stdout.")
+    parser.add_argument(
+        "--check-parser",
+        action="store_true",
+        help="Run the lxml and BeautifulSoup parsers over every page in --cache-dir, report divergences and exit.",
+    )
+    parser.add_argument(
+        "--reparse-cache",
+        action="store_true",
+        help=(
+            "Rebuild the output files by re-parsing every catalog course's page in --cache-dir "
+            "(in --parse-processes worker processes, default: one per CPU) without network requests."
+        ),
+    )
+    parser.add_argument(
+        "--validators",
+        default=DEFAULT_VALIDATORS_PATH,
+        help="Validator store (ETag/Last-Modified/body hash per URL); --refresh skips re-parsing pages that are unchanged.",
+    )
+    parser.add_argument("--no-validators", action="store_true", help="Do not read or update the validator store.")
+    add_archive_arguments(parser)
+    add_parse_cache_arguments(parser)
 
     args = parser.parse_args()
 
@@ -781,6 +1139,23 @@ def main() -> int:
         print(json.dumps(info, indent=2, ensure_ascii=False))
         return 0
 
+    if args.check_parser:
+        if not os.path.isdir(args.cache_dir):
+            raise SystemExit(f"Missing course-page cache directory: {args.cache_dir}")
+        started = time.perf_counter()
+        divergent = check_coursepage_parsers(args.cache_dir)
+        for name, fields in divergent.items():
+            print(f"{name}: {', '.join(fields)}")
+        pages = len(list(Path(args.cache_dir).glob("*.html")))
+        print(f"Compared {pages} cached pages in {time.perf_counter() - started:.2f}s; {len(divergent)} diverged.")
+        return 1 if divergent else 0
+
+    if args.reparse_cache:
+        if args.refresh or args.no_cache:
+            raise SystemExit("--reparse-cache reads the HTML cache; it cannot be combined with --refresh or --no-cache.")
+        if not os.path.isdir(args.cache_dir):
+            raise SystemExit(f"Missing course-page cache directory: {args.cache_dir}")
+
     courses_dir = args.courses_dir
     if not os.path.isdir(courses_dir):
         raise SystemExit(f"Missing courses directory: {courses_dir}")
@@ -788,8 +1163,9 @@ def main() -> int:
     existing_info = read_jsonl_by_course_id(args.out_all_info)
     existing_credits = read_jsonl_by_course_id(args.out_basic_science)
     cache_dir = None if args.no_cache else args.cache_dir
-    if cache_dir and not args.refresh:
-        hydrated = hydrate_general_requirement_fields_from_cache(existing_info, cache_dir)
+    parse_cache = parse_cache_from_args(args)
+    if cache_dir and not args.refresh and not args.reparse_cache:
+        hydrated = hydrate_general_requirement_fields_from_cache(existing_info, cache_dir, parse_cache=parse_cache)
         if hydrated:
             print(f"Hydrated General Requirements fields from {hydrated} cached course pages.")
 
@@ -818,6 +1194,9 @@ def main() -> int:
                 needed.append(unique_courses[course_id])
                 continue
 
+    if args.reparse_cache:
+        # Every cached page is re-parsed below; nothing is fetched.
+        needed = []
     if args.max_courses and args.max_courses > 0:
         needed = needed[: args.max_courses]
 
@@ -827,21 +1206,15 @@ def main() -> int:
         if (existing_info.get(course.course_id) or {}).get("scrape_ok") is True
     }
 
-    tls = threading.local()
-
-    def get_session() -> requests.Session:
-        sess = getattr(tls, "session", None)
-        if sess is None:
-            sess = requests.Session()
-            sess.headers.update(
-                {
-                    "User-Agent": "surriculum-scraper/1.0 (+https://github.com/beficent/surriculum)",
-                }
-            )
-            tls.session = sess
-        return sess
-
-    net_semaphore = threading.Semaphore(max(1, int(args.max_inflight)))
+    client = SuisClient(
+        user_agent=USER_AGENT,
+        timeout_s=args.timeout,
+        retry=RetryPolicy(retries=int(args.retries), backoff_s=float(args.backoff)),
+        max_inflight=max(1, int(args.max_inflight)),
+        adaptive=bool(args.adaptive),
+        validators=None if args.no_validators else ValidatorStore(args.validators),
+        archive=archive_from_args(args),
+    )
 
     accepted_scrapes = 0
     successful_scrapes = 0
@@ -864,6 +1237,19 @@ def main() -> int:
         existing_credits[course_id] = credit_record
         return True
 
+    def unchanged_result(course_id: str) -> Optional[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        # Reusable only when both outputs hold a complete valid record; the
+        # validator store is saved only after those outputs are written.
+        info_record = existing_info.get(course_id)
+        credit_record = existing_credits.get(course_id)
+        if not info_record or not credit_record:
+            return None
+        if info_record.get("scrape_ok") is not True or credit_record.get("scrape_ok") is not True:
+            return None
+        if any(field not in info_record for field in GENERAL_REQUIREMENT_FIELDS):
+            return None
+        return course_id, info_record, credit_record
+
     def scrape_one(course: CourseKey) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
         attempts = max(0, int(args.retries)) + 1
         last_err: Optional[BaseException] = None
@@ -871,19 +1257,34 @@ def main() -> int:
         valid_parsed: Optional[Dict[str, Any]] = None
         for attempt in range(attempts):
             try:
-                session = get_session()
-                html, url = fetch_coursepage_html(
-                    session,
-                    course,
-                    cache_dir=cache_dir,
-                    timeout_s=args.timeout,
-                    retries=0,
-                    net_semaphore=net_semaphore,
-                    read_cache=not args.refresh,
-                    write_cache=not args.refresh,
-                )
-                parsed = parse_coursepage_html(html, source_url=url)
+                # Invalid pages are retried here as well, so the HTTP layer
+                # makes a single attempt per loop iteration.
+                validator = None
+                if args.refresh and client.validators is not None:
+                    html, url, changed, validator = fetch_coursepage_html_if_changed(
+                        client,
+                        course,
+                        cache_dir=cache_dir,
+                        retry=NO_RETRY,
+                    )
+                    reusable = None if changed else unchanged_result(course.course_id)
+                    if reusable is not None:
+                        return reusable
+                else:
+                    html, url = fetch_coursepage_html(
+                        client,
+                        course,
+                        cache_dir=cache_dir,
+                        retry=NO_RETRY,
+                        read_cache=not args.refresh,
+                        write_cache=not args.refresh,
+                    )
+                parsed = parse_pool.parse(parse_coursepage_html, html, source_url=url)
                 if _is_valid_scrape(parsed, course):
+                    # Record the new hash only now, so a retry after a failed
+                    # attempt still compares against the previous run's hash
+                    # instead of reusing the old records as unchanged.
+                    client.record_validator(url, validator)
                     if args.refresh and cache_dir:
                         cache_path = os.path.join(cache_dir, f"{course.course_id}.html")
                         os.makedirs(os.path.dirname(cache_path), exist_ok=True)
@@ -902,8 +1303,7 @@ def main() -> int:
                         pass
                 if attempt >= attempts - 1:
                     break
-                sleep_for = float(args.backoff) * (2**attempt) + random.uniform(0, 0.25)
-                time.sleep(sleep_for)
+                time.sleep(client.retry.delay(attempt))
                 continue
             except Exception as e:
                 last_err = e
@@ -916,8 +1316,7 @@ def main() -> int:
                         pass
             if attempt >= attempts - 1:
                 break
-            sleep_for = float(args.backoff) * (2**attempt) + random.uniform(0, 0.25)
-            time.sleep(sleep_for)
+            time.sleep(client.retry.delay(attempt))
 
         if valid_parsed is not None:
             parsed = valid_parsed
@@ -928,43 +1327,31 @@ def main() -> int:
         else:
             raise last_err if last_err else RuntimeError("failed to scrape course page")
 
-        course_id = course.course_id
-        info_record = {
-            "course_id": course_id,
-            "subj_code": course.subj_code,
-            "crse_numb": course.crse_numb,
-            "scrape_ok": scrape_ok,
-            "scrape_error": None if scrape_ok else "invalid_coursepage_response",
-            **parsed,
-        }
-
-        ects_total = parsed.get("ects")
-        eng_raw = parsed.get("engineering")
-        bs_raw = parsed.get("basic_science")
-        breakdown_present = isinstance(eng_raw, (int, float)) or isinstance(bs_raw, (int, float))
-        # Many non-FENS/FENS-like courses have no ENGINEERING/BASIC breakdown on
-        # the course page; treat that as 0 credits (but keep breakdown_present
-        # so we can distinguish it from parse failures on courses that are
-        # expected to have a breakdown).
-        eng_val = float(eng_raw) if isinstance(eng_raw, (int, float)) else 0.0
-        bs_val = float(bs_raw) if isinstance(bs_raw, (int, float)) else 0.0
-        credit_record = {
-            "course_id": course_id,
-            "subj_code": course.subj_code,
-            "crse_numb": course.crse_numb,
-            "scrape_ok": scrape_ok,
-            "scrape_error": None if scrape_ok else "invalid_coursepage_response",
-            "ects": ects_total,
-            "engineering": eng_val,
-            "basic_science": bs_val,
-            "breakdown_present": breakdown_present,
-            "source_url": parsed.get("source_url"),
-            "scraped_at": parsed.get("scraped_at"),
-        }
+        records = coursepage_records(course, parsed, scrape_ok=scrape_ok)
         if args.sleep and args.sleep > 0:
             time.sleep(args.sleep)
-        return course_id, info_record, credit_record
+        return records
 
+    if args.reparse_cache:
+        processes = int(args.parse_processes) or (os.cpu_count() or 1)
+        parse_pool = ParsePool(processes, cache=parse_cache)
+        started = time.perf_counter()
+        reparsed = 0
+        for course_id, info_record, credit_record in reparse_cached_coursepages(
+            [unique_courses[course_id] for course_id in sorted(unique_courses)],
+            args.cache_dir,
+            parse_pool=parse_pool,
+            workers=2 * processes,
+        ):
+            reparsed += 1
+            if store_scrape_result(course_id, info_record, credit_record):
+                accepted_scrapes += 1
+            if info_record.get("scrape_ok") is True:
+                successful_scrapes += 1
+                successful_course_ids.add(course_id)
+        print(f"Re-parsed {reparsed} cached course pages in {time.perf_counter() - started:.2f}s.")
+    else:
+        parse_pool = ParsePool(args.parse_processes if needed else 0, cache=parse_cache)
     if needed:
         workers = max(1, int(args.workers))
         if workers == 1:
@@ -998,6 +1385,11 @@ def main() -> int:
                     completed += 1
                     if completed % 200 == 0:
                         print(f"... scraped {completed}/{len(needed)}")
+    parse_pool.shutdown()
+    if parse_cache is not None:
+        print(f"Parse cache: {parse_cache.hits} hits, {parse_cache.misses} misses.")
+
+    client.save_archive()
 
     if args.refresh and known_valid_attempts:
         known_valid_successes = len(successful_course_ids.intersection(known_valid_attempts))
@@ -1017,8 +1409,12 @@ def main() -> int:
         ensure_general_requirement_fields(record, course_id=course_id)
 
     # Write cumulative outputs (deterministic ordering).
-    write_jsonl(args.out_all_info, [existing_info[k] for k in sorted(existing_info.keys())])
-    write_jsonl(args.out_basic_science, [existing_credits[k] for k in sorted(existing_credits.keys())])
+    outputs = jsonl_codec.WriteStats()
+    write_jsonl(args.out_all_info, [existing_info[k] for k in sorted(existing_info.keys())], stats=outputs)
+    write_jsonl(args.out_basic_science, [existing_credits[k] for k in sorted(existing_credits.keys())], stats=outputs)
+    print(f"Course-page outputs: {outputs}")
+    if client.validators is not None:
+        client.validators.save()
 
     schedule_dir = Path(courses_dir) / "schedule"
     schedule_terms = available_current_future_terms(schedule_dir)
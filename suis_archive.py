@@ -0,0 +1,277 @@
+"""Content-addressed archive of SUIS responses shared by every scraper.
+
+Bodies are stored once per SHA-256 digest as gzip files under
+``<root>/objects/``; ``<root>/index.json`` maps each request key (the URL, or
+method + URL + form data for POSTs) to the digest of its latest body and when
+it was fetched and last used.
+
+:class:`suis_http.SuisClient` consults the archive before going to the
+network.  A GET whose endpoint has a TTL (see :data:`DEFAULT_TTLS`) is served
+locally while its archived body is younger than that TTL, so repeat fetches
+inside one run -- or a re-run the same day -- cost nothing.  Volatile endpoints
+(schedule listings, seat counts) have no TTL: they are archived but always
+re-fetched.  In replay mode every request is answered from the archive and a
+miss is an error, which lets parser changes be re-run over yesterday's
+responses with no network at all.
+
+The archive is local-only state (see ``.gitignore``); :meth:`ResponseArchive.save`
+writes the index atomically and evicts least-recently-used bodies beyond the
+size budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_ARCHIVE_DIR = os.path.join(".suis_cache", "archive")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_HOUR = 3600.0
+
+# Seconds an archived body may be served without a network request, keyed by
+# SUIS procedure name.  Kept below the daily refresh interval so each nightly
+# run still sees fresh pages; endpoints not listed are never served locally.
+DEFAULT_TTLS: Dict[str, float] = {
+    "SU_DEGREE.p_list_degree": 12 * _HOUR,
+    "SU_DEGREE.p_select_term": 12 * _HOUR,
+    "SU_DEGREE.p_degree_detail": 12 * _HOUR,
+    "SU_DEGREE.p_list_courses": 12 * _HOUR,
+    "sabanci_www.p_get_courses": 12 * _HOUR,
+}
+
+
+class ArchiveMiss(LookupError):
+    """Replay mode was asked for a response that was never archived."""
+
+
+class ArchivedResponse:
+    """Minimal stand-in for ``requests.Response`` served from the archive."""
+
+    status_code = 200
+
+    def __init__(self, text: str):
+        self.text = text
+        self.headers: Dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def request_key(method: str, url: str, data: Any = None) -> str:
+    """Return the archive key for one request."""
+
+    method = str(method or "GET").upper()
+    if method == "GET" and data is None:
+        return str(url)
+    if isinstance(data, Mapping):
+        data = list(data.items())
+    body = urlencode(data, doseq=True) if data is not None else ""
+    return f"{method} {url} {body}"
+
+
+def _endpoint_of(url: str) -> str:
+    path = urlsplit(str(url or "")).path
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+class ResponseArchive:
+    """Deduplicated, compressed response bodies with a key -> latest-body index."""
+
+    def __init__(
+        self,
+        root: str = DEFAULT_ARCHIVE_DIR,
+        *,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        replay: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = root
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max(0, int(max_bytes))
+        self.replay = bool(replay)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        index_path = self._index_path()
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+            if isinstance(loaded, dict):
+                self._index = {str(k): dict(v) for k, v in loaded.items() if isinstance(v, dict)}
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, "index.json")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.gz")
+
+    def ttl_for(self, url: str) -> float:
+        return float(self.ttls.get(_endpoint_of(url), 0.0))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def keys(self) -> List[str]:
+        """Return every archived request key, sorted."""
+
+        with self._lock:
+            return sorted(self._index)
+
+    def lookup(self, key: str, *, max_age_s: Optional[float] = None) -> Optional[str]:
+        """Return the latest archived body for ``key`` (``None`` if absent or too old)."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if max_age_s is not None and now - float(entry.get("fetched_at", 0.0)) > max_age_s:
+                return None
+            digest = entry["sha256"]
+        try:
+            with gzip.open(self._object_path(digest), "rt", encoding="utf-8") as fh:
+                body = fh.read()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key]["accessed_at"] = now
+                self._dirty = True
+        return body
+
+    def store(self, key: str, body: str) -> str:
+        """Archive ``body`` as the latest response for ``key``; returns its digest."""
+
+        body = str(body)
+        digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".obj.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as fh:
+                    fh.write(body.encode("utf-8"))
+                os.replace(temp_path, path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        now = self._clock()
+        with self._lock:
+            self._index[key] = {"sha256": digest, "fetched_at": now, "accessed_at": now}
+            self._dirty = True
+        return digest
+
+    def fetch(self, method: str, url: str, data: Any, send: Callable[[], Any]) -> Any:
+        """Serve ``(method, url, data)`` from the archive when allowed, else ``send()`` and archive it."""
+
+        key = request_key(method, url, data)
+        if self.replay:
+            body = self.lookup(key)
+            if body is None:
+                raise ArchiveMiss(f"{key} is not in the response archive")
+            return ArchivedResponse(body)
+        ttl = self.ttl_for(url)
+        if str(method).upper() == "GET" and ttl > 0:
+            body = self.lookup(key, max_age_s=ttl)
+            if body is not None:
+                return ArchivedResponse(body)
+        resp = send()
+        status = getattr(resp, "status_code", 200)
+        if isinstance(status, int) and 200 <= status < 300:
+            self.store(key, resp.text)
+        return resp
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least-recently-used bodies until the archive fits; returns bytes freed."""
+
+        budget = self.max_bytes if max_bytes is None else max(0, int(max_bytes))
+        with self._lock:
+            last_used: Dict[str, float] = {}
+            for entry in self._index.values():
+                digest = entry["sha256"]
+                last_used[digest] = max(last_used.get(digest, 0.0), float(entry.get("accessed_at", 0.0)))
+            sizes = {}
+            for digest in last_used:
+                try:
+                    sizes[digest] = os.path.getsize(self._object_path(digest))
+                except OSError:
+                    sizes[digest] = 0
+            total = sum(sizes.values())
+            evicted = set()
+            freed = 0
+            for digest in sorted(last_used, key=last_used.get):
+                if total - freed <= budget:
+                    break
+                evicted.add(digest)
+                freed += sizes[digest]
+            if evicted:
+                self._index = {k: v for k, v in self._index.items() if v["sha256"] not in evicted}
+                self._dirty = True
+        for digest in evicted:
+            try:
+                os.unlink(self._object_path(digest))
+            except OSError:
+                pass
+        return freed
+
+    def save(self) -> bool:
+        """Prune to the size budget and write the index if it changed."""
+
+        if self.max_bytes:
+            self.prune()
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = json.dumps(self._index, sort_keys=True, separators=(",", ":"))
+            self._dirty = False
+        os.makedirs(self.root, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix=".index.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(temp_path, self._index_path())
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+
+def add_archive_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--archive``/``--archive-dir``/``--replay`` flags shared by the scrapers."""
+
+    parser.add_argument("--archive", action="store_true", help="Keep every SUIS response in the shared response archive and serve fresh copies from it.")
+    parser.add_argument("--archive-dir", default=DEFAULT_ARCHIVE_DIR, help="Response archive directory (default: %(default)s).")
+    parser.add_argument("--replay", action="store_true", help="Answer every request from the response archive without touching the network.")
+
+
+def archive_from_args(args: argparse.Namespace) -> Optional[ResponseArchive]:
+    """Return the archive selected by :func:`add_archive_arguments` flags, if any."""
+
+    if not (getattr(args, "archive", False) or getattr(args, "replay", False)):
+        return None
+    return ResponseArchive(args.archive_dir, replay=bool(args.replay))
+
+
+def archive_cli_args(args: argparse.Namespace) -> list:
+    """Return the archive flags to forward to a scraper run as a subprocess."""
+
+    if not (getattr(args, "archive", False) or getattr(args, "replay", False)):
+        return []
+    forwarded = ["--archive-dir", str(args.archive_dir)]
+    forwarded.append("--replay" if args.replay else "--archive")
+    return forwarded
@@ -0,0 +1,485 @@
+"""Shared HTTP client for the SUIS scrapers.
+
+Every scraper used to carry its own copy of "session + semaphore + retry with
+jittered exponential backoff".  This module keeps one implementation: a single
+pooled ``requests`` transport, a global in-flight cap plus optional
+per-endpoint caps, and one retry policy.  Endpoints are keyed by the last path
+segment of the URL (for example ``SU_DEGREE.p_list_courses``), which is how
+SUIS names its PL/SQL procedures.
+
+The client is thread-safe; the scrapers keep their ``ThreadPoolExecutor``
+fan-out and share one instance per process.  With ``adaptive=True`` the
+global cap becomes a ceiling for an AIMD limit that grows while SUIS answers
+quickly and halves on 5xx responses, timeouts, or latency spikes.
+
+A :class:`ValidatorStore` remembers the ``ETag``/``Last-Modified`` validators
+and a body hash per URL across runs.  :meth:`SuisClient.get_if_changed` sends a
+conditional request when the caller still holds the matching body and reports
+whether the page changed, so callers can skip re-parsing identical pages.  It
+does not update the store: the caller passes the returned :class:`Validator`
+to :meth:`SuisClient.record_validator` once its outputs reflect the new body,
+so a failed parse is retried against the previous run's hash.
+An optional :class:`suis_archive.ResponseArchive` keeps every response body and
+can answer repeat or replayed requests without the network.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from suis_archive import ArchiveMiss, ResponseArchive
+
+DEFAULT_USER_AGENT = "surriculum-fetch/1.0 (+https://github.com/beficent/surriculum)"
+
+# Local-only state shared by the scrapers between runs (never published).
+DEFAULT_STATE_DIR = ".suis_cache"
+DEFAULT_VALIDATORS_PATH = os.path.join(DEFAULT_STATE_DIR, "validators.json")
+
+# 4xx responses that are worth retrying; every other client error is final.
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 425, 429})
+
+
+class SuisFetchError(RuntimeError):
+    """A request still failed after the retry policy was exhausted."""
+
+    def __init__(self, url: str, last_error: BaseException):
+        super().__init__(f"Failed to fetch {url}: {last_error}")
+        self.url = url
+        self.last_error = last_error
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter: ``backoff_s * 2**attempt + U(0, jitter_s)``."""
+
+    retries: int = 2
+    backoff_s: float = 0.5
+    max_backoff_s: float = 8.0
+    jitter_s: float = 0.25
+
+    @property
+    def attempts(self) -> int:
+        return max(0, int(self.retries)) + 1
+
+    def delay(self, attempt: int) -> float:
+        base = min(float(self.max_backoff_s), float(self.backoff_s) * (2 ** max(0, attempt)))
+        return max(0.0, base) + random.uniform(0, max(0.0, float(self.jitter_s)))
+
+
+NO_RETRY = RetryPolicy(retries=0)
+
+
+class FixedLimit:
+    """A plain in-flight cap with the same interface as :class:`AdaptiveLimit`."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self._sem = threading.BoundedSemaphore(self.limit)
+
+    def acquire(self) -> None:
+        self._sem.acquire()
+
+    def release(self, outcome: str = "neutral", latency_s: float = 0.0) -> None:
+        self._sem.release()
+
+
+class AdaptiveLimit:
+    """Additive-increase / multiplicative-decrease in-flight limit.
+
+    Every healthy response adds ``1 / limit`` (one slot per window of
+    responses).  A congestion signal -- a retryable failure or a response
+    slower than ``slow_factor`` times the smoothed latency -- halves the limit,
+    at most once per ``cooldown_s`` so one burst of failures is one decrease.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        *,
+        minimum: int = 1,
+        initial: Optional[int] = None,
+        slow_factor: float = 3.0,
+        cooldown_s: float = 2.0,
+        warmup_samples: int = 5,
+    ):
+        self.maximum = max(1, int(maximum))
+        self.minimum = max(1, min(int(minimum), self.maximum))
+        start = self.minimum if initial is None else int(initial)
+        self._limit = float(max(self.minimum, min(start, self.maximum)))
+        self.slow_factor = float(slow_factor)
+        self.cooldown_s = float(cooldown_s)
+        self.warmup_samples = max(1, int(warmup_samples))
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._latency_ewma: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._inflight >= int(self._limit):
+                self._cond.wait()
+            self._inflight += 1
+
+    def release(self, outcome: str = "neutral", latency_s: float = 0.0) -> None:
+        with self._cond:
+            self._inflight -= 1
+            if outcome == "ok":
+                slow = (
+                    self._samples >= self.warmup_samples
+                    and self._latency_ewma is not None
+                    and latency_s > self.slow_factor * self._latency_ewma
+                )
+                self._observe_latency(latency_s)
+                if slow:
+                    self._decrease()
+                else:
+                    self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+            elif outcome == "congested":
+                self._decrease()
+            self._cond.notify_all()
+
+    def _observe_latency(self, latency_s: float) -> None:
+        latency_s = max(0.0, float(latency_s))
+        if self._latency_ewma is None:
+            self._latency_ewma = latency_s
+        else:
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency_s
+        self._samples += 1
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_s:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.minimum), self._limit / 2.0)
+
+
+class RateLimit:
+    """Space request starts at least ``interval_s`` apart across all threads.
+
+    Unlike a fixed sleep after each request, concurrent callers overlap their
+    request latency and only the start times are paced.
+    """
+
+    def __init__(self, interval_s: float):
+        self.interval_s = max(0.0, float(interval_s or 0.0))
+        self._lock = threading.Lock()
+        self._next = float("-inf")
+
+    def wait(self) -> None:
+        if self.interval_s <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval_s
+        if start > now:
+            time.sleep(start - now)
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of a response body."""
+
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+class Validator(NamedTuple):
+    """What :class:`ValidatorStore` would record for one response."""
+
+    digest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ValidatorStore:
+    """Persistent per-URL ``ETag``/``Last-Modified``/body-hash records.
+
+    SUIS mostly omits HTTP validators, so the body hash is what usually
+    detects an unchanged page.  Entries are loaded once, updated in memory by
+    any thread, and written back atomically by :meth:`save`.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_VALIDATORS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+            if isinstance(loaded, dict):
+                self._entries = {str(k): dict(v) for k, v in loaded.items() if isinstance(v, dict)}
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def record(self, url: str, digest: str, *, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        entry = {"sha256": digest}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        with self._lock:
+            if self._entries.get(url) != entry:
+                self._entries[url] = entry
+                self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def save(self) -> bool:
+        """Write the store if anything changed; returns whether it wrote."""
+
+        if not self.path:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = json.dumps(self._entries, sort_keys=True, separators=(",", ":"))
+            self._dirty = False
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".validators.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        return True
+
+
+def conditional_headers(entry: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Return ``If-None-Match``/``If-Modified-Since`` headers for a stored entry."""
+
+    headers: Dict[str, str] = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def endpoint_of(url: str) -> str:
+    """Return the SUIS procedure name (last path segment) for ``url``."""
+
+    path = urlsplit(str(url or "")).path
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transport errors, timeouts and 5xx/429 are retried; other 4xx are final."""
+
+    if isinstance(exc, requests.HTTPError):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if isinstance(status, int) and 400 <= status < 500:
+            return status in RETRYABLE_CLIENT_STATUSES
+    return True
+
+
+class SuisClient:
+    """Pooled, throttled, retrying HTTP client shared by one scraper process."""
+
+    def __init__(
+        self,
+        *,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout_s: float = 30.0,
+        retry: RetryPolicy = RetryPolicy(),
+        max_inflight: int = 6,
+        endpoint_limits: Optional[Mapping[str, int]] = None,
+        adaptive: bool = False,
+        sleep_s: float = 0.0,
+        session: Optional[Any] = None,
+        validators: Optional[ValidatorStore] = None,
+        archive: Optional[ResponseArchive] = None,
+    ):
+        self.user_agent = user_agent
+        self.timeout_s = float(timeout_s)
+        self.retry = retry
+        self.sleep_s = max(0.0, float(sleep_s or 0.0))
+        self.max_inflight = max(1, int(max_inflight or 1))
+        self.validators = validators
+        self.archive = archive
+        self.limiter = AdaptiveLimit(self.max_inflight) if adaptive else FixedLimit(self.max_inflight)
+        self._endpoint_limits: Dict[str, threading.BoundedSemaphore] = {
+            str(name): threading.BoundedSemaphore(max(1, int(limit)))
+            for name, limit in (endpoint_limits or {}).items()
+        }
+        self._adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, self.max_inflight),
+            max_retries=0,
+        )
+        self.session = session if session is not None else self.new_session()
+
+    def new_session(self) -> requests.Session:
+        """Return a session with its own cookie jar on the shared connection pool.
+
+        SUIS binds some flows (the class schedule search) to a cookie session,
+        so those callers need a private jar without a private pool.
+        """
+
+        sess = requests.Session()
+        sess.headers.update({"User-Agent": self.user_agent})
+        sess.mount("https://", self._adapter)
+        sess.mount("http://", self._adapter)
+        return sess
+
+    def _send(self, sess: Any, method: str, url: str, data: Any, timeout_s: float, headers: Optional[Mapping[str, str]] = None) -> Any:
+        extra = {"headers": dict(headers)} if headers else {}
+        if method == "GET":
+            return sess.get(url, timeout=timeout_s, **extra)
+        if method == "POST":
+            return sess.post(url, data=data, timeout=timeout_s, **extra)
+        return sess.request(method, url, data=data, timeout=timeout_s, **extra)
+
+    def _send_limited(self, sess: Any, method: str, url: str, data: Any, timeout_s: float, headers: Optional[Mapping[str, str]] = None) -> Any:
+        self.limiter.acquire()
+        outcome = "neutral"
+        started = time.monotonic()
+        try:
+            resp = self._send(sess, method, url, data, timeout_s, headers)
+            status = getattr(resp, "status_code", 200)
+            if isinstance(status, int) and (status >= 500 or status in RETRYABLE_CLIENT_STATUSES):
+                outcome = "congested"
+            elif not isinstance(status, int) or status < 400:
+                outcome = "ok"
+            return resp
+        except Exception as exc:
+            outcome = "congested" if is_retryable(exc) else "neutral"
+            raise
+        finally:
+            self.limiter.release(outcome, time.monotonic() - started)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        session: Optional[Any] = None,
+        timeout_s: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Any:
+        """Send one request under the client's limits and retry policy.
+
+        With a response archive attached, the archive may answer instead
+        (fresh GETs, or everything in replay mode) and records what the
+        network returns.
+        """
+
+        method = str(method or "GET").upper()
+
+        def send() -> Any:
+            return self._request_network(method, url, data, headers, session, timeout_s, retry)
+
+        if self.archive is None:
+            return send()
+        try:
+            return self.archive.fetch(method, url, data, send)
+        except ArchiveMiss as exc:
+            raise SuisFetchError(url, exc) from exc
+
+    def _request_network(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        headers: Optional[Mapping[str, str]],
+        session: Optional[Any],
+        timeout_s: Optional[float],
+        retry: Optional[RetryPolicy],
+    ) -> Any:
+        sess = session if session is not None else self.session
+        timeout = float(timeout_s) if timeout_s is not None else self.timeout_s
+        policy = retry if retry is not None else self.retry
+        endpoint_gate = self._endpoint_limits.get(endpoint_of(url))
+
+        last_err: Optional[BaseException] = None
+        for attempt in range(policy.attempts):
+            try:
+                with ExitStack() as gates:
+                    if endpoint_gate is not None:
+                        gates.enter_context(endpoint_gate)
+                    resp = self._send_limited(sess, method, url, data, timeout, headers)
+                resp.raise_for_status()
+                if self.sleep_s > 0:
+                    time.sleep(self.sleep_s)
+                return resp
+            except Exception as exc:
+                last_err = exc
+                if attempt >= policy.attempts - 1 or not is_retryable(exc):
+                    break
+                time.sleep(policy.delay(attempt))
+        raise SuisFetchError(url, last_err) from last_err
+
+    def get_text(self, url: str, **kwargs: Any) -> str:
+        return self.request("GET", url, **kwargs).text
+
+    def post_text(self, url: str, data: Any = None, **kwargs: Any) -> str:
+        return self.request("POST", url, data=data, **kwargs).text
+
+    def get_if_changed(
+        self, url: str, *, cached_text: Optional[str] = None, **kwargs: Any
+    ) -> Tuple[str, bool, Optional[Validator]]:
+        """GET ``url`` and report whether its body differs from the last run.
+
+        Returns ``(text, changed, validator)``.  Conditional headers are only
+        sent when ``cached_text`` matches the stored hash, so a ``304`` can
+        always be answered with the caller's copy.  Without a validator store
+        every response counts as changed.  The store is left as it was; pass
+        ``validator`` (None when there is nothing new to record) to
+        :meth:`record_validator` after the body has been used.
+        """
+
+        store = self.validators
+        if store is None:
+            return self.get_text(url, **kwargs), True, None
+        entry = store.get(url)
+        headers: Dict[str, str] = {}
+        if entry and cached_text is not None and content_hash(cached_text) == entry.get("sha256"):
+            headers = conditional_headers(entry)
+        resp = self.request("GET", url, headers=headers or None, **kwargs)
+        if getattr(resp, "status_code", 200) == 304 and headers:
+            return str(cached_text), False, None
+        text = resp.text
+        resp_headers = getattr(resp, "headers", None) or {}
+        validator = Validator(content_hash(text), resp_headers.get("ETag"), resp_headers.get("Last-Modified"))
+        return text, not entry or entry.get("sha256") != validator.digest, validator
+
+    def record_validator(self, url: str, validator: Optional[Validator]) -> None:
+        """Remember ``validator`` for ``url``; a no-op without a store or validator."""
+
+        if self.validators is not None and validator is not None:
+            self.validators.record(url, validator.digest, etag=validator.etag, last_modified=validator.last_modified)
+
+    def save_archive(self) -> None:
+        """Persist the response archive index, if one is attached."""
+
+        if self.archive is not None:
+            self.archive.save()
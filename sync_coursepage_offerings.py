@@ -11,14 +11,12 @@ just refreshed while preserving older course-page history.
 from __future__ import annotations
 
 import argparse
-import json
-import os
 import re
-import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import jsonl_codec
 from term_utils import term_code_from_date, term_code_from_name, term_name_from_code, today_in_tz
 
 
@@ -37,37 +35,16 @@ class SyncStats:
 
 def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line_no, line in enumerate(handle, start=1):
-            raw = line.strip()
-            if not raw:
-                continue
-            try:
-                row = json.loads(raw)
-            except json.JSONDecodeError as exc:
-                raise RuntimeError(f"Invalid JSON in {path}:{line_no}: {exc}") from exc
+    try:
+        for line_no, row in jsonl_codec.iter_jsonl_numbered(path):
             if not isinstance(row, dict):
                 raise RuntimeError(f"Expected an object in {path}:{line_no}")
             rows.append(row)
+    except jsonl_codec.JsonlDecodeError as exc:
+        raise RuntimeError(str(exc)) from exc
     return rows
 
 
-def _write_jsonl_atomic(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as handle:
-            for row in rows:
-                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
-        os.replace(temp_name, path)
-    except Exception:
-        try:
-            os.unlink(temp_name)
-        except OSError:
-            pass
-        raise
-
-
 def _normalize_course_id(value: Any) -> str:
     return re.sub(r"\s+", "", str(value or "")).upper()
 
@@ -199,7 +176,7 @@ def reconcile_coursepage_offerings(
 
     if changed_records:
         ordered = sorted(records, key=lambda row: _normalize_course_id(row.get("course_id")))
-        _write_jsonl_atomic(coursepage_info_path, ordered)
+        jsonl_codec.write_jsonl_if_changed(coursepage_info_path, ordered)
 
     return SyncStats(
         terms=selected_terms,
@@ -129,3 +129,48 @@ def generate_terms(
             out.append(f"{y}{suf}")
     return out
 
+
+def term_age(code: str, current_code: str) -> int:
+    """Number of terms from ``code`` up to ``current_code`` (0 for the same term)."""
+    parsed = _parse_term_code(code)
+    current = _parse_term_code(current_code)
+    if not parsed or not current:
+        raise ValueError(f"Invalid term code: {code!r} / {current_code!r}")
+    ordinal = parsed[0] * 3 + _SUFFIX_ORDER.index(parsed[1])
+    current_ordinal = current[0] * 3 + _SUFFIX_ORDER.index(current[1])
+    return current_ordinal - ordinal
+
+
+def split_frozen_terms(
+    terms: Iterable[str],
+    *,
+    freeze_age: int = 0,
+    frozen_terms: Iterable[str] = (),
+    published: Optional[Iterable[str]] = None,
+    current_term_code: str = "",
+    tz_name: str = "Europe/Istanbul",
+) -> Tuple[List[str], List[str]]:
+    """
+    Split terms into (refresh, frozen) for the nightly scrapers.
+
+    A term is frozen when it is listed in frozen_terms, or when freeze_age is
+    positive and the term is at least that many terms older than the current
+    one. When published is given, a term missing from it is always refreshed
+    so a freeze never hides a catalog that was never written.
+    """
+    current = current_term_code.strip() if current_term_code else ""
+    if not current:
+        current = term_code_from_date(today_in_tz(tz_name))
+    explicit = {str(t).strip() for t in frozen_terms if str(t).strip()}
+    known = None if published is None else set(published)
+    age = max(0, int(freeze_age or 0))
+
+    refresh: List[str] = []
+    frozen: List[str] = []
+    for term in terms:
+        is_frozen = term in explicit or (age > 0 and term_age(term, current) >= age)
+        if is_frozen and (known is None or term in known):
+            frozen.append(term)
+        else:
+            refresh.append(term)
+    return refresh, frozen
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Offline tests for the shared area-code classifiers.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/area_codes_test.py
+"""
+
+import os
+import sys
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fetch_minors as fm  # noqa: E402
+from area_codes import (  # noqa: E402
+    BY_TITLE,
+    CATALOG_ANCHOR,
+    CATALOG_ANCHOR_LINK,
+    CATALOG_PAGE_LINK,
+    MINOR_AREA,
+    AreaClassifier,
+)
+
+
+class AreaCodeTests(unittest.TestCase):
+    def test_catalog_anchor_names(self):
+        cases = {
+            "BSCS_CEL": "core",
+            "BSCS_COR2": "core",
+            "BSEE_C1X": "core",
+            "BSCS_REQ": "required",
+            "BSCS_PHL": "required",
+            "BSCS_AEL": "area",
+            "BSCS_FRE": "free",
+            "UC_FENS": "university",
+            "mainSection": BY_TITLE,
+            "BSCS_PHL_X": BY_TITLE,
+            "BSCS_C2X": BY_TITLE,
+            "UC_FENSX": None,
+            "BSCS_ELEC": None,
+            "": None,
+        }
+        for code, expected in cases.items():
+            with self.subTest(code=code):
+                self.assertEqual(CATALOG_ANCHOR(code), expected)
+
+    def test_link_classifiers_differ_only_in_precedence(self):
+        self.assertEqual(CATALOG_ANCHOR_LINK("UC_X_PHL"), "required")
+        self.assertEqual(CATALOG_PAGE_LINK("UC_X_PHL"), "university")
+        for code, expected in {"BSCS_CEL": "core", "UC_SPS": "university", "BSCS_MEL": "required", "OTHER": "unknown"}.items():
+            with self.subTest(code=code):
+                self.assertEqual(CATALOG_ANCHOR_LINK(code), expected)
+                self.assertEqual(CATALOG_PAGE_LINK(code), expected)
+
+    def test_minor_anchor_names(self):
+        cases = {
+            "MIN_REQ": "required",
+            "MIN_MEL_CEL": "required",
+            "MIN_ELEC": "core",
+            "MIN_CE2X": "core",
+            "MIN_ARE": "area",
+            "MIN_FEL": "free",
+            "UC_FASS": "university",
+            "main": None,
+        }
+        for code, expected in cases.items():
+            with self.subTest(code=code):
+                self.assertEqual(MINOR_AREA(code), expected)
+                self.assertEqual(fm.map_anchor_to_category(code), expected)
+        self.assertIsNone(fm.map_anchor_to_category(None))
+
+    def test_first_matching_rule_wins_and_results_are_memoized(self):
+        classify = AreaClassifier(
+            (("suffix", "suffix", ("_X",)), ("contains", "contains", ("A.B",)), ("exact", "exact", ("Z",))),
+            default="none",
+        )
+        self.assertEqual([classify(code) for code in ("A.B_X", "xA.By", "AxB", "Z", "Z\n", "ZZ")], ["suffix", "contains", "none", "exact", "none", "none"])
+        self.assertEqual(classify._memo["A.B_X"], "suffix")
+
+
+if __name__ == "__main__":
+    unittest.main()
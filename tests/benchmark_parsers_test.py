@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Offline tests for the parser micro-benchmark suite.
+
+These check that every case still runs over its committed fixtures and that
+the baseline comparison flags regressions; they do not time anything.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/benchmark_parsers_test.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import benchmark_parsers as bench  # noqa: E402
+
+
+class BenchmarkParsersTests(unittest.TestCase):
+    def test_every_case_parses_its_fixtures_and_is_in_the_baseline(self):
+        baseline = bench.load_baseline(bench.DEFAULT_BASELINE)
+        self.assertIsNotNone(baseline)
+        for case in bench.build_cases():
+            with self.subTest(case=case.name):
+                stats = bench.run_case(case, min_time=0, rounds=1)
+                self.assertEqual(stats["pages"], len(case.pages))
+                self.assertGreater(stats["ops_per_sec"], 0)
+                self.assertGreater(stats["peak_kib"], 0)
+                self.assertIn(case.name, baseline["cases"])
+
+    def test_compare_scales_by_machine_speed(self):
+        baseline = {"calibration_per_sec": 100.0, "cases": {"a": {"ops_per_sec": 50.0, "peak_kib": 100.0}}}
+
+        def results(calibration, ops, peak):
+            return {"calibration_per_sec": calibration, "cases": {"a": {"ops_per_sec": ops, "peak_kib": peak}, "new": {"ops_per_sec": 1.0, "peak_kib": 1.0}}}
+
+        # Half as fast on a machine half as fast is not a regression.
+        self.assertEqual(bench.compare(results(50.0, 25.0, 100.0), baseline, tolerance=0.2), [])
+        slower = bench.compare(results(100.0, 30.0, 100.0), baseline, tolerance=0.2)
+        self.assertEqual(len(slower), 1)
+        self.assertTrue(slower[0].startswith("a: 30.0 ops/sec"))
+        bigger = bench.compare(results(100.0, 50.0, 130.0), baseline, tolerance=0.2)
+        self.assertEqual(len(bigger), 1)
+        self.assertIn("peak 130 KiB", bigger[0])
+
+    def test_slow_cases_are_retimed_and_report_only_never_fails(self):
+        with tempfile.TemporaryDirectory() as temp:
+            path = os.path.join(temp, "baseline.json")
+            # No machine parses a page a billion times a second.
+            baseline = {"python": "0", "calibration_per_sec": 1.0, "cases": {"seat_counts": {"ops_per_sec": 1e9, "peak_kib": 1e9}}}
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(baseline, fh)
+            args = ["--case", "seat_counts", "--min-time", "0", "--rounds", "1", "--baseline", path]
+            self.assertEqual(bench.main(args + ["--retries", "1"]), 1)
+            self.assertEqual(bench.main(args + ["--retries", "0", "--report-only"]), 0)
+
+            baseline["cases"]["seat_counts"]["ops_per_sec"] = 1e-9
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(baseline, fh)
+            self.assertEqual(bench.main(args), 0)
+
+        results = {"calibration_per_sec": 1.0, "cases": {"a": {"ops_per_sec": 10.0, "peak_kib": 1.0}, "b": {"ops_per_sec": 50.0, "peak_kib": 1.0}}}
+        baseline = {"calibration_per_sec": 1.0, "cases": {"a": {"ops_per_sec": 20.0, "peak_kib": 1.0}, "b": {"ops_per_sec": 50.0, "peak_kib": 1.0}}}
+        self.assertEqual(bench.slow_cases(results, baseline, tolerance=0.2), ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
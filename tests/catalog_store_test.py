@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Offline tests for the normalized program catalog store.
+
+The committed ``courses/catalog/<term>.jsonl`` files must compile to the
+committed ``courses/<term>/<MAJOR>.jsonl`` views byte for byte, and the
+scrapers that read or rewrite catalogs must see the same rows through the
+store as through the views.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/catalog_store_test.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog_store  # noqa: E402
+import scrape_coursepages as scraper  # noqa: E402
+import update_credits  # noqa: E402
+
+COURSES_DIR = os.path.join(ROOT, "courses")
+
+
+def row(major, code, el_type, **fields):
+    base = {"Major": major, "Code": code, "Course_Name": f"{major} {code}", "ECTS": "6", "Engineering": 0, "Basic_Science": 0, "SU_credit": "3", "Faculty": "FENS"}
+    base.update(fields)
+    base.update({"EL_Type": el_type, "Faculty_Course": "No"})
+    return base
+
+
+PROGRAMS = {
+    "CS": [row("CS", "201", "required"), row("MATH", "101", "university")],
+    "BIO": [row("MATH", "101", "university"), row("BIO", "301", "core", Basic_Science=4.0)],
+    # Same course, a program-specific ECTS value and a row with its own key order.
+    "EE": [
+        row("MATH", "101", "university", ECTS="5"),
+        {"Code": "201", "Major": "CS", "EL_Type": "area", "Faculty_Course": "Yes"},
+    ],
+}
+
+
+def write_views(courses_dir, term, programs):
+    os.makedirs(os.path.join(courses_dir, term), exist_ok=True)
+    for major, rows in programs.items():
+        Path(courses_dir, term, f"{major}.jsonl").write_text(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8"
+        )
+
+
+def read_view(courses_dir, term, major):
+    return Path(courses_dir, term, f"{major}.jsonl").read_text(encoding="utf-8")
+
+
+class CatalogStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        self.courses = self.temp.name
+
+    def test_committed_views_match_the_store(self):
+        # The committed store is a delta chain, so this also proves every
+        # term materializes losslessly.
+        self.assertTrue(catalog_store.is_delta_chain(COURSES_DIR))
+        terms = []
+        for term, catalog in catalog_store.iter_term_catalogs(COURSES_DIR):
+            terms.append(term)
+            with self.subTest(term=term):
+                self.assertEqual(catalog_store.check_views(COURSES_DIR, term, catalog), [])
+                self.assertEqual(sorted(catalog_store.view_paths(COURSES_DIR, term)), catalog.majors)
+        self.assertEqual(terms, catalog_store.store_terms(COURSES_DIR))
+        self.assertTrue(terms)
+
+    def test_store_round_trips_program_specific_rows(self):
+        write_views(self.courses, "202401", PROGRAMS)
+        views = {major: read_view(self.courses, "202401", major) for major in PROGRAMS}
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--import-views"]), 0)
+        catalog = catalog_store.read_term_catalog(self.courses, "202401")
+        self.assertEqual(catalog.majors, ["BIO", "CS", "EE"])
+        self.assertEqual(len(catalog.courses), 3)
+        ee = catalog.programs["EE"]
+        self.assertEqual(ee[0], ["MATH", "101", "university", "No", {"ECTS": "5"}])
+        self.assertIsInstance(ee[1], dict)
+
+        for path in catalog_store.view_paths(self.courses, "202401").values():
+            os.unlink(path)
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--compile"]), 0)
+        self.assertEqual({major: read_view(self.courses, "202401", major) for major in PROGRAMS}, views)
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--check"]), 0)
+        # Compiling again leaves matching views untouched.
+        catalog = catalog_store.read_term_catalog(self.courses, "202401")
+        self.assertEqual(catalog_store.compile_views(self.courses, "202401", catalog), [])
+        Path(self.courses, "202401", "CS.jsonl").write_text("{}\n", encoding="utf-8")
+        self.assertEqual(catalog_store.check_views(self.courses, "202401"), ["202401/CS.jsonl: differs from the store"])
+
+    def test_publish_keeps_programs_that_were_not_crawled(self):
+        write_views(self.courses, "202401", PROGRAMS)
+        bio_view = read_view(self.courses, "202401", "BIO")
+        fresh = [row("CS", "201", "required"), row("CS", "204", "core")]
+        catalog_store.publish_programs(self.courses, "202401", {"CS": fresh})
+        catalog = catalog_store.read_term_catalog(self.courses, "202401")
+        self.assertEqual(catalog.program_rows("CS"), fresh)
+        self.assertEqual(catalog.program_rows("BIO"), PROGRAMS["BIO"])
+        self.assertEqual(read_view(self.courses, "202401", "BIO"), bio_view)
+        self.assertEqual(catalog_store.check_views(self.courses, "202401"), [])
+
+    def test_scrapers_read_and_update_catalogs_through_the_store(self):
+        write_views(self.courses, "202401", PROGRAMS)
+        from_views = scraper.collect_catalog_courses(self.courses)
+        catalog_store.main(["--courses-dir", self.courses, "--import-views"])
+        # A stale view of a stored term is ignored.
+        Path(self.courses, "202401", "BIO.jsonl").write_text(json.dumps(row("XX", "999", "free")) + "\n", encoding="utf-8")
+        from_store = scraper.collect_catalog_courses(self.courses)
+        self.assertEqual(list(from_store[0]), list(from_views[0]))
+        self.assertEqual(from_store[1:], from_views[1:])
+        self.assertEqual(from_store[2]["MATH101"]["ects"], 6.0)
+
+        catalog_store.main(["--courses-dir", self.courses, "--compile"])
+        cs_view = read_view(self.courses, "202401", "CS")
+        # Engineering 0 == 0.0 is not a change; Basic_Science is.
+        scraper.update_course_json_files(self.courses, {"BIO301": {"Basic_Science": 2.0, "Engineering": 0.0}})
+        self.assertEqual(read_view(self.courses, "202401", "CS"), cs_view)
+        bio = [json.loads(line) for line in read_view(self.courses, "202401", "BIO").splitlines()]
+        self.assertEqual((bio[1]["Basic_Science"], bio[1]["Engineering"]), (2.0, 0))
+        self.assertEqual(catalog_store.check_views(self.courses, "202401"), [])
+
+        catalog = catalog_store.read_term_catalog(self.courses, "202401")
+        self.assertEqual(catalog.apply_course_fields({"MATH101": {"ECTS": "6"}}), ["EE"])
+        self.assertEqual(catalog.program_rows("EE")[0]["ECTS"], "6")
+
+    def test_credit_updates_go_through_the_store(self):
+        write_views(self.courses, "202401", PROGRAMS)
+        catalog_store.main(["--courses-dir", self.courses, "--import-views"])
+        cs_view = read_view(self.courses, "202401", "CS")
+        original = update_credits.COURSES_DIR
+        update_credits.COURSES_DIR = self.courses
+        try:
+            update_credits.update_all_program_files(
+                {"BIO301": {"Basic_Science": 2.0, "Engineering": 1.0}},
+                {"BSBIO": "BIO.jsonl", "BSCS": "CS.jsonl", "BSEE": "EE.jsonl"},
+            )
+        finally:
+            update_credits.COURSES_DIR = original
+        self.assertEqual(catalog_store.check_views(self.courses, "202401"), [])
+        catalog = catalog_store.read_term_catalog(self.courses, "202401")
+        self.assertEqual(catalog.program_rows("BIO")[1]["Basic_Science"], 2.0)
+        self.assertEqual(catalog.program_rows("BIO")[1]["Engineering"], 1.0)
+        self.assertEqual(read_view(self.courses, "202401", "CS"), cs_view)
+        # Recompiling from the store keeps the new credits.
+        catalog_store.main(["--courses-dir", self.courses, "--compile"])
+        bio = [json.loads(line) for line in read_view(self.courses, "202401", "BIO").splitlines()]
+        self.assertEqual((bio[1]["Basic_Science"], bio[1]["Engineering"]), (2.0, 1.0))
+
+
+class CatalogDeltaTests(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        self.courses = self.temp.name
+        self.terms = {
+            "202401": PROGRAMS,
+            # BIO drops a course and gains one, CS changes a category, EE is
+            # retired and MAT is new; MATH 101 changes its title everywhere.
+            "202402": {
+                "BIO": [row("BIO", "302", "core"), row("MATH", "101", "university", Course_Name="Calculus")],
+                "CS": [row("CS", "201", "core"), row("MATH", "101", "university", Course_Name="Calculus")],
+                "MAT": [row("MATH", "101", "university", Course_Name="Calculus")],
+            },
+            "202403": {"BIO": [row("BIO", "302", "core")], "CS": [row("CS", "201", "core")]},
+        }
+        for term, programs in self.terms.items():
+            write_views(self.courses, term, programs)
+        catalog_store.main(["--courses-dir", self.courses, "--import-views"])
+
+    def stored(self):
+        return {term: catalog.rows_by_major() for term, catalog in catalog_store.iter_term_catalogs(self.courses)}
+
+    def test_delta_round_trip(self):
+        base = catalog_store.import_views(self.courses, "202401")
+        target = catalog_store.import_views(self.courses, "202402")
+        delta = json.loads(json.dumps(catalog_store.encode_delta("202401", base, target)))
+        self.assertEqual(delta[0], {"delta": "202401"})
+        self.assertIn({"program": "EE", "ops": None}, delta)
+        rebuilt = catalog_store.apply_delta("202401", base, delta)
+        self.assertEqual(rebuilt.to_jsonl(), target.to_jsonl())
+        self.assertEqual(base.to_jsonl(), catalog_store.import_views(self.courses, "202401").to_jsonl())
+        with self.assertRaises(ValueError):
+            catalog_store.apply_delta("202403", base, delta)
+
+    def test_chain_materializes_every_term_and_converts_back(self):
+        full = {name: Path(self.courses, "catalog", name).read_bytes() for name in os.listdir(os.path.join(self.courses, "catalog"))}
+        expected = self.stored()
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--chain"]), 0)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.courses, "catalog"))), ["202401.jsonl", "202402.delta.jsonl", "202403.delta.jsonl"])
+        self.assertEqual(self.stored(), expected)
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--check"]), 0)
+        self.assertEqual(catalog_store.read_term_catalog(self.courses, "202403").program_rows("CS"), self.terms["202403"]["CS"])
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--full"]), 0)
+        self.assertEqual({name: Path(self.courses, "catalog", name).read_bytes() for name in os.listdir(os.path.join(self.courses, "catalog"))}, full)
+
+    def test_writing_a_chained_term_rebases_the_next_delta(self):
+        catalog_store.main(["--courses-dir", self.courses, "--chain"])
+        last_delta = Path(self.courses, "catalog", "202403.delta.jsonl").read_text(encoding="utf-8")
+        fresh = [row("CS", "201", "required"), row("CS", "204", "core")]
+        catalog_store.publish_programs(self.courses, "202402", {"CS": fresh})
+        catalog_store.publish_programs(self.courses, "202501", {"CS": fresh})
+        stored = self.stored()
+        self.assertEqual(stored["202401"], PROGRAMS)
+        self.assertEqual(stored["202402"], {**self.terms["202402"], "CS": fresh})
+        self.assertEqual(stored["202403"], self.terms["202403"])
+        self.assertEqual(stored["202501"], {"CS": fresh})
+        self.assertTrue(os.path.exists(catalog_store.store_path(self.courses, "202501", delta=True)))
+        self.assertNotEqual(Path(self.courses, "catalog", "202403.delta.jsonl").read_text(encoding="utf-8"), last_delta)
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--check"]), 0)
+
+    def test_a_term_stored_in_both_forms_is_refused(self):
+        catalog_store.main(["--courses-dir", self.courses, "--chain"])
+        # As if a conversion to full snapshots stopped after writing 202402.jsonl.
+        full = catalog_store.import_views(self.courses, "202402").to_jsonl()
+        Path(catalog_store.store_path(self.courses, "202402")).write_text(full, encoding="utf-8")
+        for read in (
+            lambda: catalog_store.store_terms(self.courses),
+            lambda: list(catalog_store.iter_term_catalogs(self.courses)),
+            lambda: catalog_store.main(["--courses-dir", self.courses, "--full"]),
+        ):
+            with self.assertRaisesRegex(ValueError, "both 202402.jsonl and 202402.delta.jsonl"):
+                read()
+        os.unlink(catalog_store.store_path(self.courses, "202402", delta=True))
+        self.assertEqual(catalog_store.main(["--courses-dir", self.courses, "--check"]), 0)
+        self.assertEqual(self.stored(), self.terms)
+
+
+if __name__ == "__main__":
+    unittest.main()
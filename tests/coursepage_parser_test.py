@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Differential tests for the lxml course-page parser.
+
+``parse_coursepage_html`` must produce the same dict as the BeautifulSoup
+reference parser for every page.  The fixtures below cover the SUIS layout and
+the markup quirks where the two tree APIs differ; when a local
+``courses/coursepage_html_cache`` exists, every cached page is compared too.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/coursepage_parser_test.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+from bs4 import XMLParsedAsHTMLWarning
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scrape_coursepages as scraper  # noqa: E402
+
+warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+
+def suis_page(*, header="CS 201 Introduction to Computing", credits="3 Credits", ects_cell=None, extra_rows="", last_offered=True):
+    ects_cell = ects_cell or "<b>ECTS Credit:</b> 6 ECTS (ENGINEERING: 4 / BASIC: 2)"
+    terms = "".join(
+        f"<tr><td>{year}-{year + 1} {season}</td><td>Introduction to Computing</td><td>3</td></tr>"
+        for year in range(2015, 2025)
+        for season in ("Fall", "Spring")
+    )
+    offered = (
+        f"""<tr><td><table border="1"><tr><td><b>Last Offered Terms</b></td><td>Course Name</td><td>SU Credit</td></tr>
+        {terms}</table></td></tr>"""
+        if last_offered
+        else ""
+    )
+    return f"""<!DOCTYPE html>
+    <html><head><title>Course</title><script>var ECTS = "ENGINEERING: 9";</script>
+    <style>td {{ color: black; }}</style></head>
+    <body><table class="datadisplaytable">
+      <tr><th colspan="2">{header}</th><th>{credits}</th></tr>
+      <tr><td>An introduction to programming &amp; problem
+        solving<!-- internal note --> with Python.</td></tr>
+      <tr><td>{ects_cell}</td></tr>
+      <tr><td><b>Prerequisite:</b> MATH 101 Minimum Grade of D</td></tr>
+      <tr><td>and NS 101</td></tr>
+      <tr><td><b>Corequisite:</b> CS 201R</td></tr>
+      <tr><td><b>General Requirements:</b></td></tr>
+      <tr><td>Course or Test: MATH 102 Minimum Grade of D May not be taken concurrently.</td></tr>
+      <tr><td>&nbsp;</td></tr>
+      {extra_rows}
+      {offered}
+    </table></body></html>
+    """
+
+
+FIXTURES = {
+    "typical": suis_page(),
+    "no_breakdown": suis_page(ects_cell="<b>ECTS:</b> 5 ECTS"),
+    "comma_decimals": suis_page(credits="1,5 Credit", ects_cell="ECTS Credit: 2,5 ECTS (BASIC SCIENCE: 2,5)"),
+    "unparsed_header": suis_page(header="Course not found"),
+    "no_last_offered": suis_page(last_offered=False),
+    "split_label": suis_page(ects_cell="<i>EC</i>TS (ENGINEERING:<span>3</span>)"),
+    "hidden_text": suis_page(
+        ects_cell="6 ECTS<template>(BASIC: 9)</template> (ENGINEERING: 6)<ruby>x<rt>BASIC: 1</rt></ruby>",
+    ),
+    "empty_bold": suis_page(extra_rows="<tr><td><b></b>Orphan row</td></tr><tr><td>after orphan</td></tr>"),
+    "blank_bold_in_block": suis_page(
+        extra_rows=(
+            "<tr><td><b> </b></td></tr><tr><td>still general</td></tr>"
+            "<tr><td><b>Note:</b> x</td></tr><tr><td>not collected</td></tr>"
+        ),
+    ),
+    "nested_description": (
+        "<table><tr><th>HIST 191 Principles</th></tr>"
+        "<tr><td><table><tr><td>inner</td></tr></table></td></tr>"
+        "<tr><td><p>First <em>real</em> description</p></td></tr></table>"
+    ),
+    "direct_cells": (
+        "<table><td>Last   Offered Terms</td><tr><td>x</td></tr>"
+        "<tr><td>2024-2025 Fall</td><td>Name</td><td></td></tr></table>"
+    ),
+    "header_across_tags": (
+        "<table><tr><th>A 1 T</th></tr></table>"
+        "<table><tr><td><b>Last</b><i>Offered Terms</i></td></tr>"
+        "<tr><td>202401</td><td>Name</td><td>4</td></tr></table>"
+    ),
+    "th_outside_row": "<th>ECON 201 Microeconomics</th><th>3 Credits</th>",
+    "long_s_ects": "<table><tr><td>4 ECTſ (ENGINEERING: 4)</td></tr></table>",
+    "xml_declaration": '<?xml version="1.0" encoding="utf-8"?><table><tr><th>SPS 101 Humanity</th></tr></table>',
+    "empty": "",
+    "text_only": "Service unavailable",
+}
+
+
+class CoursePageParserDifferentialTests(unittest.TestCase):
+    def test_fixtures_parse_identically(self):
+        for name, html in FIXTURES.items():
+            with self.subTest(fixture=name):
+                self.assertEqual(scraper.compare_coursepage_parsers(html, source_url=f"fixture://{name}"), [])
+
+    def test_typical_page_fields(self):
+        parsed = scraper.parse_coursepage_html(FIXTURES["typical"], source_url="fixture://typical")
+        self.assertEqual((parsed["parsed_subj_code"], parsed["parsed_crse_numb"]), ("CS", "201"))
+        self.assertEqual((parsed["su_credits"], parsed["ects"], parsed["engineering"], parsed["basic_science"]), (3.0, 6.0, 4.0, 2.0))
+        self.assertEqual(parsed["prerequisites"], "MATH 101 Minimum Grade of D and NS 101")
+        self.assertEqual(parsed["corequisites"], "CS 201R")
+        self.assertEqual(parsed["general_requirement_prerequisites"], "MATH 102 - Undergraduate - Min Grade D")
+        self.assertEqual(len(parsed["last_offered_terms"]), 20)
+        self.assertTrue(parsed["description"].startswith("An introduction to programming & problem"))
+
+    def test_cache_directory_check_reports_divergent_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, html in FIXTURES.items():
+                Path(tmp, f"{name}.html").write_text(html, encoding="utf-8")
+            self.assertEqual(scraper.check_coursepage_parsers(tmp), {})
+
+            original = scraper.parse_coursepage_html_bs4
+            try:
+                scraper.parse_coursepage_html_bs4 = lambda html, *, source_url: {
+                    **original(html, source_url=source_url),
+                    "ects": -1.0,
+                }
+                divergent = scraper.check_coursepage_parsers(tmp)
+            finally:
+                scraper.parse_coursepage_html_bs4 = original
+            # Pages lxml rejects are parsed by the reference parser on both sides.
+            self.assertEqual(set(FIXTURES) - {name[: -len(".html")] for name in divergent}, {"xml_declaration", "empty"})
+            self.assertEqual(divergent["typical.html"], ["ects"])
+
+    def test_local_cache_parses_identically(self):
+        cache_dir = os.path.join(ROOT, scraper.DEFAULT_CACHE_DIR)
+        if not os.path.isdir(cache_dir):
+            self.skipTest("no local course-page HTML cache")
+        self.assertEqual(scraper.check_coursepage_parsers(cache_dir), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
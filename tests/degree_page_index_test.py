@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Offline tests for the one-pass SU_DEGREE page index.
+
+Every lookup of ``DegreePageIndex`` must return what the BeautifulSoup
+traversal it replaces returns.  The committed degree and minor pages are the
+fixtures: each anchor is checked against the ``find_next()`` chains that
+``crawl_program`` and ``fetch_minors`` used before the index existed.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/degree_page_index_test.py
+"""
+
+import glob
+import os
+import sys
+import unittest
+
+from bs4 import BeautifulSoup
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fetch_courses as fc  # noqa: E402
+import fetch_minors as fm  # noqa: E402
+from degree_page_index import LIST_COURSES_MARKER, DegreePageIndex  # noqa: E402
+
+PAGES = sorted(
+    glob.glob(os.path.join(ROOT, "Degree Detail Pages (for inspect)", "*.html"))
+    + glob.glob(os.path.join(ROOT, "minor_htmls", "**", "*.html"), recursive=True)
+)
+
+
+def is_list_link(href):
+    return bool(href) and "p_list_courses" in href
+
+
+def find_next_steps(el, steps, *args):
+    out = []
+    for _ in range(steps):
+        el = el.find_next(*args)
+        if not el:
+            break
+        out.append(el)
+    return out
+
+
+def read(path):
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return fh.read()
+
+
+def load(path):
+    return BeautifulSoup(read(path), "lxml")
+
+
+class DegreePageIndexTests(unittest.TestCase):
+    def test_pages_are_committed(self):
+        self.assertTrue(PAGES)
+
+    def test_lookups_match_beautifulsoup_traversals(self):
+        for path in PAGES:
+            with self.subTest(page=os.path.basename(path)):
+                soup = load(path)
+                index = DegreePageIndex(soup)
+                self.assertEqual(index.anchors, soup.select("a[name]"))
+                self.assertEqual(index.list_links, soup.find_all("a", href=is_list_link))
+                for a in index.anchors:
+                    self.assertEqual(index.following(a, window=10), find_next_steps(a, 10))
+                    self.assertEqual(
+                        index.following(a, "table", window=10),
+                        [el for el in find_next_steps(a, 10) if el.name == "table"],
+                    )
+                    self.assertEqual(index.following(a, "table", limit=20), find_next_steps(a, 20, "table"))
+                    self.assertEqual(
+                        index.following(a, LIST_COURSES_MARKER, window=15),
+                        [el for el in find_next_steps(a, 15) if el.name == "a" and is_list_link(el.get("href"))],
+                    )
+                    self.assertIs(index.first_within(a.parent, "b"), a.parent.find("b"))
+                    self.assertEqual(list(index.next_siblings(a.parent)), a.parent.find_next_siblings())
+                    table = index.enclosing(a, "table")
+                    self.assertIs(table, a.find_parent("table"))
+                    if table is not None:
+                        self.assertEqual(index.within(table, LIST_COURSES_MARKER), table.find_all("a", href=is_list_link))
+                        for sibling in index.next_siblings(table):
+                            self.assertIs(index.first_within(sibling, "table"), sibling.find("table"))
+
+    def test_features_are_computed_once_per_element(self):
+        soup = BeautifulSoup("<table><tr><th>Course</th></tr></table><table></table>", "lxml")
+        index = DegreePageIndex(soup)
+        first, second = soup.find_all("table")
+        calls = []
+
+        def count(table):
+            calls.append(table)
+            return len(calls)
+
+        self.assertEqual([index.feature(t, "n", count) for t in (first, second, first, second)], [1, 2, 1, 2])
+        self.assertEqual(calls, [first, second])
+
+    def test_crawl_program_and_minor_tables_use_one_index(self):
+        path = os.path.join(ROOT, "Degree Detail Pages (for inspect)", "SU_DEGREE.p_degree_detail_EE.html")
+        builds = []
+        original_index = fc.DegreePageIndex
+        original_crawl_lists = fc._crawl_lists
+        try:
+            fc.DegreePageIndex = lambda soup: builds.append(soup) or original_index(soup)
+            fc._crawl_lists = lambda jobs, _term: [[] for _ in jobs]
+            rows = fc.crawl_program("BSEE", "202401", soup=load(path))
+        finally:
+            fc.DegreePageIndex = original_index
+            fc._crawl_lists = original_crawl_lists
+        self.assertEqual(len(builds), 1)
+        self.assertTrue(rows)
+
+        page = fm.MinorPage(read(path))
+        for _category, a in page.category_anchors:
+            self.assertIs(fm._find_course_table_after(a, page.index), page.course_table_after(a))
+        self.assertIs(page.index, page.index)
+
+
+if __name__ == "__main__":
+    unittest.main()
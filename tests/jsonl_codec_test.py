@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Offline tests for the shared JSON Lines codec.
+
+Every installed decoder backend must read exactly what ``json.loads`` reads,
+and the writer must reproduce the committed files byte for byte.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/jsonl_codec_test.py
+"""
+
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import jsonl_codec  # noqa: E402
+
+# Inputs where the fast decoders disagree with json.loads unless they fall back.
+EDGE_CASES = [
+    '{"a": 1, "a": 2}',
+    str(2**64),
+    str(-(2**63) - 1),
+    '{"crn": 123456789012345678901234}',
+    "[NaN, Infinity, -Infinity]",
+    "1e400",
+    '"\\ud800"',
+    '{"title": "Türkçe \\u00e9", "ects": 6.0, "engineering": 0, "x": -0.0}',
+]
+
+
+def installed_backends():
+    original = jsonl_codec.BACKEND
+    available = []
+    try:
+        for name in jsonl_codec.BACKENDS:
+            try:
+                jsonl_codec.set_backend(name)
+            except ImportError:
+                continue
+            available.append(name)
+    finally:
+        jsonl_codec.set_backend(original)
+    return available
+
+
+class JsonlCodecTests(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        original = jsonl_codec.BACKEND
+        self.addCleanup(jsonl_codec.set_backend, original)
+
+    def path(self, name, text):
+        path = os.path.join(self.temp.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+        return path
+
+    def test_every_backend_decodes_like_json_loads(self):
+        self.assertIn("json", installed_backends())
+        path = self.path("edge.jsonl", "\n".join(EDGE_CASES) + "\n")
+        expected = [json.loads(case) for case in EDGE_CASES]
+        for name in installed_backends():
+            with self.subTest(backend=name):
+                jsonl_codec.set_backend(name)
+                for case, value in zip(EDGE_CASES, expected):
+                    self.assertEqual(repr(jsonl_codec.loads(case)), repr(value))
+                    self.assertEqual(repr(jsonl_codec.loads(case.encode("utf-8", "surrogatepass"))), repr(value))
+                self.assertEqual(repr(jsonl_codec.read_jsonl(path)), repr(expected))
+
+    def test_committed_files_round_trip_byte_for_byte(self):
+        paths = sorted(
+            glob.glob(os.path.join(ROOT, "courses", "**", "*.jsonl"), recursive=True)
+            + glob.glob(os.path.join(ROOT, "requirements", "**", "*.jsonl"), recursive=True)
+        )
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, "r", encoding="utf-8", newline="") as fh:
+                text = fh.read()
+            with self.subTest(path=os.path.relpath(path, ROOT)):
+                self.assertEqual(jsonl_codec.jsonl_text(jsonl_codec.iter_jsonl(path)), text)
+
+    def test_invalid_lines_raise_with_their_position_or_are_skipped(self):
+        path = self.path("rows.jsonl", '{"a": 1}\n\n   \n{"a": \n[2]\n')
+        for name in installed_backends():
+            with self.subTest(backend=name):
+                jsonl_codec.set_backend(name)
+                rows = jsonl_codec.iter_jsonl_numbered(path)
+                self.assertEqual(next(rows), (1, {"a": 1}))
+                with self.assertRaises(jsonl_codec.JsonlDecodeError) as caught:
+                    next(rows)
+                self.assertEqual(caught.exception.line_no, 4)
+                with self.assertRaises(json.JSONDecodeError) as stdlib:
+                    json.loads('{"a": \n')
+                self.assertEqual(str(caught.exception), f"Invalid JSON in {path}:4: {stdlib.exception}")
+                self.assertEqual(jsonl_codec.read_jsonl(path, skip_invalid=True), [{"a": 1}, [2]])
+
+    def test_batched_writes_match_json_dumps(self):
+        rows = [{"Major": "CS", "Code": str(n), "Course_Name": "Çalışma, “quoted”:  ", "ECTS": n / 2} for n in range(7)]
+        expected = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        buffer = io.StringIO()
+        self.assertEqual(jsonl_codec.write_rows(buffer, iter(rows), batch_size=3), 7)
+        self.assertEqual(buffer.getvalue(), expected)
+        path = os.path.join(self.temp.name, "nested", "out.jsonl")
+        self.assertEqual(jsonl_codec.write_jsonl(path, rows), 7)
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), expected.encode("utf-8"))
+        self.assertEqual(jsonl_codec.dumps(rows[0]), json.dumps(rows[0], ensure_ascii=False))
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        rows = [{"course_id": "CS201", "history": [{"term": "202401"}]}]
+        path = os.path.join(self.temp.name, "out", "history.jsonl")
+        stats = jsonl_codec.WriteStats()
+        self.assertTrue(jsonl_codec.write_jsonl_if_changed(path, rows, stats=stats))
+        os.chmod(path, 0o640)
+        os.utime(path, (1_000_000, 1_000_000))
+        before = os.stat(path)
+
+        self.assertFalse(jsonl_codec.write_jsonl_if_changed(path, rows, stats=stats))
+        after = os.stat(path)
+        self.assertEqual((after.st_ino, after.st_mtime), (before.st_ino, before.st_mtime))
+
+        # Same length, different bytes: replaced atomically, mode kept.
+        self.assertTrue(jsonl_codec.write_jsonl_if_changed(path, [{"course_id": "CS202", "history": [{"term": "202401"}]}], stats=stats))
+        after = os.stat(path)
+        self.assertNotEqual(after.st_mtime, before.st_mtime)
+        self.assertEqual(after.st_mode & 0o777, 0o640)
+        self.assertEqual(jsonl_codec.read_jsonl(path)[0]["course_id"], "CS202")
+        self.assertEqual((stats.written, stats.unchanged), (2, 1))
+        self.assertEqual(str(stats), "2 written, 1 unchanged")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["history.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
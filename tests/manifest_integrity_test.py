@@ -107,9 +107,12 @@ def main():
     assert not build_manifest._is_runtime_data_path(
         "courses/schedule/202602_from_saved.jsonl"
     )
+    assert not any(rel.endswith(".slots.bin") for rel in file_set)
     assert not build_manifest._is_runtime_data_path(
         "courses/basic_science_credits.jsonl"
     )
+    assert not any(rel.startswith("courses/catalog/") for rel in file_set)
+    assert not build_manifest._is_runtime_data_path("courses/catalog/202601.jsonl")
 
     parsed_rows = validate_runtime_json(files)
 
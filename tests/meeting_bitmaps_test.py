@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Offline tests for the packed meeting-time bitmaps.
+
+A bitmap conflict must agree with the scheduler's interval comparison on the
+committed schedules, and ``python meeting_bitmaps.py --check`` must catch
+``<term>.slots.bin`` files that no longer match their ``<term>.jsonl``.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/meeting_bitmaps_test.py
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import jsonl_codec  # noqa: E402
+import meeting_bitmaps as mb  # noqa: E402
+
+SCHEDULE_DIR = os.path.join(ROOT, "courses", "schedule")
+TERM = "Jan 5, 2026 - Apr 17, 2026"
+
+
+def meeting(days, time, date_range=TERM):
+    start, end = mb.parse_time_range_to_minutes(time)
+    return {"time": time, "days": days, "date_range": date_range, "start_min": start, "end_min": end}
+
+
+def section(crn, *meetings):
+    return {"crn": str(crn), "meetings": list(meetings)}
+
+
+def interval_conflict(a, b):
+    """The scheduler's check: same weekday, overlapping minutes, a shared date of that weekday."""
+
+    def intervals(row):
+        for m in row.get("meetings") or []:
+            minutes = mb.meeting_minutes(m)
+            if minutes is None:
+                continue
+            date_range = mb.parse_date_range(m.get("date_range"))
+            for day in mb.parse_days(m.get("days")):
+                if date_range is not None and not mb.range_weekdays(date_range) >> day & 1:
+                    yield day, minutes, None
+                else:
+                    yield day, minutes, date_range
+
+    for (day_a, (start_a, end_a), range_a), (day_b, (start_b, end_b), range_b) in itertools.product(intervals(a), intervals(b)):
+        if day_a != day_b or end_a <= start_b or start_a >= end_b:
+            continue
+        if range_a is None or range_b is None:
+            return True
+        both = (max(range_a[0], range_b[0]), min(range_a[1], range_b[1]))
+        if both[0] <= both[1] and mb.range_weekdays(both) >> day_a & 1:
+            return True
+    return False
+
+
+class MeetingBitmapTests(unittest.TestCase):
+    def test_day_strings(self):
+        self.assertEqual(mb.parse_days("MW"), [1, 3])
+        self.assertEqual(mb.parse_days(" t r "), [2, 4])
+        self.assertEqual(mb.parse_days("MTWRU"), [0, 1, 2, 3, 4])
+        self.assertEqual(mb.parse_days("WRFS"), [3, 4, 5, 6])
+        self.assertEqual(mb.parse_days("TT"), [2])
+        # TBA must not read as Tuesday.
+        for days in ("", None, "TBA", "M/W", "Mon"):
+            with self.subTest(days=days):
+                self.assertEqual(mb.parse_days(days), [])
+
+    def test_midnight(self):
+        self.assertEqual(mb.meeting_minutes(meeting("M", "12:00 am - 1:00 am")), (0, 60))
+        self.assertEqual(mb.meeting_minutes(meeting("M", "11:00 pm - 12:00 am")), (1380, 1440))
+        self.assertEqual(mb.meeting_minutes(meeting("M", "11:00 pm - 1:00 am")), (1380, 1500))
+        self.assertEqual(mb.meeting_minutes(meeting("M", "12:00 pm - 12:00 pm")), None)
+        self.assertEqual(mb.meeting_minutes(meeting("M", "TBA")), None)
+        # Text is only consulted when the minutes are missing.
+        self.assertEqual(mb.meeting_minutes({"time": "8:40 am - 10:30 am", "start_min": None, "end_min": 630}), (520, 630))
+
+        late = mb.build_term_bitmaps([section(1, meeting("M", "11:00 pm - 12:00 am"))])
+        self.assertEqual(late.records[0].bitmap, mb.slot_bits(1, 1380, 1440))
+        self.assertEqual(late.records[0].bitmap >> (2 * mb.SLOTS_PER_DAY), 0)
+
+        term = mb.build_term_bitmaps(
+            [
+                section(1, meeting("S", "11:00 pm - 1:00 am")),
+                section(2, meeting("U", "12:00 am - 12:30 am")),
+                section(3, meeting("U", "1:00 am - 2:00 am")),
+                section(4, meeting("M", "12:00 am - 1:00 am")),
+                section(5, meeting("S", "10:00 pm - 11:00 pm")),
+            ]
+        )
+        # Saturday night wraps into Sunday morning, and only Sunday morning.
+        self.assertTrue(term.conflict(1, 2))
+        self.assertFalse(term.conflict(1, 3))
+        self.assertFalse(term.conflict(1, 4))
+        self.assertFalse(term.conflict(1, 5))
+        self.assertEqual([r.flags for r in term.records], [0] * 5)
+
+    def test_slots_round_outward(self):
+        term = mb.build_term_bitmaps(
+            [
+                section(1, meeting("T", "10:32 am - 11:00 am")),
+                section(2, meeting("T", "10:00 am - 10:30 am")),
+                section(3, meeting("T", "10:00 am - 10:31 am")),
+                section(4, meeting("R", "10:00 am - 10:40 am")),
+            ]
+        )
+        self.assertFalse(term.conflict(1, 2))
+        # 10:31 and 10:32 share a five-minute slot: a conservative conflict.
+        self.assertTrue(term.conflict(1, 3))
+        self.assertFalse(term.conflict(1, 4))
+        self.assertEqual([r.flags for r in term.records], [mb.ROUNDED, 0, mb.ROUNDED, 0])
+
+    def test_date_ranges(self):
+        first_week = "Jan 5, 2026 - Jan 9, 2026"  # Monday to Friday
+        term = mb.build_term_bitmaps(
+            [
+                section(1, meeting("M", "9:40 am - 10:30 am", first_week)),
+                section(2, meeting("M", "9:40 am - 10:30 am", "Jan 6, 2026 - Jan 20, 2026")),
+                section(3, meeting("M", "10:00 am - 11:00 am", "Jan 5, 2026 - Jan 20, 2026")),
+                section(4, meeting("M", "9:40 am - 10:30 am", "Jan 12, 2026 - Apr 17, 2026")),
+                section(5, meeting("M", "9:40 am - 10:30 am", "TBA")),
+                # Saturday to Sunday never has a Monday.
+                section(6, meeting("MU", "9:40 am - 10:30 am", "Jan 10, 2026 - Jan 11, 2026")),
+                section(7, meeting("U", "9:40 am - 10:30 am", first_week)),
+            ]
+        )
+        self.assertEqual(term.ranges, sorted(term.ranges))
+        self.assertFalse(term.conflict(1, 2))  # overlap holds no Monday
+        self.assertTrue(term.conflict(1, 3))
+        self.assertFalse(term.conflict(1, 4))  # disjoint
+        self.assertTrue(term.conflict(1, 5))  # unknown dates are the whole term
+        self.assertTrue(term.conflict(1, 6))
+        self.assertFalse(term.conflict(1, 7))
+        # Section 7's Sunday lies outside its range, so it may be any Sunday.
+        self.assertTrue(term.conflict(6, 7))
+        self.assertEqual([r.range_id for r in term.sections(6)], [mb.UNKNOWN_RANGE, term.ranges.index((20463, 20464)) + 1])
+        self.assertEqual({r.crn: r.flags for r in term.records}, {1: 0, 2: 0, 3: 0, 4: 0, 5: mb.INCOMPLETE, 6: mb.INCOMPLETE, 7: mb.INCOMPLETE})
+        self.assertEqual(mb.range_weekdays((20458, 20462)), 0b0111110)
+
+    def test_sections_without_usable_meetings_keep_a_record(self):
+        term = mb.build_term_bitmaps(
+            [
+                section(10, meeting("", "TBA")),
+                {"crn": "11", "meetings": []},
+                {"crn": "x12", "meetings": [meeting("M", "9:40 am - 10:30 am")]},
+                section(13, meeting("M", "9:40 am - 10:30 am"), meeting("", "TBA")),
+            ]
+        )
+        self.assertEqual([(r.crn, r.bitmap, r.flags) for r in term.records[:2]], [(10, 0, mb.INCOMPLETE), (11, 0, mb.INCOMPLETE)])
+        self.assertEqual(term.records[2].flags, mb.INCOMPLETE)
+        self.assertEqual(term.sections("x12"), [])
+        self.assertFalse(term.conflict(10, 13))
+
+    def test_bytes_round_trip(self):
+        term = mb.build_term_bitmaps(
+            [section(30001, meeting("MW", "8:40 am - 10:30 am")), section(30002, meeting("S", "11:00 pm - 1:00 am", "TBA"))]
+        )
+        data = term.to_bytes()
+        self.assertEqual(len(data), 16 + 8 * len(term.ranges) + 260 * len(term.records))
+        self.assertEqual(mb.TermBitmaps.from_bytes(data), term)
+        with self.assertRaises(ValueError):
+            mb.TermBitmaps.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            mb.TermBitmaps.from_bytes(b"SUMC" + data[4:])
+
+        with tempfile.TemporaryDirectory() as temp:
+            schedule = Path(temp, "202601.jsonl")
+            rows = [section(30001, meeting("MW", "8:40 am - 10:30 am"))]
+            self.assertTrue(mb.write_term_bitmaps(schedule, rows))
+            self.assertFalse(mb.write_term_bitmaps(schedule, rows))
+            self.assertEqual(mb.read_term_bitmaps(Path(temp, "202601.slots.bin")).records[0].crn, 30001)
+            self.assertFalse(mb.write_term_bitmaps(Path(temp, "202601_from_saved.jsonl"), rows))
+            self.assertEqual(sorted(os.listdir(temp)), ["202601.slots.bin"])
+
+    def test_check_finds_missing_and_stale_bitmaps(self):
+        with tempfile.TemporaryDirectory() as temp:
+            rows = [section(30001, meeting("MW", "8:40 am - 10:30 am"))]
+            jsonl_codec.write_jsonl(Path(temp, "202601.jsonl"), rows)
+            jsonl_codec.write_jsonl(Path(temp, "202601_from_saved.jsonl"), rows)
+            self.assertEqual(mb.main(["--schedule-dir", temp, "--check"]), 1)
+            self.assertEqual(mb.main(["--schedule-dir", temp]), 0)
+            self.assertEqual(mb.main(["--schedule-dir", temp, "--check"]), 0)
+            self.assertFalse(Path(temp, "202601_from_saved.slots.bin").exists())
+
+            jsonl_codec.write_jsonl(Path(temp, "202601.jsonl"), rows + [section(30002, meeting("F", "1:40 pm - 2:30 pm"))])
+            self.assertEqual(mb.main(["--schedule-dir", temp, "--check"]), 1)
+
+    def test_committed_conflicts_match_the_interval_check(self):
+        paths = sorted(p for p in Path(SCHEDULE_DIR).glob("*.jsonl") if mb.bitmap_path(p))
+        self.assertTrue(paths)
+        for path in (paths[-1], paths[-3]):
+            rows = {}
+            for row in jsonl_codec.iter_jsonl(path):
+                rows.setdefault(row["crn"], section(row["crn"]))["meetings"].extend(row.get("meetings") or [])
+            term = mb.TermBitmaps.from_bytes(mb.build_term_bitmaps(jsonl_codec.read_jsonl(path)).to_bytes())
+            crns = sorted(rows)[:250]
+            with self.subTest(term=path.stem):
+                for a, b in itertools.combinations(crns, 2):
+                    rounded = any(r.flags & mb.ROUNDED for r in term.sections(a) + term.sections(b))
+                    if term.conflict(a, b) != interval_conflict(rows[a], rows[b]):
+                        self.assertTrue(rounded and term.conflict(a, b), (a, b))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,7 @@ def main() -> None:
         "playwright.config.js",
         "tests/e2e/desktop/smoke.spec.js",
         "courses/schedule/202502_from_saved.jsonl",
+        "courses/schedule/202502.slots.bin",
         "courses/basic_science_credits.jsonl",
         "Example Files/Academic Records Summary_ex.html",
     ):
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Offline tests for the persistent parse-result cache.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/parse_cache_test.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scrape_coursepages as scraper  # noqa: E402
+from parse_cache import ParseCache, cached_parser, content_key  # noqa: E402
+from work_queue import ParsePool  # noqa: E402
+
+CALLS = []
+
+
+@cached_parser(1)
+def parse_words(html, separator=" "):
+    CALLS.append(("words", html))
+    return {"words": html.split(separator), "pair": ("a", 1)}
+
+
+@cached_parser(1)
+def parse_length(html):
+    CALLS.append(("length", html))
+    return len(html)
+
+
+@cached_parser(1)
+def parse_row(html):
+    CALLS.append(("row", html))
+    return {"title": html, "code": "404", "meetings": [{"time": "TBA", "days": "", "end_min": None}]}
+
+
+def parse_uncached(html):
+    CALLS.append(("uncached", html))
+    return html.upper()
+
+
+class Page:
+    def __init__(self, html):
+        self.html = html
+
+
+COURSEPAGE = """<html><body><table>
+<tr><th>SPS 303 Law and Ethics</th><th>3 Credits</th></tr>
+<tr><td>Description.</td></tr>
+<tr><td><b>General Requirements:</b></td></tr>
+<tr><td>Course or Test: SPS 101 Minimum Grade of D May not be taken concurrently.</td></tr>
+</table></body></html>"""
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.temp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp.cleanup)
+        self.root = self.temp.name
+
+    def test_repeat_body_is_served_without_parsing(self):
+        cache = ParseCache(self.root)
+        first = cache.parse(parse_words, "a b")
+        # A new cache over the same directory is a later run.
+        again = ParseCache(self.root)
+        second = again.parse(parse_words, "a b")
+        self.assertEqual(CALLS, [("words", "a b")])
+        self.assertEqual(first, {"words": ["a", "b"], "pair": ("a", 1)})
+        # Results round-trip through JSON, so tuples come back as lists.
+        self.assertEqual(second, {"words": ["a", "b"], "pair": ["a", 1]})
+        self.assertEqual((cache.hits, cache.misses, again.hits, again.misses), (0, 1, 1, 0))
+
+    def test_hit_keeps_the_key_order_of_a_miss(self):
+        # A cache from before entries kept their key order is dropped.
+        sorted_entries = Path(self.root, "parse_cache_test.parse_row", "v1")
+        sorted_entries.mkdir(parents=True)
+        miss = ParseCache(self.root).parse(parse_row, "CS 404")
+        hit = ParseCache(self.root).parse(parse_row, "CS 404")
+        self.assertEqual(CALLS, [("row", "CS 404")])
+        self.assertEqual(hit, miss)
+        self.assertEqual(list(hit.keys()), list(miss.keys()))
+        self.assertEqual(list(hit["meetings"][0].keys()), list(miss["meetings"][0].keys()))
+        self.assertFalse(sorted_entries.exists())
+
+    def test_key_covers_body_and_extra_arguments(self):
+        cache = ParseCache(self.root)
+        cache.parse(parse_words, "a b")
+        cache.parse(parse_words, "a b", separator="b")
+        cache.parse(parse_words, "a c")
+        cache.parse(parse_words, Page("a c"))
+        self.assertEqual(len(CALLS), 3)
+        self.assertEqual(content_key(Page("x")), content_key("x"))
+        self.assertNotEqual(content_key("x", source_url="u"), content_key("x"))
+
+    def test_version_bump_invalidates_only_that_parser(self):
+        cache = ParseCache(self.root)
+        cache.parse(parse_words, "a b")
+        cache.parse(parse_length, "a b")
+        parse_words.parser_version = 2
+        try:
+            bumped = ParseCache(self.root)
+            bumped.parse(parse_words, "a b")
+            bumped.parse(parse_length, "a b")
+        finally:
+            parse_words.parser_version = 1
+        self.assertEqual([name for name, _ in CALLS], ["words", "length", "words"])
+        words_dir = Path(self.root, "parse_cache_test.parse_words")
+        self.assertEqual(sorted(p.name for p in words_dir.iterdir()), ["v2-ordered"])
+        self.assertEqual(sorted(p.name for p in Path(self.root, "parse_cache_test.parse_length").iterdir()), ["v1-ordered"])
+
+    def test_parse_pool_consults_the_cache_for_marked_parsers_only(self):
+        pool = ParsePool(cache=ParseCache(self.root))
+        self.assertEqual([pool.parse(parse_length, "abc") for _ in range(2)], [3, 3])
+        self.assertEqual([pool.parse(parse_uncached, "abc") for _ in range(2)], ["ABC", "ABC"])
+        self.assertEqual([name for name, _ in CALLS], ["length", "uncached", "uncached"])
+        self.assertEqual(sorted(p.name for p in Path(self.root).iterdir()), ["parse_cache_test.parse_length"])
+
+    def test_hydration_reuses_cached_course_page_results(self):
+        cache_dir = Path(self.root, "html")
+        cache_dir.mkdir()
+        (cache_dir / "SPS303.html").write_text(COURSEPAGE, encoding="utf-8")
+
+        def hydrate(parse_cache):
+            records = {"SPS303": {"course_id": "SPS303", "subj_code": "SPS", "crse_numb": "303"}}
+            count = scraper.hydrate_general_requirement_fields_from_cache(records, str(cache_dir), parse_cache=parse_cache)
+            return count, records
+
+        first_cache = ParseCache(os.path.join(self.root, "parsed"))
+        second_cache = ParseCache(os.path.join(self.root, "parsed"))
+        self.assertEqual(hydrate(first_cache), hydrate(None))
+        self.assertEqual(hydrate(second_cache), hydrate(None))
+        self.assertEqual((first_cache.misses, second_cache.hits, second_cache.misses), (1, 1, 0))
+        self.assertEqual(
+            hydrate(second_cache)[1]["SPS303"]["general_requirement_prerequisites"],
+            "SPS 101 - Undergraduate - Min Grade D",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Offline tests for the schedule listing and section detail page parsers.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/schedule_listing_parser_test.py
+"""
+
+import os
+import sys
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import build_course_section_history as history  # noqa: E402
+import fetch_schedule as fsched  # noqa: E402
+
+
+def meeting_row(time_s, days, instructor):
+    return (
+        f'<tr><td class="dddefault">Class</td><td class="dddefault">{time_s}</td>'
+        f'<td class="dddefault">{days}</td><td class="dddefault">FENS G077</td>'
+        '<td class="dddefault">Sep 22, 2025 - Jan 02, 2026</td><td class="dddefault">Lecture</td>'
+        f'<td class="dddefault">{instructor} (<abbr title="Primary">P</abbr>)</td></tr>'
+    )
+
+
+def section(header, detail, meetings=()):
+    meeting_table = ""
+    if meetings:
+        meeting_table = (
+            '<table class="datadisplaytable"><caption class="captiontext">Scheduled Meeting Times</caption>'
+            "<tr><th>Type</th><th>Time</th><th>Days</th><th>Where</th><th>Date Range</th>"
+            "<th>Schedule Type</th><th>Instructors</th></tr>" + "".join(meetings) + "</table>"
+        )
+    return (
+        f'<tr><th class="ddlabel" scope="row"><a href="/prod/bwckschd.p_disp_detail_sched?crn_in=1">{header}</a></th></tr>'
+        f'<tr><td class="dddefault">{detail}<br/>{meeting_table}</td></tr>'
+    )
+
+
+def listing(*sections, caption="Sections Found"):
+    return (
+        "<html><body>"
+        '<table class="datadisplaytable"><caption>Search Criteria</caption><tr><td>CS</td></tr></table>'
+        f'<table class="datadisplaytable"><caption class="captiontext">{caption}</caption>'
+        + "".join(sections)
+        + "</table></body></html>"
+    )
+
+
+LECTURE = section(
+    "Introduction to Computing - 10001 - CS 201 - A",
+    "Main Campus<br/>Lecture Schedule Type<br/>3.000 Credits",
+    [meeting_row("8:40 am - 10:30 am", "M", "Ayse Yilmaz"), meeting_row("TBA", "R", "Ayse Yilmaz")],
+)
+RECITATION = section(
+    "Introduction to Computing - 10002 - CS 201R - A1",
+    "Recitation Schedule Type<br/>0.000 Credits",
+    [meeting_row("1:40 pm - 2:30 pm", "F", "Mehmet Kaya")],
+)
+
+
+class ScheduleListingParserTests(unittest.TestCase):
+    def test_sections_and_meetings_are_parsed_in_page_order(self):
+        rows, explicitly_empty = fsched._parse_listing(listing(LECTURE, RECITATION))
+        self.assertFalse(explicitly_empty)
+        self.assertEqual([row["crn"] for row in rows], ["10001", "10002"])
+        lecture, recitation = rows
+        self.assertEqual(
+            {key: lecture[key] for key in ("course_id", "title", "section", "component", "credits")},
+            {"course_id": "CS201", "title": "Introduction to Computing", "section": "A", "component": "Lecture", "credits": 3.0},
+        )
+        self.assertEqual(lecture["source_url"], f"{fsched.BASE}/prod/bwckschd.p_disp_detail_sched?crn_in=1")
+        self.assertEqual([(m["time"], m["start_min"], m["end_min"]) for m in lecture["meetings"]], [("8:40 am - 10:30 am", 520, 630), ("TBA", None, None)])
+        self.assertEqual(lecture["meetings"][0]["instructors"], "Ayse Yilmaz ( P )")
+        self.assertEqual((recitation["course_id"], recitation["component"], recitation["credits"]), ("CS201R", "Recitation", 0.0))
+
+    def test_nested_meeting_rows_are_not_section_rows(self):
+        # A meeting row whose first cell looks like a section header must not
+        # pair with the next section's detail row.
+        decoy = meeting_row("9:40 am - 10:30 am", "T", "<a>Decoy - 99999 - CS 999 - Z</a>").replace(
+            '<td class="dddefault">Class</td>', '<th class="ddlabel"><a>Decoy - 99999 - CS 999 - Z</a></th>'
+        )
+        html = listing(section("Data Structures - 10003 - CS 300 - A", "Lecture Schedule Type<br/>3.000 Credits", [decoy]), RECITATION)
+        self.assertEqual([row["crn"] for row in fsched._parse_sections_from_listing(html)], ["10003", "10002"])
+
+    def test_rows_inside_tbody_are_found(self):
+        html = listing(LECTURE).replace("</caption>", "</caption><tbody>").replace("</table></body>", "</tbody></table></body>")
+        self.assertEqual([row["crn"] for row in fsched._parse_sections_from_listing(html)], ["10001"])
+
+    def test_empty_marker_is_detected_in_the_same_parse(self):
+        self.assertEqual(
+            fsched._parse_listing("<html><body><span>No classes were found that meet your search criteria</span></body></html>"),
+            ([], True),
+        )
+        self.assertEqual(fsched._parse_listing(listing(caption="Sections Found")), ([], False))
+        self.assertEqual(fsched._parse_listing("<html><body><script>'No sections found'</script></body></html>"), ([], False))
+        self.assertEqual(fsched._parse_listing(""), ([], False))
+
+
+def detail_page(seat_table=None, *, before="", after=""):
+    if seat_table is None:
+        seat_table = (
+            '<TABLE  CLASS="datadisplaytable" SUMMARY="This layout table is used to present the seating numbers." WIDTH="100%">'
+            '<CAPTION class="captiontext">Registration Availability</CAPTION>\n'
+            '<TR>\n<TD CLASS="dddead">&nbsp;</TD>\n'
+            '<TH CLASS="ddheader" scope="col" ><SPAN class="fieldlabeltext">Capacity</SPAN></TH>\n'
+            '<TH CLASS="ddheader" scope="col" ><SPAN class="fieldlabeltext">Actual</SPAN></TH>\n'
+            '<TH CLASS="ddheader" scope="col" ><SPAN class="fieldlabeltext">Remaining</SPAN></TH>\n</TR>\n'
+            '<TR>\n<TH CLASS="ddlabel" scope="row" ><SPAN class="fieldlabeltext">Seats</SPAN></TH>\n'
+            '<TD CLASS="dddefault">40</TD>\n<TD CLASS="dddefault">38</TD>\n<TD CLASS="dddefault">2</TD>\n</TR>\n'
+            '<TR>\n<TH CLASS="ddlabel" scope="row" ><SPAN class="fieldlabeltext">Waitlist Seats</SPAN></TH>\n'
+            '<TD CLASS="dddefault">0</TD>\n<TD CLASS="dddefault">0</TD>\n<TD CLASS="dddefault">0</TD>\n</TR>\n</TABLE>'
+        )
+    return (
+        "<HTML><HEAD><TITLE>Detailed Class Information</TITLE></HEAD><BODY>"
+        '<TABLE CLASS="datadisplaytable"><CAPTION class="captiontext">Detailed Class Information</CAPTION>'
+        '<TR><TH CLASS="ddlabel">Introduction to Computing - 10001 - CS 201 - A</TH></TR>'
+        f'<TR><TD CLASS="dddefault">Associated Term: Fall 2025-2026<BR>{before}{seat_table}{after}</TD></TR></TABLE>'
+        "</BODY></HTML>"
+    )
+
+
+SEAT_PAGES = {
+    "banner": detail_page(),
+    "lower_case": detail_page().replace("TABLE", "table").replace("<TR>", "<tr>"),
+    "no_seat_table": detail_page(""),
+    "caption_in_script": detail_page(before="<script>var c = 'Registration Availability';</script>"),
+    "split_caption": detail_page().replace("Registration Availability", "<b>Registration</b> Availability"),
+    "nested_table": detail_page().replace("<TD CLASS=\"dddefault\">40</TD>", "<TD CLASS=\"dddefault\"><table><tr><td>40</td></tr></table></TD>"),
+    "blank_counts": detail_page().replace(">38<", "> <").replace(">2<", ">-<"),
+    "no_seats_row": detail_page().replace(">Seats<", ">Places<"),
+    "empty": "",
+}
+
+
+class SeatCountParserTests(unittest.TestCase):
+    def test_fast_path_matches_the_beautifulsoup_parser(self):
+        report = history.compare_seat_count_parsers(SEAT_PAGES.items())
+        self.assertEqual((report["pages"], report["divergent"]), (len(SEAT_PAGES), []))
+        self.assertEqual(history.parse_seat_counts(SEAT_PAGES["banner"]), (40, 38, 2))
+        self.assertEqual(history.parse_seat_counts(SEAT_PAGES["blank_counts"]), (40, None, None))
+
+    def test_ambiguous_pages_fall_back_to_beautifulsoup(self):
+        original = history.parse_seat_counts_bs4
+        fallbacks = []
+        try:
+            history.parse_seat_counts_bs4 = lambda html: fallbacks.append(html) or original(html)
+            for name, html in SEAT_PAGES.items():
+                history.parse_seat_counts(html)
+        finally:
+            history.parse_seat_counts_bs4 = original
+        fast = {name for name, html in SEAT_PAGES.items() if html not in fallbacks}
+        self.assertEqual(fast, {"banner", "lower_case", "blank_counts"})
+
+
+if __name__ == "__main__":
+    unittest.main()
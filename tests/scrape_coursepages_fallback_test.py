@@ -19,6 +19,7 @@ ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
 
 import scrape_coursepages as scraper  # noqa: E402
+from suis_http import content_hash  # noqa: E402
 
 
 def write_jsonl(path: Path, rows):
@@ -408,5 +409,148 @@ class CatalogFallbackMergeTests(unittest.TestCase):
             self.assertEqual(record["faculty"], "FENS")
 
 
+    def test_refresh_reuses_records_for_unchanged_pages(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "courses"
+            write_jsonl(root / "202503" / "CS.jsonl", [catalog_row("CS-404", title="Machine Learning")])
+            output_dir = Path(temp_dir) / "output"
+            all_info = output_dir / "all.jsonl"
+            basic_science = output_dir / "basic.jsonl"
+            argv = [
+                "scrape_coursepages.py",
+                "--courses-dir", str(root),
+                "--out-all-info", str(all_info),
+                "--out-basic-science", str(basic_science),
+                "--cache-dir", str(Path(temp_dir) / "cache"),
+                "--validators", str(Path(temp_dir) / "validators.json"),
+                "--workers", "1",
+                "--retries", "0",
+                "--refresh",
+                "--no-update-course-json",
+            ]
+            html = coursepage_html("CS-404")
+            url = scraper.build_coursepage_url("CS", "404")
+
+            with mock.patch.object(sys, "argv", argv), mock.patch.object(
+                scraper, "fetch_coursepage_html_if_changed", return_value=(html, url, True, None)
+            ):
+                self.assertEqual(scraper.main(), 0)
+            first = all_info.read_text(encoding="utf-8")
+            self.assertTrue(scraper.read_jsonl_by_course_id(str(all_info))["CS404"]["scrape_ok"])
+
+            with mock.patch.object(sys, "argv", argv), mock.patch.object(
+                scraper, "fetch_coursepage_html_if_changed", return_value=(html, url, False, None)
+            ), mock.patch.object(
+                scraper, "parse_coursepage_html", side_effect=AssertionError("unchanged page was re-parsed")
+            ):
+                self.assertEqual(scraper.main(), 0)
+            self.assertEqual(all_info.read_text(encoding="utf-8"), first)
+
+    def test_refresh_retries_a_changed_page_whose_first_parse_failed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "courses"
+            write_jsonl(root / "202503" / "CS.jsonl", [catalog_row("CS-404", title="Machine Learning")])
+            output_dir = Path(temp_dir) / "output"
+            all_info = output_dir / "all.jsonl"
+            validators = Path(temp_dir) / "validators.json"
+            argv = [
+                "scrape_coursepages.py",
+                "--courses-dir", str(root),
+                "--out-all-info", str(all_info),
+                "--out-basic-science", str(output_dir / "basic.jsonl"),
+                "--cache-dir", str(Path(temp_dir) / "cache"),
+                "--validators", str(validators),
+                "--workers", "1",
+                "--retries", "1",
+                "--refresh",
+                "--no-update-course-json",
+            ]
+            old_html = coursepage_html("CS-404")
+            new_html = old_html.replace("Test description.", "6 ECTS (ENGINEERING: 4 / BASIC: 2)")
+
+            def serve(html):
+                response = mock.Mock(text=html, status_code=200, headers={})
+                return mock.patch.object(scraper.SuisClient, "request", return_value=response)
+
+            with mock.patch.object(sys, "argv", argv), serve(old_html), mock.patch.object(scraper.time, "sleep"):
+                self.assertEqual(scraper.main(), 0)
+            self.assertEqual(scraper.read_jsonl_by_course_id(str(all_info))["CS404"]["ects"], 5.0)
+
+            real_parse = scraper.parse_coursepage_html
+            parse_calls = []
+
+            def flaky_parse(html, **kwargs):
+                parse_calls.append(html)
+                if len(parse_calls) == 1:
+                    raise ValueError("transient parse failure")
+                return real_parse(html, **kwargs)
+
+            with mock.patch.object(sys, "argv", argv), serve(new_html), mock.patch.object(
+                scraper.time, "sleep"
+            ), mock.patch.object(scraper, "parse_coursepage_html", side_effect=flaky_parse):
+                self.assertEqual(scraper.main(), 0)
+
+            # The retry must parse the new page rather than reuse the old record.
+            self.assertEqual(parse_calls, [new_html, new_html])
+            self.assertEqual(scraper.read_jsonl_by_course_id(str(all_info))["CS404"]["ects"], 6.0)
+            stored = json.loads(validators.read_text(encoding="utf-8"))
+            self.assertEqual([entry["sha256"] for entry in stored.values()], [content_hash(new_html)])
+
+    def test_reparse_cache_rebuilds_outputs_without_network(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "courses"
+            write_jsonl(
+                root / "202503" / "CS.jsonl",
+                [
+                    catalog_row("CS-404", title="Machine Learning"),
+                    catalog_row("CS-405", title="Robotics"),
+                    catalog_row("CS-406", title="Not Cached"),
+                ],
+            )
+            cache_dir = Path(temp_dir) / "cache"
+            cache_dir.mkdir()
+            (cache_dir / "CS404.html").write_text(
+                coursepage_html("CS-404").replace("Test description.", "6 ECTS (ENGINEERING: 4 / BASIC: 2)"),
+                encoding="utf-8",
+            )
+            # A cached page for another course fails validation; the last
+            # known-good record must survive.
+            (cache_dir / "CS405.html").write_text(coursepage_html("CS-999"), encoding="utf-8")
+            output_dir = Path(temp_dir) / "output"
+            all_info = output_dir / "all.jsonl"
+            basic_science = output_dir / "basic.jsonl"
+            previous = {"course_id": "CS405", "subj_code": "CS", "crse_numb": "405", "scrape_ok": True, "title": "Robotics"}
+            write_jsonl(all_info, [previous])
+            write_jsonl(basic_science, [previous])
+            argv = [
+                "scrape_coursepages.py",
+                "--courses-dir", str(root),
+                "--out-all-info", str(all_info),
+                "--out-basic-science", str(basic_science),
+                "--cache-dir", str(cache_dir),
+                "--parse-processes", "1",
+                "--reparse-cache",
+                "--no-update-course-json",
+            ]
+
+            offline = AssertionError("--reparse-cache made a network request")
+            with mock.patch.object(sys, "argv", argv), mock.patch.object(
+                scraper, "fetch_coursepage_html", side_effect=offline
+            ), mock.patch.object(scraper, "fetch_coursepage_html_if_changed", side_effect=offline):
+                self.assertEqual(scraper.main(), 0)
+
+            info = scraper.read_jsonl_by_course_id(str(all_info))
+            credits = scraper.read_jsonl_by_course_id(str(basic_science))
+            self.assertTrue(info["CS404"]["scrape_ok"])
+            self.assertEqual((info["CS404"]["ects"], info["CS404"]["engineering"]), (6.0, 4.0))
+            self.assertEqual(
+                {key: credits["CS404"][key] for key in ("engineering", "basic_science", "breakdown_present")},
+                {"engineering": 4.0, "basic_science": 2.0, "breakdown_present": True},
+            )
+            self.assertTrue(info["CS405"]["scrape_ok"])
+            self.assertEqual(info["CS405"]["title"], "Robotics")
+            self.assertEqual(info["CS406"]["scrape_error"], "coursepage_data_unavailable")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,7 +18,13 @@ sys.path.insert(0, ROOT)
 import fetch_courses as fc  # noqa: E402
 import fetch_minors as fm  # noqa: E402
 import fetch_requirements as fr  # noqa: E402
-from term_utils import generate_terms, term_code_from_date, term_name_from_date  # noqa: E402
+from suis_http import NO_RETRY, SuisClient  # noqa: E402
+from term_utils import (  # noqa: E402
+    generate_terms,
+    split_frozen_terms,
+    term_code_from_date,
+    term_name_from_date,
+)
 from suis_page_validation import (  # noqa: E402
     DegreePageTermMismatch,
     require_matching_admit_term,
@@ -95,6 +101,20 @@ class TermIdentityTests(unittest.TestCase):
             "202601",
         )
 
+    def test_frozen_terms_are_skipped_only_once_published(self):
+        terms = ["202401", "202402", "202403", "202501", "202502"]
+        refresh, frozen = split_frozen_terms(
+            terms, freeze_age=3, published=["202401", "202403"], current_term_code="202502"
+        )
+        self.assertEqual(frozen, ["202401"])
+        self.assertEqual(refresh, ["202402", "202403", "202501", "202502"])
+
+        refresh, frozen = split_frozen_terms(
+            terms, frozen_terms=["202501"], current_term_code="202502"
+        )
+        self.assertEqual(frozen, ["202501"])
+        self.assertEqual(split_frozen_terms(terms, current_term_code="202502"), (terms, []))
+
     def test_exact_displayed_term_is_required(self):
         soup = BeautifulSoup(VALID_PAGE, "lxml")
         self.assertEqual(require_matching_admit_term(soup, "202601"), "202601")
@@ -117,10 +137,10 @@ class TermIdentityTests(unittest.TestCase):
             self.assertEqual(validate_suis_term_code(term), term)
 
     def test_requirements_reject_fallback_before_parsing(self):
-        original_session = fr._session
+        original_client = fr._client
         fake = FakeSession(FALLBACK_PAGE)
         try:
-            fr._session = fake
+            fr._client = SuisClient(session=fake, retry=NO_RETRY)
             with self.assertRaises(DegreePageTermMismatch):
                 fr.fetch_requirements("BSCS", "202601")
             self.assertEqual(fake.calls, 1)
@@ -130,7 +150,7 @@ class TermIdentityTests(unittest.TestCase):
                 fr.fetch_requirements("BSCS", "999999")
             self.assertEqual(fake.calls, 0, "invalid term input must fail before HTTP")
         finally:
-            fr._session = original_session
+            fr._client = original_client
 
     def test_course_catalog_rejects_fallback_before_parsing(self):
         original_fetch = fc.fetch_html
@@ -154,23 +174,62 @@ class TermIdentityTests(unittest.TestCase):
         try:
             fm.fetch_html = lambda url, timeout=30.0: calls.append(url) or FALLBACK_PAGE
             with self.assertRaises(DegreePageTermMismatch):
-                fm.load_minor_detail_html("PHYS-MINOR", "202601", None, 30.0)
+                fm.load_minor_detail_page("PHYS-MINOR", "202601", None, 30.0)
             self.assertEqual(len(calls), 1)
 
             calls.clear()
             with self.assertRaises(ValueError):
-                fm.load_minor_detail_html("PHYS-MINOR", "999999", None, 30.0)
+                fm.load_minor_detail_page("PHYS-MINOR", "999999", None, 30.0)
             self.assertEqual(calls, [], "invalid term input must fail before HTTP")
         finally:
             fm.fetch_html = original_fetch
 
+    def test_minor_page_is_parsed_once_for_validation_requirements_and_courses(self):
+        linked = (
+            '<a href="SU_DEGREE.p_list_courses?P_AREA=MINOR_AEL">Area Electives</a>'
+            '<a href="SU_DEGREE.p_list_courses?P_AREA=MINOR_AEL">Free Electives</a>'
+        )
+        list_page = (
+            "<table><tr><td></td><td>CS 301</td><td>Algorithms</td><td>6</td><td>3</td></tr>"
+            "<tr><td></td><td>CS 302</td><td>Automata</td><td>6</td><td>3</td></tr></table>"
+        )
+        detail_page = VALID_PAGE.replace("CS 395", linked)
+        original_fetch = fm.fetch_html
+        original_soup = fm.BeautifulSoup
+        fetched = []
+        parsed = []
+        try:
+            fm.fetch_html = lambda url, timeout=30.0: fetched.append(url) or (
+                list_page if "p_list_courses" in url else detail_page
+            )
+
+            def counting_soup(html, *args, **kwargs):
+                parsed.append(html)
+                return original_soup(html, *args, **kwargs)
+
+            fm.BeautifulSoup = counting_soup
+            page = fm.load_minor_detail_page("CS-MINOR", "202601", None, 30.0)
+            requirements = fm.parse_minor_requirements(page)
+            courses = fm.parse_minor_courses(page, program="CS-MINOR")
+        finally:
+            fm.fetch_html = original_fetch
+            fm.BeautifulSoup = original_soup
+
+        self.assertEqual(requirements["categories"]["area"]["minSU"], 9)
+        self.assertEqual(
+            [(row["Major"] + row["Code"], row["EL_Type"]) for row in courses],
+            [("CS201", "required"), ("CS301", "area"), ("CS302", "area")],
+        )
+        self.assertEqual(len(fetched), 2, "one detail page and one shared list page")
+        self.assertEqual(parsed, [detail_page, list_page])
+
     def test_full_minor_refresh_is_atomic_when_one_program_fails(self):
         original_courses_dir = fm.COURSES_DIR
         original_requirements_dir = fm.REQUIREMENTS_DIR
         original_legacy_path = fm.REQUIREMENTS_LEGACY_PATH
         original_manifest_path = fm.REQUIREMENTS_TERMS_MANIFEST
         original_fetch = fm.fetch_html
-        original_load_detail = fm.load_minor_detail_html
+        original_load_detail = fm.load_minor_detail_page
         original_credit_lookup = fm.load_coursepage_credit_lookup
         original_argv = sys.argv[:]
         try:
@@ -209,7 +268,7 @@ class TermIdentityTests(unittest.TestCase):
                         raise DegreePageTermMismatch("fallback page")
                     return VALID_PAGE
 
-                fm.load_minor_detail_html = load_detail
+                fm.load_minor_detail_page = load_detail
                 fm.load_coursepage_credit_lookup = lambda: {}
                 sys.argv = ["fetch_minors.py", "--terms", "202601", "--workers", "1"]
 
@@ -226,7 +285,7 @@ class TermIdentityTests(unittest.TestCase):
             fm.REQUIREMENTS_LEGACY_PATH = original_legacy_path
             fm.REQUIREMENTS_TERMS_MANIFEST = original_manifest_path
             fm.fetch_html = original_fetch
-            fm.load_minor_detail_html = original_load_detail
+            fm.load_minor_detail_page = original_load_detail
             fm.load_coursepage_credit_lookup = original_credit_lookup
             sys.argv = original_argv
 
@@ -236,7 +295,7 @@ class TermIdentityTests(unittest.TestCase):
         original_legacy_path = fm.REQUIREMENTS_LEGACY_PATH
         original_manifest_path = fm.REQUIREMENTS_TERMS_MANIFEST
         original_fetch = fm.fetch_html
-        original_load_detail = fm.load_minor_detail_html
+        original_load_detail = fm.load_minor_detail_page
         original_credit_lookup = fm.load_coursepage_credit_lookup
         original_argv = sys.argv[:]
         try:
@@ -268,7 +327,7 @@ class TermIdentityTests(unittest.TestCase):
                     '<a href="SU_DEGREE.p_degree_detail?P_PROGRAM=ZBAD-MINOR">Bad</a>'
                 )
                 calls = []
-                fm.load_minor_detail_html = lambda program, _term, _offline_dir, _timeout: (
+                fm.load_minor_detail_page = lambda program, _term, _offline_dir, _timeout: (
                     calls.append(program) or VALID_PAGE
                 )
                 fm.load_coursepage_credit_lookup = lambda: {}
@@ -293,7 +352,7 @@ class TermIdentityTests(unittest.TestCase):
             fm.REQUIREMENTS_LEGACY_PATH = original_legacy_path
             fm.REQUIREMENTS_TERMS_MANIFEST = original_manifest_path
             fm.fetch_html = original_fetch
-            fm.load_minor_detail_html = original_load_detail
+            fm.load_minor_detail_page = original_load_detail
             fm.load_coursepage_credit_lookup = original_credit_lookup
             sys.argv = original_argv
 
@@ -319,14 +378,14 @@ class TermIdentityTests(unittest.TestCase):
 
     def test_requirement_refresh_preserves_existing_term_on_fallback(self):
         original_dir = fr.REQUIREMENTS_DIR
-        original_session = fr._session
+        original_client = fr._client
         original_argv = sys.argv[:]
         try:
             with tempfile.TemporaryDirectory() as tmp:
                 fr.REQUIREMENTS_DIR = tmp
                 target = Path(tmp, "202601.jsonl")
                 target.write_text("last-known-good\n", encoding="utf-8")
-                fr._session = FakeSession(FALLBACK_PAGE)
+                fr._client = SuisClient(session=FakeSession(FALLBACK_PAGE), retry=NO_RETRY)
                 sys.argv = ["fetch_requirements.py", "--terms", "202601", "--skip-minors"]
 
                 self.assertEqual(fr.main(), 1)
@@ -334,7 +393,7 @@ class TermIdentityTests(unittest.TestCase):
                 self.assertEqual(list(Path(tmp).glob(".*.tmp")), [])
         finally:
             fr.REQUIREMENTS_DIR = original_dir
-            fr._session = original_session
+            fr._client = original_client
             sys.argv = original_argv
 
     def test_course_refresh_invalid_term_creates_no_output(self):
@@ -521,6 +580,51 @@ class TermIdentityTests(unittest.TestCase):
             fc.crawl_program = original_crawl
             sys.argv = original_argv
 
+    def test_combined_refresh_fetches_each_degree_page_once(self):
+        original_dir = fc.COURSES_DIR
+        original_requirements_dir = fr.REQUIREMENTS_DIR
+        original_get_programs = fc.get_program_codes
+        original_program_files = fc.PROGRAM_FILES
+        original_expected_majors = fr.EXPECTED_MAJORS
+        original_validate = fr.validate_requirement_record
+        original_fetch = fc.fetch_html
+        original_argv = sys.argv[:]
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                calls = []
+                fc.COURSES_DIR = str(Path(tmp, "courses"))
+                fr.REQUIREMENTS_DIR = str(Path(tmp, "requirements"))
+                fc.PROGRAM_FILES = {"BSCS": "CS.jsonl"}
+                fr.EXPECTED_MAJORS = ("CS",)
+                fr.validate_requirement_record = lambda _major, _record: None
+                fc.get_program_codes = lambda: {"BSCS": "Computer Science"}
+                fc.fetch_html = lambda url: calls.append(url) or VALID_PAGE
+                sys.argv = [
+                    "fetch_courses.py", "--terms", "202601", "--workers", "1",
+                    "--with-requirements", "--skip-minors", "--skip-coursepages",
+                ]
+
+                self.assertEqual(fc.main(), 0)
+                self.assertEqual(len(calls), 1)
+                catalog = Path(tmp, "courses", "202601", "CS.jsonl").read_text(encoding="utf-8")
+                self.assertIn('"Code": "201"', catalog)
+                records = [
+                    json.loads(line)
+                    for line in Path(tmp, "requirements", "202601.jsonl").read_text(encoding="utf-8").splitlines()
+                ]
+                self.assertEqual([record["major"] for record in records], ["CS"])
+                self.assertEqual((records[0]["total"], records[0]["ects"]), (132, 240))
+                self.assertEqual(records[0]["internshipCourse"], "CS395")
+        finally:
+            fc.COURSES_DIR = original_dir
+            fr.REQUIREMENTS_DIR = original_requirements_dir
+            fc.get_program_codes = original_get_programs
+            fc.PROGRAM_FILES = original_program_files
+            fr.EXPECTED_MAJORS = original_expected_majors
+            fr.validate_requirement_record = original_validate
+            fc.fetch_html = original_fetch
+            sys.argv = original_argv
+
     def test_course_refresh_propagates_minor_subprocess_failure(self):
         original_dir = fc.COURSES_DIR
         original_get_programs = fc.get_program_codes
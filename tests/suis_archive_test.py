@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Offline tests for the shared SUIS response archive.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/suis_archive_test.py
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from suis_archive import ResponseArchive, request_key  # noqa: E402
+from suis_http import NO_RETRY, SuisClient, SuisFetchError  # noqa: E402
+
+LIST_URL = "https://suis.sabanciuniv.edu/prod/SU_DEGREE.p_list_courses?P_AREA=UC_FENS&P_TERM=202501"
+OTHER_LIST_URL = "https://suis.sabanciuniv.edu/prod/SU_DEGREE.p_list_courses?P_AREA=UC_FENS&P_TERM=202502"
+DETAIL_URL = "https://suis.sabanciuniv.edu/prod/bwckschd.p_disp_detail_sched?term_in=202501&crn_in=1"
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        return None
+
+
+class CountingSession:
+    def __init__(self, text="<table>page</table>"):
+        self.text = text
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        return FakeResponse(self.text)
+
+    def post(self, url, data=None, timeout=None):
+        self.calls.append(url)
+        return FakeResponse(self.text)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseArchiveTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.clock = Clock()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def archive(self, **kwargs):
+        return ResponseArchive(self.root, clock=self.clock, **kwargs)
+
+    def objects(self):
+        return glob.glob(os.path.join(self.root, "objects", "*", "*.gz"))
+
+    def test_identical_bodies_are_stored_once(self):
+        archive = self.archive()
+        first = archive.store(LIST_URL, "<table>same</table>")
+        second = archive.store(OTHER_LIST_URL, "<table>same</table>")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.objects()), 1)
+        self.assertEqual(archive.lookup(OTHER_LIST_URL), "<table>same</table>")
+
+    def test_fresh_gets_are_served_locally_until_the_ttl_expires(self):
+        session = CountingSession()
+        client = SuisClient(session=session, retry=NO_RETRY, archive=self.archive())
+        client.get_text(LIST_URL)
+        client.get_text(LIST_URL)
+        self.assertEqual(len(session.calls), 1)
+
+        self.clock.now += client.archive.ttl_for(LIST_URL) + 1
+        client.get_text(LIST_URL)
+        self.assertEqual(len(session.calls), 2)
+
+    def test_volatile_endpoints_are_archived_but_always_refetched(self):
+        session = CountingSession()
+        client = SuisClient(session=session, retry=NO_RETRY, archive=self.archive())
+        client.get_text(DETAIL_URL)
+        client.get_text(DETAIL_URL)
+        self.assertEqual(len(session.calls), 2)
+        self.assertEqual(client.archive.lookup(DETAIL_URL), "<table>page</table>")
+
+    def test_replay_answers_from_the_archive_and_never_the_network(self):
+        archive = self.archive()
+        archive.store(DETAIL_URL, "yesterday")
+        archive.store(request_key("POST", DETAIL_URL, {"term_in": "202501"}), "posted")
+        archive.save()
+
+        session = CountingSession()
+        replay = SuisClient(session=session, retry=NO_RETRY, archive=ResponseArchive(self.root, replay=True))
+        self.assertEqual(replay.get_text(DETAIL_URL), "yesterday")
+        self.assertEqual(replay.post_text(DETAIL_URL, {"term_in": "202501"}), "posted")
+        with self.assertRaises(SuisFetchError):
+            replay.get_text(LIST_URL)
+        self.assertEqual(session.calls, [])
+
+    def test_prune_evicts_least_recently_used_bodies(self):
+        archive = self.archive()
+        archive.store("old", "a" * 2000)
+        self.clock.now += 10
+        archive.store("new", "b" * 2000)
+        self.clock.now += 10
+        archive.lookup("old")
+        self.clock.now += 10
+        archive.store("newest", "c" * 2000)
+
+        one_object = os.path.getsize(self.objects()[0])
+        archive.prune(max_bytes=2 * one_object)
+        self.assertIsNone(archive.lookup("new"))
+        self.assertEqual(archive.lookup("old"), "a" * 2000)
+        self.assertEqual(len(self.objects()), 2)
+
+        archive.save()
+        self.assertEqual(len(ResponseArchive(self.root)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Offline tests for the shared SUIS HTTP client.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/suis_http_test.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import requests
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from suis_http import (  # noqa: E402
+    NO_RETRY,
+    AdaptiveLimit,
+    RateLimit,
+    RetryPolicy,
+    SuisClient,
+    SuisFetchError,
+    ValidatorStore,
+    content_hash,
+    endpoint_of,
+)
+
+FAST_RETRY = RetryPolicy(retries=2, backoff_s=0.0, jitter_s=0.0)
+
+
+class FakeResponse:
+    def __init__(self, text="", status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class ScriptedSession:
+    """Returns queued responses (or raises queued exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def _next(self, method, url):
+        self.calls.append((method, url))
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    def get(self, url, timeout=None):
+        return self._next("GET", url)
+
+    def post(self, url, data=None, timeout=None):
+        return self._next("POST", url)
+
+
+class ConditionalSession:
+    """Answers 304 when the request carries the current ETag."""
+
+    def __init__(self, text, etag=None):
+        self.text = text
+        self.etag = etag
+        self.sent_headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.sent_headers.append(dict(headers or {}))
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(status_code=304)
+        return FakeResponse(self.text, headers={"ETag": self.etag} if self.etag else {})
+
+
+class SlowSession:
+    """Tracks the peak number of concurrent requests per endpoint."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+
+    def get(self, url, timeout=None):
+        endpoint = endpoint_of(url)
+        with self.lock:
+            self.active[endpoint] = self.active.get(endpoint, 0) + 1
+            self.peak[endpoint] = max(self.peak.get(endpoint, 0), self.active[endpoint])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[endpoint] -= 1
+        return FakeResponse("ok")
+
+
+class SuisClientTests(unittest.TestCase):
+    def test_endpoint_is_the_procedure_name(self):
+        self.assertEqual(
+            endpoint_of("https://suis.sabanciuniv.edu/prod/SU_DEGREE.p_list_courses?P_AREA=X"),
+            "SU_DEGREE.p_list_courses",
+        )
+        self.assertEqual(endpoint_of("https://suis.sabanciuniv.edu/prod/bwckschd.p_get_crse_unsec"), "bwckschd.p_get_crse_unsec")
+
+    def test_transient_errors_are_retried(self):
+        session = ScriptedSession(
+            requests.ConnectionError("reset"),
+            FakeResponse(status_code=503),
+            FakeResponse("<html>ok</html>"),
+        )
+        client = SuisClient(session=session, retry=FAST_RETRY)
+        self.assertEqual(client.get_text("https://example.test/prod/x"), "<html>ok</html>")
+        self.assertEqual(len(session.calls), 3)
+
+    def test_client_errors_are_not_retried(self):
+        session = ScriptedSession(FakeResponse(status_code=404))
+        client = SuisClient(session=session, retry=FAST_RETRY)
+        with self.assertRaises(SuisFetchError) as ctx:
+            client.get_text("https://example.test/prod/missing")
+        self.assertEqual(len(session.calls), 1)
+        self.assertIsInstance(ctx.exception.last_error, requests.HTTPError)
+
+    def test_exhausted_retries_raise_with_url(self):
+        session = ScriptedSession(requests.Timeout("slow"))
+        client = SuisClient(session=session, retry=FAST_RETRY)
+        with self.assertRaisesRegex(SuisFetchError, "Failed to fetch https://example.test/prod/x: slow"):
+            client.post_text("https://example.test/prod/x", [("a", "b")])
+        self.assertEqual(session.calls, [("POST", "https://example.test/prod/x")] * 3)
+
+    def test_per_call_policy_overrides_client_default(self):
+        session = ScriptedSession(requests.ConnectionError("reset"))
+        client = SuisClient(session=session, retry=FAST_RETRY)
+        with self.assertRaises(SuisFetchError):
+            client.get_text("https://example.test/prod/x", retry=NO_RETRY)
+        self.assertEqual(len(session.calls), 1)
+
+    def test_endpoint_limits_cap_concurrency_per_procedure(self):
+        session = SlowSession()
+        client = SuisClient(
+            session=session,
+            max_inflight=8,
+            endpoint_limits={"SU_DEGREE.p_list_courses": 2},
+        )
+        urls = ["https://example.test/prod/SU_DEGREE.p_list_courses"] * 6
+        urls += ["https://example.test/prod/SU_DEGREE.p_degree_detail"] * 6
+        threads = [threading.Thread(target=client.get_text, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(session.peak["SU_DEGREE.p_list_courses"], 2)
+        self.assertGreater(session.peak["SU_DEGREE.p_degree_detail"], 2)
+
+    def test_new_sessions_share_the_connection_pool(self):
+        client = SuisClient(user_agent="ua-test")
+        first, second = client.new_session(), client.new_session()
+        self.assertIsNot(first.cookies, second.cookies)
+        self.assertIs(first.get_adapter("https://x.test/"), second.get_adapter("https://x.test/"))
+        self.assertEqual(first.headers["User-Agent"], "ua-test")
+
+
+class AdaptiveLimitTests(unittest.TestCase):
+    def run_ok(self, limiter, count, latency_s=0.1):
+        for _ in range(count):
+            limiter.acquire()
+            limiter.release("ok", latency_s)
+
+    def test_limit_grows_additively_to_the_ceiling(self):
+        limiter = AdaptiveLimit(4)
+        self.assertEqual(limiter.limit, 1)
+        self.run_ok(limiter, 1)
+        self.assertEqual(limiter.limit, 2)
+        self.run_ok(limiter, 3)
+        self.assertEqual(limiter.limit, 3)
+        self.run_ok(limiter, 50)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_congestion_halves_once_per_cooldown(self):
+        limiter = AdaptiveLimit(16, initial=16, cooldown_s=60)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release("congested")
+        self.assertEqual(limiter.limit, 8)
+
+    def test_latency_spike_counts_as_congestion(self):
+        limiter = AdaptiveLimit(16, initial=8, warmup_samples=3)
+        self.run_ok(limiter, 3, latency_s=0.1)
+        before = limiter.limit
+        self.run_ok(limiter, 1, latency_s=5.0)
+        self.assertEqual(limiter.limit, max(1, before // 2))
+
+    def test_neutral_outcomes_leave_the_limit_alone(self):
+        limiter = AdaptiveLimit(4, initial=2)
+        limiter.acquire()
+        limiter.release("neutral")
+        self.assertEqual(limiter.limit, 2)
+
+    def test_client_backs_off_on_server_errors(self):
+        session = ScriptedSession(FakeResponse(status_code=503), FakeResponse("ok"))
+        client = SuisClient(session=session, retry=FAST_RETRY, max_inflight=8, adaptive=True)
+        client.limiter._limit = 8.0
+        self.assertEqual(client.get_text("https://example.test/prod/x"), "ok")
+        self.assertEqual(client.limiter.limit, 4)
+
+
+class RateLimitTests(unittest.TestCase):
+    def test_request_starts_are_spaced_across_threads(self):
+        rate = RateLimit(0.05)
+        starts = []
+        lock = threading.Lock()
+
+        def call():
+            rate.wait()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        starts.sort()
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        self.assertEqual(len(gaps), 3)
+        self.assertTrue(all(gap >= 0.04 for gap in gaps), gaps)
+
+    def test_zero_interval_never_waits(self):
+        rate = RateLimit(0)
+        started = time.monotonic()
+        for _ in range(100):
+            rate.wait()
+        self.assertLess(time.monotonic() - started, 0.05)
+
+
+class ValidatorStoreTests(unittest.TestCase):
+    URL = "https://example.test/prod/sabanci_www.p_get_courses?subj=CS&numb=201"
+
+    def fetch(self, client, **kwargs):
+        """GET the page and record its validator, as a caller does after a good parse."""
+
+        text, changed, validator = client.get_if_changed(self.URL, **kwargs)
+        client.record_validator(self.URL, validator)
+        return text, changed
+
+    def test_body_hash_detects_unchanged_pages_without_validators(self):
+        session = ConditionalSession("<html>CS 201</html>")
+        client = SuisClient(session=session, retry=NO_RETRY, validators=ValidatorStore(None))
+        self.assertEqual(self.fetch(client), ("<html>CS 201</html>", True))
+        self.assertEqual(self.fetch(client), ("<html>CS 201</html>", False))
+        session.text = "<html>CS 201 v2</html>"
+        self.assertEqual(self.fetch(client), ("<html>CS 201 v2</html>", True))
+        self.assertEqual(session.sent_headers, [{}, {}, {}])
+
+    def test_etag_is_sent_only_when_the_caller_holds_the_body(self):
+        session = ConditionalSession("<html>CS 201</html>", etag='"v1"')
+        client = SuisClient(session=session, retry=NO_RETRY, validators=ValidatorStore(None))
+        self.fetch(client)
+        text, changed, validator = client.get_if_changed(self.URL, cached_text="<html>CS 201</html>")
+        self.assertEqual((text, changed, validator), ("<html>CS 201</html>", False, None))
+        self.assertEqual(session.sent_headers[-1], {"If-None-Match": '"v1"'})
+
+        self.fetch(client, cached_text="stale copy")
+        self.assertEqual(session.sent_headers[-1], {})
+
+    def test_unrecorded_fetch_leaves_the_previous_hash(self):
+        session = ConditionalSession("<html>CS 201</html>", etag='"v1"')
+        store = ValidatorStore(None)
+        client = SuisClient(session=session, retry=NO_RETRY, validators=store)
+        self.fetch(client)
+        session.text = "<html>CS 201 v2</html>"
+        # A caller whose parse failed drops the validator; the retry must still see a change.
+        self.assertTrue(client.get_if_changed(self.URL)[1])
+        self.assertEqual(client.get_if_changed(self.URL)[:2], ("<html>CS 201 v2</html>", True))
+        self.assertEqual(store.get(self.URL)["sha256"], content_hash("<html>CS 201</html>"))
+
+    def test_store_round_trips_through_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state", "validators.json")
+            store = ValidatorStore(path)
+            self.assertFalse(store.save())
+            store.record(self.URL, "abc", etag='"v1"')
+            self.assertTrue(store.save())
+            self.assertEqual(ValidatorStore(path).get(self.URL), {"sha256": "abc", "etag": '"v1"'})
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["validators.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
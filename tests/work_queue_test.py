@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Offline tests for the catalog crawl scheduler.
+
+Run through ``npm run test:python`` or directly from the repository root:
+
+    python tests/work_queue_test.py
+"""
+
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fetch_courses as fc  # noqa: E402
+import fetch_schedule as fsched  # noqa: E402
+from work_queue import ParsePool, PriorityWorkPool, SingleFlight  # noqa: E402
+
+DEGREE_PAGE = Path(ROOT, "Degree Detail Pages (for inspect)", "SU_DEGREE.p_degree_detail_EE.html")
+CORE_LIST_PAGE = Path(ROOT, "updated_htmls", "SU_DEGREE_core.html")
+FREE_LIST_PAGE = Path(ROOT, "updated_htmls", "SU_DEGREE_free.html")
+
+
+def fixture_fetch(calls):
+    pages = {
+        "detail": DEGREE_PAGE.read_text(encoding="utf-8"),
+        "core": CORE_LIST_PAGE.read_text(encoding="utf-8"),
+        "free": FREE_LIST_PAGE.read_text(encoding="utf-8"),
+    }
+    lock = threading.Lock()
+
+    def fetch(url):
+        with lock:
+            calls.append(url)
+        if "p_degree_detail" in url:
+            return pages["detail"]
+        return pages["core"] if "_CEL" in url else pages["free"]
+
+    return fetch
+
+
+class PriorityWorkPoolTests(unittest.TestCase):
+    def test_lower_priorities_run_first(self):
+        order = []
+        gate = threading.Event()
+        with PriorityWorkPool(1) as pool:
+            pool.submit((0,), gate.wait)
+            for priority in [(3,), (1,), (2,)]:
+                pool.submit(priority, order.append, priority)
+            gate.set()
+        self.assertEqual(order, [(1,), (2,), (3,)])
+
+    def test_nested_waits_do_not_deadlock_a_single_worker(self):
+        with PriorityWorkPool(1) as pool:
+            def parent(n):
+                children = [pool.submit((0,), lambda i=i: i * n) for i in range(3)]
+                pool.wait(children, help_below=(1,))
+                return sum(child.result() for child in children)
+
+            futures = [pool.submit((1, n), parent, n) for n in range(4)]
+            results = [future.result(timeout=5) for future in futures]
+        self.assertEqual(results, [0, 3, 6, 9])
+
+    def test_failed_scheduling_cancels_queued_work(self):
+        ran = []
+        gate = threading.Event()
+        with self.assertRaises(RuntimeError):
+            with PriorityWorkPool(1) as pool:
+                pool.submit((0,), gate.wait)
+                queued = pool.submit((1,), ran.append, "late")
+                gate.set()
+                raise RuntimeError("scheduler failed")
+        self.assertTrue(queued.cancelled() or ran == ["late"])
+
+
+class SingleFlightTests(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "page"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(results, ["page"] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.do("k", slow), "page")
+        self.assertEqual(len(calls), 1)
+
+    def test_failures_are_not_cached(self):
+        flight = SingleFlight()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with self.assertRaises(RuntimeError):
+            flight.do("k", flaky)
+        self.assertEqual(flight.do("k", flaky), "ok")
+        self.assertEqual(len(attempts), 2)
+
+
+class ParsePoolTests(unittest.TestCase):
+    def test_inline_pool_runs_in_the_calling_thread(self):
+        seen = []
+        with ParsePool() as pool:
+            self.assertEqual(pool.parse(lambda value: seen.append(threading.current_thread()) or value * 2, 21), 42)
+        self.assertEqual(seen, [threading.current_thread()])
+
+    def test_process_pool_matches_inline_results_and_propagates_errors(self):
+        html = (
+            '<table class="datadisplaytable"><caption>Sections Found</caption>'
+            '<tr><th class="ddlabel"><a href="/x">Intro - 10001 - CS 201 - A</a></th></tr>'
+            '<tr><td class="dddefault">Lecture Schedule Type 3.000 Credits</td></tr></table>'
+        )
+        with ParsePool(1, max_pending=1) as pool:
+            threads = 4
+            results = [None] * threads
+
+            def fetch_and_parse(i):
+                results[i] = pool.parse(fsched._parse_listing, html)
+
+            workers = [threading.Thread(target=fetch_and_parse, args=(i,)) for i in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            self.assertEqual(results, [fsched._parse_listing(html)] * threads)
+            with self.assertRaises(ValueError):
+                pool.parse(int, "not a number")
+
+
+class CrawlSchedulingTests(unittest.TestCase):
+    def crawl(self, workers):
+        original_fetch, original_pool, original_cache = fc.fetch_html, fc._work_pool, fc._list_cache
+        calls = []
+        try:
+            fc.fetch_html = fixture_fetch(calls)
+            fc._list_cache = SingleFlight()
+            if workers is None:
+                return fc.crawl_program("BSEE", "202403"), calls
+            with PriorityWorkPool(workers) as pool:
+                fc._work_pool = pool
+                future = pool.submit(fc._program_priority("202403", 0), fc.crawl_program, "BSEE", "202403")
+                return future.result(timeout=30), calls
+        finally:
+            fc.fetch_html, fc._work_pool, fc._list_cache = original_fetch, original_pool, original_cache
+
+    def test_pooled_crawl_matches_sequential_crawl(self):
+        sequential, sequential_calls = self.crawl(None)
+        self.assertTrue(sequential)
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                pooled, pooled_calls = self.crawl(workers)
+                self.assertEqual(pooled, sequential)
+                self.assertEqual(sorted(pooled_calls), sorted(sequential_calls))
+
+    def test_each_list_page_is_fetched_once_per_run(self):
+        _rows, calls = self.crawl(4)
+        list_calls = [fc.normalize_list_url(url) for url in calls if "p_list_courses" in url]
+        self.assertTrue(list_calls)
+        self.assertEqual(len(list_calls), len(set(list_calls)))
+
+    def test_normalized_list_urls_ignore_parameter_order_and_host_case(self):
+        self.assertEqual(
+            fc.normalize_list_url("https://SUIS.sabanciuniv.edu/prod/SU_DEGREE.p_list_courses?P_TERM=202403&P_AREA=UC_FENS"),
+            fc.normalize_list_url("https://suis.sabanciuniv.edu/prod/SU_DEGREE.p_list_courses?P_AREA=UC_FENS&P_TERM=202403"),
+        )
+
+
+class ScheduleTermWindowTests(unittest.TestCase):
+    def scrape_forward(self, term_workers):
+        scraped = []
+        lock = threading.Lock()
+
+        def fake_scrape(term, **_kwargs):
+            with lock:
+                scraped.append(term)
+            rows = [{"crn": "1"}] if term < "202603" else []
+            meta = {"term": term, "subjects": ["CS"], "live_subjects": ["CS"], "had_live_subjects": True}
+            return rows, meta
+
+        original = fsched.scrape_term_schedule
+        try:
+            fsched.scrape_term_schedule = fake_scrape
+            results, manifest = fsched.scrape_terms_forward(
+                "202501",
+                timeout=1,
+                delay_s=0,
+                max_subjects=None,
+                subject_manifest={},
+                stop_after_empty_terms=2,
+                term_workers=term_workers,
+            )
+        finally:
+            fsched.scrape_term_schedule = original
+        return [term for term, _rows, _meta in results], sorted(manifest.get("terms", {})), scraped
+
+    def test_speculative_terms_keep_the_sequential_stopping_rule(self):
+        sequential_terms, sequential_manifest, sequential_scraped = self.scrape_forward(1)
+        self.assertEqual(sequential_terms, ["202501", "202502", "202503", "202601", "202602"])
+        self.assertEqual(sequential_scraped[-2:], ["202603", "202701"])
+        for term_workers in (2, 4):
+            with self.subTest(term_workers=term_workers):
+                terms, manifest, scraped = self.scrape_forward(term_workers)
+                self.assertEqual(terms, sequential_terms)
+                self.assertEqual(manifest, sequential_manifest)
+                self.assertLessEqual(len(scraped), len(sequential_scraped) + term_workers - 1)
+
+    def test_stopping_skips_the_rest_of_running_speculative_terms(self):
+        subjects = [f"S{n}" for n in range(40)]
+        fetched = {}
+
+        def fake_scrape(term, *, stop, **_kwargs):
+            fetched[term] = 0
+            for _subject in subjects:
+                if term == "202501" or stop.wait(0.05):
+                    break
+                fetched[term] += 1
+            meta = {"term": term, "subjects": subjects, "live_subjects": subjects, "had_live_subjects": True}
+            return [], meta
+
+        original = fsched.scrape_term_schedule
+        try:
+            fsched.scrape_term_schedule = fake_scrape
+            results, _manifest = fsched.scrape_terms_forward(
+                "202501",
+                timeout=1,
+                delay_s=0,
+                max_subjects=None,
+                subject_manifest={},
+                stop_after_empty_terms=1,
+                term_workers=3,
+            )
+        finally:
+            fsched.scrape_term_schedule = original
+        self.assertEqual(results, [])
+        self.assertEqual(fetched["202501"], 0)
+        self.assertTrue(set(fetched) <= {"202501", "202502", "202503"}, fetched)
+        self.assertTrue(all(count < len(subjects) for count in fetched.values()), fetched)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,9 @@ import re
 import os
 import subprocess
 
+import catalog_store
+import jsonl_codec
+
 COURSES_DIR = 'courses'
 
 """
@@ -72,17 +75,7 @@ def update_json_with_credits(json_path, credits_map):
     try:
         data = []
         if json_path.endswith('.jsonl'):
-            with open(json_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if isinstance(rec, dict):
-                        data.append(rec)
+            data = [rec for rec in jsonl_codec.iter_jsonl(json_path, skip_invalid=True) if isinstance(rec, dict)]
         else:
             with open(json_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
@@ -98,9 +91,7 @@ def update_json_with_credits(json_path, credits_map):
                 updated_count += 1
 
         if json_path.endswith('.jsonl'):
-            with open(json_path, 'w', encoding='utf-8') as file:
-                for rec in data:
-                    file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            jsonl_codec.write_jsonl(json_path, data)
         else:
             with open(json_path, 'w', encoding='utf-8') as file:
                 json.dump(data, file, indent=2, ensure_ascii=False)
@@ -110,18 +101,54 @@ def update_json_with_credits(json_path, credits_map):
     except Exception as e:
         print(f"Error updating {json_path}: {e}")
 
+def update_stored_terms(credits_map, program_files):
+    """Apply the credits to every term kept in the catalog store.
+
+    The store is the source of truth for these terms, so the edits go into
+    it and only the ``<MAJOR>.jsonl`` views whose rows changed are
+    recompiled.  Returns ``(stored_terms, failed_terms)``.
+    """
+
+    updates = {
+        course_code: {'Basic_Science': credits['Basic_Science'], 'Engineering': credits['Engineering']}
+        for course_code, credits in credits_map.items()
+    }
+    majors = {os.path.splitext(program_file)[0] for program_file in program_files.values()}
+    stored_terms = []
+    failed_terms = []
+    changed_catalogs = {}
+    changed_majors = {}
+    for term, catalog in catalog_store.iter_term_catalogs(COURSES_DIR):
+        stored_terms.append(term)
+        missing = sorted(majors - set(catalog.majors))
+        for major in missing:
+            print(f"Missing {major} in the catalog store for {term}")
+        if missing:
+            failed_terms.append(term)
+        changed = catalog.apply_course_fields(updates)
+        if changed:
+            changed_catalogs[term] = catalog
+            changed_majors[term] = changed
+        print(f"Updated {term} in the catalog store: BS and Eng credits changed in {len(changed)} programs")
+    if changed_catalogs:
+        catalog_store.write_term_catalogs(COURSES_DIR, changed_catalogs)
+        for term, catalog in changed_catalogs.items():
+            catalog_store.compile_views(COURSES_DIR, term, catalog, changed_majors[term])
+    return stored_terms, failed_terms
+
 def update_all_program_files(credits_map, program_files):
     """Update all program JSON files with Basic Science and Engineering credits.
 
     The courses directory may contain subfolders for each academic term
-    (e.g. ``202401``). This function walks through each term folder as well as
-    the root and reports any files that could not be updated.
+    (e.g. ``202401``). Terms in the catalog store are updated there (see
+    :func:`update_stored_terms`); this function walks through every other term
+    folder as well as the root and reports any files that could not be updated.
     """
 
-    term_dirs = ['.']
-    term_dirs += [d for d in os.listdir(COURSES_DIR) if re.match(r'\d{6}$', d)]
+    stored_terms, failed_terms = update_stored_terms(credits_map, program_files)
 
-    failed_terms = []
+    term_dirs = ['.']
+    term_dirs += [d for d in os.listdir(COURSES_DIR) if re.match(r'\d{6}$', d) and d not in stored_terms]
 
     for term in term_dirs:
         term_path = os.path.join(COURSES_DIR, term) if term != '.' else COURSES_DIR
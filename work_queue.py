@@ -0,0 +1,212 @@
+"""Priority thread pool whose tasks may wait on tasks they submit.
+
+``fetch_courses.py`` schedules every (term, program) crawl and every follow-up
+``p_list_courses`` fetch on one pool.  A crawl task waits for the list fetches
+it submitted; to keep that from deadlocking a fixed-size pool, a waiting task
+helps by running queued work that is more urgent than a given bound instead of
+blocking its thread.
+
+:class:`SingleFlight` collapses repeated work within one run: the same
+``p_list_courses`` page linked from both the per-anchor and the fallback
+scan of a degree page is fetched and parsed once.
+
+:class:`ParsePool` moves the CPU-bound HTML parsing off the network threads
+into worker processes, so parsing scales with cores instead of serializing on
+the GIL.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import heapq
+import itertools
+import multiprocessing
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class PriorityWorkPool:
+    """Run callables on ``workers`` threads, lowest priority tuple first."""
+
+    def __init__(self, workers: int):
+        self._heap: List[Tuple[Any, int, concurrent.futures.Future, Callable[..., Any], tuple, dict]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"work-{i}", daemon=True)
+            for i in range(max(1, int(workers)))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> "PriorityWorkPool":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self.shutdown(cancel_pending=exc_type is not None)
+
+    def submit(self, priority: Any, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed work pool")
+            heapq.heappush(self._heap, (priority, next(self._seq), future, fn, args, kwargs))
+            self._cond.notify()
+        return future
+
+    def wait(self, futures: Iterable[concurrent.futures.Future], *, help_below: Optional[Any] = None) -> None:
+        """Block until ``futures`` are done, running queued work meanwhile.
+
+        Only tasks whose priority is lower than ``help_below`` are taken, so a
+        waiting crawl finishes its own follow-up fetches rather than starting
+        another crawl (which would wait in turn).  ``None`` helps with nothing.
+        """
+
+        pending = [future for future in futures if not future.done()]
+        while pending:
+            task = self._pop_if_below(help_below) if help_below is not None else None
+            if task is not None:
+                self._run(task)
+            else:
+                concurrent.futures.wait(pending, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED)
+            pending = [future for future in pending if not future.done()]
+
+    def shutdown(self, *, cancel_pending: bool = False) -> None:
+        """Stop accepting work and join the threads after the queue drains."""
+
+        with self._cond:
+            self._closed = True
+            if cancel_pending:
+                for task in self._heap:
+                    task[2].cancel()
+                self._heap.clear()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def _pop_if_below(self, bound: Any):
+        with self._cond:
+            if self._heap and self._heap[0][0] < bound:
+                return heapq.heappop(self._heap)
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                task = heapq.heappop(self._heap)
+            self._run(task)
+
+    @staticmethod
+    def _run(task) -> None:
+        _priority, _seq, future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+
+class SingleFlight:
+    """Run-scoped memo where concurrent callers for one key share one call.
+
+    The first caller for a key runs ``fn``; callers arriving while it runs
+    block on the same future instead of repeating the work, and later callers
+    get the stored result.  Failures are not cached: waiters see the
+    exception, and the next caller for that key tries again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, concurrent.futures.Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._futures[key] = future
+        if not owner:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            with self._lock:
+                self._futures.pop(key, None)
+            future.set_exception(exc)
+            raise
+        future.set_result(result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._futures.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+
+class ParsePool:
+    """Parse fetched bodies in worker processes instead of network threads.
+
+    A network thread hands each body to :meth:`parse` and waits for the plain
+    result.  The wait releases the GIL, so the other network threads keep
+    fetching while the parsers run on other cores.  At most ``max_pending``
+    bodies (default: twice the process count) are queued or being parsed at
+    once; further callers block until a slot frees, so fetchers cannot outrun
+    the parsers and pile HTML up in memory.  With ``processes=0`` every parse
+    runs inline in the calling thread.
+
+    Parse functions, their arguments and results must be picklable
+    (module-level functions over plain data).  Workers are spawned rather
+    than forked because the pool is fed from already-running threads.
+
+    With a ``cache`` (a :class:`parse_cache.ParseCache`), parsers marked with
+    :func:`parse_cache.cached_parser` are answered from it when the same body
+    was parsed before, without reaching a worker at all.
+    """
+
+    def __init__(self, processes: int = 0, *, max_pending: Optional[int] = None, cache: Any = None):
+        self.processes = max(0, int(processes or 0))
+        self.cache = cache
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        if self.processes:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self._slots = threading.BoundedSemaphore(max(1, int(max_pending or 2 * self.processes)))
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def parse(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Return ``fn(*args, **kwargs)``, computed in a worker process when there are any."""
+
+        if self.cache is not None:
+            return self.cache.parse(fn, *args, run=self._run, **kwargs)
+        return self._run(fn, *args, **kwargs)
+
+    def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._executor is None or self._slots is None:
+            return fn(*args, **kwargs)
+        with self._slots:
+            return self._executor.submit(fn, *args, **kwargs).result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None